@@ -4,6 +4,9 @@ import argparse
 from dataclasses import dataclass
 from pathlib import Path
 
+DEFAULT_CACHE_DIR = Path("out/cache")
+DEFAULT_CHECKPOINT_INTERVAL_S = 300.0
+
 
 # ------------------------------------------------------------------------------
 @dataclass(frozen=True)
@@ -14,11 +17,17 @@ class ExperimentArgs:
         out_dir: Output directory where all artifacts will be written.
         seed: Deterministic seed for randomness.
         verbose: Enable verbose logging.
+        cache_dir: Directory for result caches shared between runs (None disables caching).
+        resume: Continue long computations from checkpoints in the output directory.
+        checkpoint_interval: Wall-clock seconds between checkpoints of long computations.
     """
 
     out_dir: Path
     seed: int
     verbose: bool
+    cache_dir: Path | None = DEFAULT_CACHE_DIR
+    resume: bool = False
+    checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL_S
 
 
 # ------------------------------------------------------------------------------
@@ -64,5 +73,38 @@ def parse_experiment_args(
         action="store_true",
         help="Enable verbose logging.",
     )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for result caches shared between runs (default: {DEFAULT_CACHE_DIR}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Neither read nor write result caches.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume long computations from the checkpoints of a previous run in --out.",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        dest="checkpoint_interval",
+        type=float,
+        default=DEFAULT_CHECKPOINT_INTERVAL_S,
+        help="Seconds between checkpoints of long computations "
+        f"(default: {DEFAULT_CHECKPOINT_INTERVAL_S:g}).",
+    )
     ns = parser.parse_args(argv)
-    return ExperimentArgs(out_dir=ns.out_dir, seed=ns.seed, verbose=ns.verbose)
+    return ExperimentArgs(
+        out_dir=ns.out_dir,
+        seed=ns.seed,
+        verbose=ns.verbose,
+        cache_dir=None if ns.no_cache else ns.cache_dir,
+        resume=ns.resume,
+        checkpoint_interval=ns.checkpoint_interval,
+    )
@@ -30,7 +30,10 @@ from mathxlab.exp.cli import parse_experiment_args
 from mathxlab.exp.io import prepare_out_dir, save_figure, write_json
 from mathxlab.exp.logging import LoggingConfig, get_logger, setup_logging
 from mathxlab.exp.random import set_global_seed
-from mathxlab.num.series import taylor_sin
+from mathxlab.num.error_volume import ErrorVolume
+from mathxlab.num.series import SeriesWorkspace, horner, taylor_sin_partial_sums
+from mathxlab.num.series_eval import ErrorStats, taylor_sin_error_stats
+from mathxlab.num.taylor_coeffs import CoefficientCache, taylor_coefficients
 from mathxlab.plots.helpers import finalize_figure
 
 # ------------------------------------------------------------------------------
@@ -48,6 +51,11 @@ class Params:
         num_points: Number of sample points in the evaluation grid.
         degrees: Taylor polynomial degrees to plot.
         centers: Taylor expansion centers :math:`x_0` to plot.
+        stats_points: Grid size for the streamed error statistics (never held in memory).
+        volume_centers: Number of centers in the dense error volume (evenly spread over the domain).
+        volume_max_degree: Degrees 0..volume_max_degree are stored in the volume.
+        volume_points: Grid points per (center, degree) row of the volume.
+        heatmap_degree: Degree shown in the (center x x) heatmap.
     """
 
     x_min: float
@@ -55,6 +63,11 @@ class Params:
     num_points: int
     degrees: tuple[int, ...]
     centers: tuple[float, ...]
+    stats_points: int
+    volume_centers: int
+    volume_max_degree: int
+    volume_points: int
+    heatmap_degree: int
 
 
 # ------------------------------------------------------------------------------
@@ -72,17 +85,37 @@ def _linspace(params: Params) -> np.ndarray:
 
 
 # ------------------------------------------------------------------------------
-def _write_report(*, report_path: Path, params: Params, seed: int) -> None:
+def _write_report(
+    *,
+    report_path: Path,
+    params: Params,
+    seed: int,
+    stats: dict[float, ErrorStats],
+    full_max_err: dict[float, np.ndarray],
+) -> None:
     """Write a short Markdown report.
 
     Args:
         report_path: Path to the report file.
         params: Experiment parameters.
         seed: Random seed used for this run.
+        stats: Streamed error statistics per center.
+        full_max_err: Max |error| of the full Taylor expansion of sin(x) per center and degree.
     """
 
     degrees_str = ", ".join(str(d) for d in params.degrees)
     centers_str = ", ".join(f"{c:g}" for c in params.centers)
+    stats_rows = "\n".join(
+        f"| {c:g} | {d} | {mx:.3e} | {x_at:.4f} | {mean:.3e} |"
+        for c, st in stats.items()
+        for d, mx, x_at, mean in zip(st.degrees, st.max_abs, st.argmax_x, st.mean_abs, strict=True)
+    )
+    full_rows = "\n".join(
+        f"| {c:g} | " + " | ".join(f"{e:.3e}" for e in errs) + " |"
+        for c, errs in full_max_err.items()
+    )
+    full_header = "| center | " + " | ".join(f"degree {d}" for d in params.degrees) + " |"
+    full_align = "|---:|" + "---:|" * len(params.degrees)
 
     report_md = f"""    # E001 — Taylor error landscapes for sin(x)
 
@@ -105,6 +138,28 @@ make run EXP=e001_taylor_error_landscapes
 
 - `figures/fig_01_sin_and_taylor_center_*.png` — overlay of sin(x) and Taylor polynomials for one center
 - `figures/fig_02_error_landscape_center_*.png` — absolute error curves for each center, overlaid by degree
+- `figures/fig_03_error_histogram_center_*.png` — distribution of log10 |error| on the large grid
+- `figures/fig_04_max_error_heatmap.png` — log10 max |error| over (center, degree) from the error volume
+- `figures/fig_05_error_heatmap_degree_*.png` — log10 |error| over (center, x) for one degree
+- `volume/error_volume.npy` — float32 (center, degree, x) error volume ({params.volume_centers} x {params.volume_max_degree + 1} x {params.volume_points}), axes in `error_volume.json`
+
+## Error statistics on a {params.stats_points}-point grid
+
+Streamed in blocks on a thread pool; the grid and error arrays are never materialized.
+
+| center | degree | max abs error | at x | mean abs error |
+|---:|---:|---:|---:|---:|
+{stats_rows}
+
+## Full Taylor expansion of sin(x) about x0 (max abs error on the plot grid)
+
+The polynomials above expand sin(x - x0). For comparison, these expand sin(x) itself about x0.
+Coefficients come from the symbolic generator (cached on disk between runs) and are
+evaluated with Horner's scheme.
+
+{full_header}
+{full_align}
+{full_rows}
 
 ## Notes
 
@@ -117,13 +172,14 @@ make run EXP=e001_taylor_error_landscapes
 
 # ------------------------------------------------------------------------------
 def _plot_overlay(
-    *, x: np.ndarray, y_true: np.ndarray, params: Params, center: float
+    *, x: np.ndarray, y_true: np.ndarray, y_hat: np.ndarray, params: Params, center: float
 ) -> fig.Figure:
     """Plot sin(x) together with Taylor approximations for one center.
 
     Args:
         x: Evaluation grid.
         y_true: True values sin(x).
+        y_hat: Taylor polynomials, one row per entry of params.degrees.
         params: Experiment parameters.
         center: Expansion center x0.
 
@@ -134,9 +190,8 @@ def _plot_overlay(
     fig_obj, ax = plt.subplots()
 
     ax.plot(x, y_true, label="sin(x)")
-    for d in params.degrees:
-        y_hat = taylor_sin(x=x, x0=center, degree=d)
-        ax.plot(x, y_hat, label=f"T_{d} around x0={center:g}")
+    for d, y_d in zip(params.degrees, y_hat, strict=True):
+        ax.plot(x, y_d, label=f"T_{d} around x0={center:g}")
 
     ax.set_title(f"sin(x) and Taylor polynomials around x0={center:g}")
     ax.set_xlabel("x")
@@ -148,13 +203,14 @@ def _plot_overlay(
 
 # ------------------------------------------------------------------------------
 def _plot_error_landscape(
-    *, x: np.ndarray, y_true: np.ndarray, params: Params, center: float
+    *, x: np.ndarray, y_true: np.ndarray, y_hat: np.ndarray, params: Params, center: float
 ) -> fig.Figure:
     """Plot absolute error curves for a fixed center and multiple degrees.
 
     Args:
         x: Evaluation grid.
         y_true: True values sin(x).
+        y_hat: Taylor polynomials, one row per entry of params.degrees.
         params: Experiment parameters.
         center: Expansion center x0.
 
@@ -164,10 +220,9 @@ def _plot_error_landscape(
 
     fig_obj, ax = plt.subplots()
 
-    for d in params.degrees:
-        y_hat = taylor_sin(x=x, x0=center, degree=d)
-        err = np.abs(y_true - y_hat)
-        ax.plot(x, err, label=f"degree={d}")
+    err = np.abs(y_true - y_hat)
+    for d, err_d in zip(params.degrees, err, strict=True):
+        ax.plot(x, err_d, label=f"degree={d}")
 
     ax.set_title(f"Absolute error |sin(x) - T_n(x)| around x0={center:g}")
     ax.set_xlabel("x")
@@ -178,6 +233,85 @@ def _plot_error_landscape(
     return fig_obj
 
 
+# ------------------------------------------------------------------------------
+def _plot_error_histogram(*, stats: ErrorStats, center: float) -> fig.Figure:
+    """Plot the streamed log10 |error| histograms for one center, one line per degree.
+
+    Args:
+        stats: Streamed error statistics.
+        center: Expansion center x0.
+
+    Returns:
+        A Matplotlib figure.
+    """
+
+    fig_obj, ax = plt.subplots()
+
+    for d, hist in zip(stats.degrees, stats.histograms, strict=True):
+        frac = hist.counts / max(hist.total, 1)
+        ax.stairs(frac, hist.edges, label=f"degree={d}")
+
+    ax.set_title(f"Distribution of log10 |sin(x) - T_n(x)| around x0={center:g}")
+    ax.set_xlabel("log10 absolute error")
+    ax.set_ylabel("fraction of grid points")
+    ax.legend(loc="best")
+    finalize_figure(fig_obj)
+    return fig_obj
+
+
+# ------------------------------------------------------------------------------
+def _plot_max_error_heatmap(*, volume: ErrorVolume) -> fig.Figure:
+    """Plot log10 of the max |error| over x for every (center, degree) of the volume.
+
+    Args:
+        volume: Dense error volume.
+
+    Returns:
+        A Matplotlib figure.
+    """
+
+    fig_obj, ax = plt.subplots()
+
+    with np.errstate(divide="ignore"):
+        z = np.log10(volume.reduce_x("max"))
+    extent = (volume.degrees[0], volume.degrees[-1], volume.centers[0], volume.centers[-1])
+    im = ax.imshow(z, origin="lower", aspect="auto", extent=extent, cmap="viridis")
+    fig_obj.colorbar(im, ax=ax, label="log10 max |error|")
+
+    ax.set_title("Worst-case error over the domain by center and degree")
+    ax.set_xlabel("degree")
+    ax.set_ylabel("center x0")
+    finalize_figure(fig_obj)
+    return fig_obj
+
+
+# ------------------------------------------------------------------------------
+def _plot_degree_heatmap(*, volume: ErrorVolume, degree: int) -> fig.Figure:
+    """Plot log10 |error| over (center, x) for one degree of the volume.
+
+    Args:
+        volume: Dense error volume.
+        degree: Degree to show.
+
+    Returns:
+        A Matplotlib figure.
+    """
+
+    fig_obj, ax = plt.subplots()
+
+    with np.errstate(divide="ignore"):
+        z = np.log10(volume.degree_slice(degree))
+    extent = (volume.x[0], volume.x[-1], volume.centers[0], volume.centers[-1])
+    im = ax.imshow(z, origin="lower", aspect="auto", extent=extent, cmap="viridis")
+    fig_obj.colorbar(im, ax=ax, label="log10 |error|")
+
+    ax.set_title(f"log10 |sin(x) - T_{degree}(x)| by center")
+    ax.set_xlabel("x")
+    ax.set_ylabel("center x0")
+    finalize_figure(fig_obj)
+    return fig_obj
+
+
 # ------------------------------------------------------------------------------
 def main() -> int:
     """Run the experiment.
@@ -203,6 +337,11 @@ def main() -> int:
         num_points=4000,
         degrees=(1, 3, 5, 9, 15),
         centers=(0.0, 1.0, 2.0),
+        stats_points=10_000_000,
+        volume_centers=256,
+        volume_max_degree=60,
+        volume_points=1024,
+        heatmap_degree=15,
     )
 
     out_paths = prepare_out_dir(out_dir=args.out_dir)
@@ -211,10 +350,16 @@ def main() -> int:
     x = _linspace(params)
     y_true = np.sin(x)
 
+    # All degrees for one center come from a single pass over the series.
+    ws = SeriesWorkspace.allocate()
+    y_hat = {c: taylor_sin_partial_sums(x, c, params.degrees, workspace=ws) for c in params.centers}
+
     # 1) Overlay plot for the first center (a readable “anchor” figure).
     overlay_center = params.centers[0]
     logger.info("Generating overlay plot for center x0=%g", overlay_center)
-    fig_obj = _plot_overlay(x=x, y_true=y_true, params=params, center=overlay_center)
+    fig_obj = _plot_overlay(
+        x=x, y_true=y_true, y_hat=y_hat[overlay_center], params=params, center=overlay_center
+    )
     save_figure(
         out_dir=out_paths.figures_dir,
         name=f"fig_01_sin_and_taylor_center_{overlay_center:g}",
@@ -224,15 +369,76 @@ def main() -> int:
     # 2) Error landscapes for all centers.
     for center in params.centers:
         logger.info("Generating error landscape for center x0=%g", center)
-        fig_obj = _plot_error_landscape(x=x, y_true=y_true, params=params, center=center)
+        fig_obj = _plot_error_landscape(
+            x=x, y_true=y_true, y_hat=y_hat[center], params=params, center=center
+        )
         save_figure(
             out_dir=out_paths.figures_dir,
             name=f"fig_02_error_landscape_center_{center:g}",
             fig=fig_obj,
         )
 
+    # 3) Streamed statistics on a much finer grid.
+    stats: dict[float, ErrorStats] = {}
+    for center in params.centers:
+        logger.info("Streaming error statistics for center x0=%g", center)
+        stats[center] = taylor_sin_error_stats(
+            params.x_min, params.x_max, params.stats_points, center, params.degrees
+        )
+    fig_obj = _plot_error_histogram(stats=stats[overlay_center], center=overlay_center)
+    save_figure(
+        out_dir=out_paths.figures_dir,
+        name=f"fig_03_error_histogram_center_{overlay_center:g}",
+        fig=fig_obj,
+    )
+
+    # 4) Dense (center x degree x x) error volume on disk, read back in tiles for heatmaps.
+    logger.info(
+        "Computing error volume: %d centers x %d degrees x %d points",
+        params.volume_centers,
+        params.volume_max_degree + 1,
+        params.volume_points,
+    )
+    volume = ErrorVolume.compute(
+        out_paths.root / "volume" / "error_volume.npy",
+        centers=np.linspace(params.x_min, params.x_max, params.volume_centers).tolist(),
+        degrees=range(params.volume_max_degree + 1),
+        x_min=params.x_min,
+        x_max=params.x_max,
+        num_points=params.volume_points,
+    )
+    fig_obj = _plot_max_error_heatmap(volume=volume)
+    save_figure(out_dir=out_paths.figures_dir, name="fig_04_max_error_heatmap", fig=fig_obj)
+    fig_obj = _plot_degree_heatmap(volume=volume, degree=params.heatmap_degree)
+    save_figure(
+        out_dir=out_paths.figures_dir,
+        name=f"fig_05_error_heatmap_degree_{params.heatmap_degree}",
+        fig=fig_obj,
+    )
+
+    # 5) Full Taylor expansion of sin(x) about each center from cached symbolic coefficients.
+    cache = None if args.cache_dir is None else CoefficientCache(args.cache_dir / "taylor")
+    full_max_err: dict[float, np.ndarray] = {}
+    y_full = np.empty_like(x)
+    for center in params.centers:
+        coeffs = taylor_coefficients("sin(x)", center, max(params.degrees), cache=cache)
+        full_max_err[center] = np.array(
+            [
+                np.max(
+                    np.abs(horner(coeffs[: d + 1], x, center, out=y_full, workspace=ws) - y_true)
+                )
+                for d in params.degrees
+            ]
+        )
+
     write_json(out_paths.params_path, data=asdict(params))
-    _write_report(report_path=out_paths.report_path, params=params, seed=args.seed)
+    _write_report(
+        report_path=out_paths.report_path,
+        params=params,
+        seed=args.seed,
+        stats=stats,
+        full_max_err=full_max_err,
+    )
 
     logger.info("Experiment E001 completed successfully. Artifacts saved to: %s", args.out_dir)
 
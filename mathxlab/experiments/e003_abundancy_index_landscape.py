@@ -1,12 +1,16 @@
 """E003 — Abundancy index landscape.
 
-This experiment computes the sum-of-divisors function σ(n) for all 1 ≤ n ≤ N using a
-divisor-sum sieve, then visualizes the abundancy index:
+This experiment computes the sum-of-divisors function σ(n) for all 1 ≤ n ≤ N using the
+shared multiplicative-function sieve (:mod:`mathxlab.num.multiplicative`), then visualizes the abundancy index:
 
     I(n) = σ(n) / n.
 
 Perfect numbers satisfy I(n) = 2.
 
+σ(n) is streamed in blocks and each block is folded into an :class:`AbundancyAccumulator`
+(fixed-bin histogram, perfect-number hits, decimated scatter samples), so memory stays
+constant in N.
+
 Usage (repository convention):
     make run EXP=e003
 
@@ -20,7 +24,8 @@ Artifacts:
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import math
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 import matplotlib.figure as fig
@@ -31,6 +36,8 @@ from mathxlab.exp.cli import parse_experiment_args
 from mathxlab.exp.io import prepare_out_dir, save_figure, write_json
 from mathxlab.exp.logging import LoggingConfig, get_logger, setup_logging
 from mathxlab.exp.random import set_global_seed
+from mathxlab.num.multiplicative import iter_sigma_blocks
+from mathxlab.num.streaming import StreamingHistogram
 from mathxlab.plots.helpers import finalize_figure
 
 # ------------------------------------------------------------------------------
@@ -47,32 +54,93 @@ class Params:
         stride_scatter: Downsampling stride for scatter plots.
         bins: Histogram bin count.
         near_band: Band width for "near 2" plot: show points where |I(n)-2| < near_band.
+        block_size: Integers per streamed σ block.
+        max_scatter_points: Cap on scatter samples; the stride grows with N to respect it.
     """
 
     n_max: int
     stride_scatter: int
     bins: int
     near_band: float
+    block_size: int
+    max_scatter_points: int
 
 
 # ------------------------------------------------------------------------------
-def sigma_sieve(n_max: int) -> np.ndarray:
-    """Compute σ(0..N) via a divisor-sum sieve.
+def abundancy_upper_bound(n_max: int) -> float:
+    """Return an upper bound for I(n) = σ(n)/n over 1 ≤ n ≤ N.
+
+    Uses Robin's unconditional inequality σ(n)/n < e^gamma ln ln n + 0.6483 / ln ln n (n ≥ 3),
+    whose right-hand side is increasing for n ≥ 7; for n ≤ 6, I(n) ≤ 2.
 
     Args:
         n_max: Upper bound N (inclusive).
 
     Returns:
-        NumPy array sigma of length N+1 with sigma[n] = σ(n).
+        A value strictly greater than every I(n) with n ≤ N.
+    """
+    lln = math.log(math.log(max(n_max, 7)))
+    return max(2.0, math.exp(np.euler_gamma) * lln + 0.6483 / lln)
+
+
+# ------------------------------------------------------------------------------
+@dataclass(slots=True)
+class AbundancyAccumulator:
+    """Streaming reduction of σ(n) blocks into the data behind the E003 figures.
+
+    Args:
+        hist: Histogram of I(n) with fixed bins.
+        stride: Keep every stride-th n (n ≡ 1 mod stride) for the scatter plot, and every
+            stride-th point of the near-2 band.
+        near_band: Band width for the near-2 sample: |I(n) - 2| < near_band.
     """
-    if n_max < 1:
-        raise ValueError("n_max must be >= 1")
 
-    sigma = np.zeros(n_max + 1, dtype=np.int64)
-    # Vectorized slicing: sigma[d::d] += d
-    for d in range(1, n_max + 1):
-        sigma[d::d] += d
-    return sigma
+    hist: StreamingHistogram
+    stride: int
+    near_band: float
+    perfect: list[int] = field(default_factory=list)
+    i_max: float = 0.0
+    _scatter: list[tuple[np.ndarray, np.ndarray]] = field(default_factory=list)
+    _near: list[tuple[np.ndarray, np.ndarray]] = field(default_factory=list)
+    _near_seen: int = 0
+
+    def update(self, start: int, sigma: np.ndarray) -> None:
+        """Fold one block with sigma[i] = σ(start + i) into the accumulator.
+
+        Args:
+            start: First n of the block.
+            sigma: σ values for the block.
+        """
+        n = np.arange(start, start + sigma.size, dtype=np.int64)
+        i_vals = sigma / n.astype(np.float64)
+        self.hist.update(i_vals)
+        self.i_max = max(self.i_max, float(i_vals.max(initial=0.0)))
+
+        # Classification uses exact integers, not the float ratio.
+        self.perfect.extend(n[sigma == 2 * n].tolist())
+
+        first = (1 - start) % self.stride
+        self._scatter.append((n[first :: self.stride], i_vals[first :: self.stride]))
+
+        near = np.flatnonzero(np.abs(i_vals - 2.0) < self.near_band)
+        first = (-self._near_seen) % self.stride
+        self._near.append((n[near[first :: self.stride]], i_vals[near[first :: self.stride]]))
+        self._near_seen += near.size
+
+    @staticmethod
+    def _concat(parts: list[tuple[np.ndarray, np.ndarray]]) -> tuple[np.ndarray, np.ndarray]:
+        """Concatenate (n, I(n)) sample parts."""
+        if not parts:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+        return np.concatenate([a for a, _ in parts]), np.concatenate([b for _, b in parts])
+
+    def scatter_sample(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the decimated (n, I(n)) scatter sample."""
+        return self._concat(self._scatter)
+
+    def near_sample(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the decimated (n, I(n)) sample of the near-2 band."""
+        return self._concat(self._near)
 
 
 # ------------------------------------------------------------------------------
@@ -120,18 +188,21 @@ make run EXP=e003
 
 
 # ------------------------------------------------------------------------------
-def _plot_hist(*, values: np.ndarray, bins: int) -> fig.Figure:
-    """Plot a histogram.
+def _plot_hist(*, hist: StreamingHistogram) -> fig.Figure:
+    """Plot a precomputed histogram.
+
+    Empty bins above the largest observed value are trimmed so the axis matches the data.
 
     Args:
-        values: Values to histogram.
-        bins: Number of bins.
+        hist: Accumulated histogram.
 
     Returns:
         Matplotlib figure.
     """
+    nonzero = np.flatnonzero(hist.counts)
+    last = int(nonzero[-1]) + 1 if nonzero.size else hist.counts.size
     fig_obj, ax = plt.subplots()
-    ax.hist(values, bins=bins)
+    ax.stairs(hist.counts[:last], hist.edges[: last + 1], fill=True)
     ax.set_title("Histogram of abundancy index I(n) = σ(n)/n")
     ax.set_xlabel("I(n)")
     ax.set_ylabel("count")
@@ -178,36 +249,39 @@ def main() -> int:
         stride_scatter=10,
         bins=250,
         near_band=0.02,
+        block_size=1 << 20,
+        max_scatter_points=200_000,
     )
 
     out_paths = prepare_out_dir(out_dir=args.out_dir)
 
-    logger.info("Computing sigma sieve up to N=%d", params.n_max)
-    sigma = sigma_sieve(params.n_max)
+    stride = max(params.stride_scatter, -(-params.n_max // params.max_scatter_points))
+    acc = AbundancyAccumulator(
+        hist=StreamingHistogram.uniform(1.0, abundancy_upper_bound(params.n_max), params.bins),
+        stride=stride,
+        near_band=params.near_band,
+    )
 
-    n = np.arange(1, params.n_max + 1, dtype=np.int64)
-    i_vals = sigma[1:] / n.astype(np.float64)
+    logger.info("Streaming sigma sieve up to N=%d (scatter stride %d)", params.n_max, stride)
+    for start, sigma in iter_sigma_blocks(1, params.n_max + 1, block_size=params.block_size):
+        acc.update(start, sigma)
+        logger.debug("Processed n < %d", start + sigma.size)
 
     # Perfect numbers: σ(n) == 2n
-    perfect_mask = sigma[1:] == (2 * n)
-    count_perfect = int(perfect_mask.sum())
+    count_perfect = len(acc.perfect)
     logger.info("Perfect numbers found up to N=%d: %d", params.n_max, count_perfect)
 
-    fig1 = _plot_hist(values=i_vals, bins=params.bins)
+    fig1 = _plot_hist(hist=acc.hist)
     save_figure(out_dir=out_paths.figures_dir, name="fig_01_hist_abundancy", fig=fig1)
 
     # Scatter downsampled
-    n_s = n[:: params.stride_scatter]
-    i_s = i_vals[:: params.stride_scatter]
+    n_s, i_s = acc.scatter_sample()
     fig2 = _plot_scatter(n=n_s, i_vals=i_s)
     save_figure(out_dir=out_paths.figures_dir, name="fig_02_scatter_abundancy", fig=fig2)
 
-    # Near-2 band plot (downsample again for readability)
-    near = np.abs(i_vals - 2.0) < params.near_band
-    fig3 = _plot_scatter(
-        n=n[near][:: max(1, params.stride_scatter)],
-        i_vals=i_vals[near][:: max(1, params.stride_scatter)],
-    )
+    # Near-2 band plot (downsampled again for readability)
+    n_near, i_near = acc.near_sample()
+    fig3 = _plot_scatter(n=n_near, i_vals=i_near)
     fig3.axes[0].set_title(f"Near misses: |I(n) - 2| < {params.near_band:g}")
     save_figure(out_dir=out_paths.figures_dir, name="fig_03_near_2", fig=fig3)
 
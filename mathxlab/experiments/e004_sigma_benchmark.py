@@ -1,9 +1,13 @@
 """E004 — Benchmark σ(n) computation: sieve vs factorization.
 
-This experiment benchmarks two equivalent strategies to compute the sum-of-divisors function σ(n):
+This experiment benchmarks equivalent strategies to compute the sum-of-divisors function σ(n):
 
 A) Bulk divisor-sum sieve (compute σ(1..N) in one pass).
 B) Per-number factorization (compute σ(n) from prime exponents).
+C) Batched factorization (factor 1..N as one array, then reduce σ over the CSR rows).
+
+Single large n (up to 10^30) are out of reach for all three. They are timed separately with the
+Miller–Rabin / Pollard-rho / ECM engine in :mod:`mathxlab.num.factorint`.
 
 The goal is not micro-optimizations, but a clear and reproducible comparison.
 
@@ -33,6 +37,10 @@ from mathxlab.exp.cli import parse_experiment_args
 from mathxlab.exp.io import prepare_out_dir, save_figure, write_json
 from mathxlab.exp.logging import LoggingConfig, get_logger, setup_logging
 from mathxlab.exp.random import set_global_seed
+from mathxlab.num.factorint import clear_cache, sigma
+from mathxlab.num.factorization import factorize_batch
+from mathxlab.num.multiplicative import sigma_sieve
+from mathxlab.num.primes import primes_up_to
 from mathxlab.plots.helpers import finalize_figure
 
 # ------------------------------------------------------------------------------
@@ -48,49 +56,13 @@ class Params:
         n_values: N values to benchmark (inclusive upper bound for 1..N).
         trials: Number of trials per method (median is reported).
         max_n_factor: Maximum N allowed for the factorization method (safety).
+        large_n: Single large integers whose σ(n) is timed with the rho/ECM engine.
     """
 
     n_values: tuple[int, ...]
     trials: int
     max_n_factor: int
-
-
-# ------------------------------------------------------------------------------
-def sigma_sieve(n_max: int) -> np.ndarray:
-    """Compute σ(0..N) via a divisor-sum sieve.
-
-    Args:
-        n_max: Upper bound N (inclusive).
-
-    Returns:
-        sigma array of length N+1.
-    """
-    sigma = np.zeros(n_max + 1, dtype=np.int64)
-    for d in range(1, n_max + 1):
-        sigma[d::d] += d
-    return sigma
-
-
-# ------------------------------------------------------------------------------
-def primes_up_to(n: int) -> list[int]:
-    """Return a list of primes <= n using a simple sieve.
-
-    Args:
-        n: Upper bound.
-
-    Returns:
-        List of primes in ascending order.
-    """
-    if n < 2:
-        return []
-    sieve = bytearray(b"\x01") * (n + 1)
-    sieve[0:2] = b"\x00\x00"
-    for p in range(2, isqrt(n) + 1):
-        if sieve[p]:
-            step = p
-            start = p * p
-            sieve[start : n + 1 : step] = b"\x00" * ((n - start) // step + 1)
-    return [i for i in range(2, n + 1) if sieve[i]]
+    large_n: tuple[int, ...]
 
 
 # ------------------------------------------------------------------------------
@@ -144,11 +116,14 @@ def _median_time(fn: Any, trials: int) -> float:
 
 
 # ------------------------------------------------------------------------------
-def _plot_runtime(*, n_vals: np.ndarray, t_sieve: np.ndarray, t_fact: np.ndarray) -> fig.Figure:
+def _plot_runtime(
+    *, n_vals: np.ndarray, t_sieve: np.ndarray, t_fact: np.ndarray, t_batch: np.ndarray
+) -> fig.Figure:
     """Plot runtime curves."""
     fig_obj, ax = plt.subplots()
     ax.plot(n_vals, t_sieve, marker="o", label="sieve")
     ax.plot(n_vals, t_fact, marker="o", label="factorization")
+    ax.plot(n_vals, t_batch, marker="o", label="batched factorization")
     ax.set_title("Runtime vs N")
     ax.set_xlabel("N")
     ax.set_ylabel("seconds (median)")
@@ -158,11 +133,14 @@ def _plot_runtime(*, n_vals: np.ndarray, t_sieve: np.ndarray, t_fact: np.ndarray
 
 
 # ------------------------------------------------------------------------------
-def _plot_throughput(*, n_vals: np.ndarray, t_sieve: np.ndarray, t_fact: np.ndarray) -> fig.Figure:
+def _plot_throughput(
+    *, n_vals: np.ndarray, t_sieve: np.ndarray, t_fact: np.ndarray, t_batch: np.ndarray
+) -> fig.Figure:
     """Plot throughput curves (numbers per second)."""
     fig_obj, ax = plt.subplots()
     ax.plot(n_vals, n_vals / t_sieve, marker="o", label="sieve")
     ax.plot(n_vals, n_vals / t_fact, marker="o", label="factorization")
+    ax.plot(n_vals, n_vals / t_batch, marker="o", label="batched factorization")
     ax.set_title("Throughput vs N")
     ax.set_xlabel("N")
     ax.set_ylabel("numbers / second")
@@ -179,6 +157,8 @@ def _write_report(
     n_vals: np.ndarray,
     t_sieve: np.ndarray,
     t_fact: np.ndarray,
+    t_batch: np.ndarray,
+    large: list[tuple[int, int, float]],
 ) -> None:
     """Write a short Markdown report."""
     lines = [
@@ -196,12 +176,21 @@ def _write_report(
         "",
         "## Results (median runtime)",
         "",
-        "| N | sieve [s] | factorization [s] | speedup (sieve/fact) |",
-        "|---:|---:|---:|---:|",
+        "| N | sieve [s] | factorization [s] | batched [s] | speedup (sieve/fact) |",
+        "|---:|---:|---:|---:|---:|",
     ]
-    for N, a, b in zip(n_vals, t_sieve, t_fact, strict=True):
+    for N, a, b, c in zip(n_vals, t_sieve, t_fact, t_batch, strict=True):
         speed = a / b if b > 0 else float("nan")
-        lines.append(f"| {int(N)} | {a:.4f} | {b:.4f} | {speed:.2f} |")
+        lines.append(f"| {int(N)} | {a:.4f} | {b:.4f} | {c:.4f} | {speed:.2f} |")
+    lines += [
+        "",
+        "## Single large n (Miller–Rabin + Pollard rho + ECM)",
+        "",
+        "| n | σ(n) | time [ms] |",
+        "|---:|---:|---:|",
+    ]
+    for n, s, t in large:
+        lines.append(f"| {n} | {s} | {t * 1000.0:.2f} |")
     lines.append("")
     lines.append("## Notes")
     lines.append(
@@ -210,6 +199,9 @@ def _write_report(
     lines.append(
         "- Factorization is capped to moderate N to keep runtime reasonable in pure Python."
     )
+    lines.append(
+        "- Batched factorization runs the same per-number work as array passes (SPF peeling)."
+    )
     report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
@@ -231,6 +223,14 @@ def main() -> int:
         n_values=(10_000, 30_000, 60_000, 100_000),
         trials=3,
         max_n_factor=100_000,
+        large_n=(
+            2**64 - 1,
+            10**18 + 9,
+            600_851_475_143 * 1_000_000_007,
+            10**24 + 7,
+            2**100 - 1,
+            10**30 - 1,
+        ),
     )
 
     out_paths = prepare_out_dir(out_dir=args.out_dir)
@@ -238,10 +238,11 @@ def main() -> int:
     n_vals = np.array(params.n_values, dtype=np.int64)
 
     # Precompute primes once (for the largest N).
-    primes = primes_up_to(isqrt(int(n_vals.max())))
+    primes = primes_up_to(isqrt(int(n_vals.max()))).tolist()
 
     t_sieve = np.zeros(n_vals.size, dtype=np.float64)
     t_fact = np.zeros(n_vals.size, dtype=np.float64)
+    t_batch = np.zeros(n_vals.size, dtype=np.float64)
 
     for i, N in enumerate(n_vals):
         N_int = int(N)
@@ -252,6 +253,11 @@ def main() -> int:
 
         t_sieve[i] = _median_time(run_sieve, trials=params.trials)
 
+        def run_batch(N_int: int = N_int) -> None:
+            _ = factorize_batch(np.arange(1, N_int + 1)).sigma()
+
+        t_batch[i] = _median_time(run_batch, trials=params.trials)
+
         if N_int > params.max_n_factor:
             t_fact[i] = float("nan")
             continue
@@ -264,10 +270,19 @@ def main() -> int:
 
         t_fact[i] = _median_time(run_fact, trials=params.trials)
 
-    fig1 = _plot_runtime(n_vals=n_vals, t_sieve=t_sieve, t_fact=t_fact)
+    # Cold cache: each large n is factored from scratch.
+    clear_cache()
+    large: list[tuple[int, int, float]] = []
+    for n in params.large_n:
+        t0 = perf_counter()
+        s = sigma(n)
+        large.append((n, s, perf_counter() - t0))
+        logger.info("sigma(%d) = %d", n, s)
+
+    fig1 = _plot_runtime(n_vals=n_vals, t_sieve=t_sieve, t_fact=t_fact, t_batch=t_batch)
     save_figure(out_dir=out_paths.figures_dir, name="fig_01_runtime_vs_n", fig=fig1)
 
-    fig2 = _plot_throughput(n_vals=n_vals, t_sieve=t_sieve, t_fact=t_fact)
+    fig2 = _plot_throughput(n_vals=n_vals, t_sieve=t_sieve, t_fact=t_fact, t_batch=t_batch)
     save_figure(out_dir=out_paths.figures_dir, name="fig_02_throughput_vs_n", fig=fig2)
 
     write_json(out_paths.params_path, data=asdict(params))
@@ -277,6 +292,8 @@ def main() -> int:
         n_vals=n_vals,
         t_sieve=t_sieve,
         t_fact=t_fact,
+        t_batch=t_batch,
+        large=large,
     )
 
     logger.info("Experiment E004 completed successfully. Artifacts saved to: %s", args.out_dir)
@@ -24,6 +24,7 @@ Artifacts:
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
 
 import matplotlib.figure as fig
@@ -34,6 +35,8 @@ from mathxlab.exp.cli import parse_experiment_args
 from mathxlab.exp.io import prepare_out_dir, save_figure, write_json
 from mathxlab.exp.logging import LoggingConfig, get_logger, setup_logging
 from mathxlab.exp.random import set_global_seed
+from mathxlab.num.filter_pipeline import FilterPipeline, FilterStage, arange_blocks
+from mathxlab.num.spf import SpfTable
 from mathxlab.plots.helpers import finalize_figure
 
 # ------------------------------------------------------------------------------
@@ -48,57 +51,12 @@ class Params:
     Args:
         n_max: Upper bound N (inclusive).
         stride_plot: Plotting stride for scatter/curve (visual only).
+        block_size: Odd candidates per streamed block.
     """
 
     n_max: int
     stride_plot: int
-
-
-# ------------------------------------------------------------------------------
-def spf_sieve(n_max: int) -> np.ndarray:
-    """Compute smallest-prime-factor (SPF) array for 2..N.
-
-    Args:
-        n_max: Upper bound N (inclusive).
-
-    Returns:
-        Array spf where spf[n] is the smallest prime dividing n (spf[0]=spf[1]=0).
-    """
-    spf = np.zeros(n_max + 1, dtype=np.int32)
-    for i in range(2, n_max + 1):
-        if spf[i] == 0:
-            spf[i] = i
-            if i <= n_max // i:
-                spf[i * i :: i] = np.where(spf[i * i :: i] == 0, i, spf[i * i :: i])
-    return spf
-
-
-# ------------------------------------------------------------------------------
-def factorize_with_spf(n: int, spf: np.ndarray) -> dict[int, int]:
-    """Factorize n using the SPF table.
-
-    Args:
-        n: Integer to factorize (n >= 1).
-        spf: Smallest-prime-factor table.
-
-    Returns:
-        Dictionary {prime: exponent}.
-    """
-    if n < 1:
-        raise ValueError("n must be >= 1")
-    if n == 1:
-        return {}
-    x = n
-    factors: dict[int, int] = {}
-    while x > 1:
-        p = int(spf[x]) if x < spf.size else 0
-        if p == 0:
-            # Fallback: x is prime or outside table.
-            factors[x] = factors.get(x, 0) + 1
-            break
-        factors[p] = factors.get(p, 0) + 1
-        x //= p
-    return factors
+    block_size: int
 
 
 # ------------------------------------------------------------------------------
@@ -115,7 +73,7 @@ def touchard_congruence(n: int) -> bool:
 
 
 # ------------------------------------------------------------------------------
-def euler_form_possible(n: int, spf: np.ndarray) -> bool:
+def euler_form_possible(n: int, spf: SpfTable) -> bool:
     """Check the Euler form necessary condition for odd perfect numbers.
 
     Any odd perfect number must be representable as:
@@ -124,12 +82,12 @@ def euler_form_possible(n: int, spf: np.ndarray) -> bool:
 
     Args:
         n: Odd integer.
-        spf: SPF sieve for factorization.
+        spf: SPF table for factorization.
 
     Returns:
         True if n matches the Euler form constraints, False otherwise.
     """
-    factors = factorize_with_spf(n, spf)
+    factors = spf.factorize(n)
     odd_exp = [(p, a) for p, a in factors.items() if a % 2 == 1]
     if len(odd_exp) != 1:
         return False
@@ -140,6 +98,60 @@ def euler_form_possible(n: int, spf: np.ndarray) -> bool:
     return a % 4 == 1
 
 
+# ------------------------------------------------------------------------------
+def touchard_mask(n: np.ndarray) -> np.ndarray:
+    """Array version of :func:`touchard_congruence`.
+
+    Args:
+        n: Odd integers (any integer dtype).
+
+    Returns:
+        Boolean mask, True where n ≡ 1 (mod 12) or n ≡ 9 (mod 36).
+    """
+    return np.asarray((n % 12 == 1) | (n % 36 == 9), dtype=bool)
+
+
+# ------------------------------------------------------------------------------
+def euler_form_mask(n: np.ndarray, spf: SpfTable) -> np.ndarray:
+    """Array version of :func:`euler_form_possible`.
+
+    Each pass strips the smallest remaining prime completely from every active value and
+    records whether its exponent is odd. Values leave the active set as soon as they fail
+    (a second odd exponent, or q or a ≢ 1 mod 4) or are fully factored. The number of passes
+    is the largest count of distinct prime factors (≤ 9 for n ≤ 10^9), plus one inner step per
+    unit of exponent.
+
+    Args:
+        n: Odd integers with 3 ≤ n ≤ spf.n_max.
+        spf: SPF table covering max(n).
+
+    Returns:
+        Boolean mask, True where n = q^a * m^2 with q ≡ a ≡ 1 (mod 4) is possible.
+    """
+    x = np.asarray(n, dtype=np.int64).copy()
+    ok = np.ones(x.size, dtype=bool)
+    seen_odd = np.zeros(x.size, dtype=bool)
+    active = np.flatnonzero(x > 1)
+    while active.size:
+        xa = x[active]
+        p = spf.spf(xa)
+        xa //= p
+        e = np.ones(active.size, dtype=np.int64)
+        more = np.flatnonzero(xa % p == 0)
+        while more.size:
+            xa[more] //= p[more]
+            e[more] += 1
+            more = more[xa[more] % p[more] == 0]
+        x[active] = xa
+
+        odd = (e & 1) == 1
+        bad = odd & (seen_odd[active] | (p % 4 != 1) | (e % 4 != 1))
+        ok[active[bad]] = False
+        seen_odd[active[odd]] = True
+        active = active[~bad & (xa > 1)]
+    return ok & seen_odd
+
+
 # ------------------------------------------------------------------------------
 def _plot_survival(*, stages: list[str], counts: np.ndarray) -> fig.Figure:
     """Plot survival curve after each stage.
@@ -214,37 +226,40 @@ def main() -> int:
     params = Params(
         n_max=300_000,
         stride_plot=1,
+        block_size=1 << 16,
     )
 
     out_paths = prepare_out_dir(out_dir=args.out_dir)
 
     logger.info("Building SPF sieve up to N=%d", params.n_max)
-    spf = spf_sieve(params.n_max)
-
-    # Candidate set: odd integers > 1
-    candidates = np.arange(3, params.n_max + 1, 2, dtype=np.int64)
-
-    stages: list[str] = []
-    counts: list[int] = []
-
-    stages.append("odd integers")
-    counts.append(int(candidates.size))
-
-    # Stage 1: Touchard congruence
-    mask1 = np.array([touchard_congruence(int(n)) for n in candidates], dtype=bool)
-    candidates = candidates[mask1]
-    stages.append("Touchard congruence")
-    counts.append(int(candidates.size))
-    logger.info("After Touchard congruence: %d", candidates.size)
-
-    # Stage 2: Euler form possible
-    mask2 = np.array([euler_form_possible(int(n), spf) for n in candidates], dtype=bool)
-    candidates = candidates[mask2]
-    stages.append("Euler form (q^a*m^2)")
-    counts.append(int(candidates.size))
-    logger.info("After Euler form filter: %d", candidates.size)
-
-    counts_arr = np.array(counts, dtype=np.int64)
+    spf = SpfTable.build(params.n_max)
+
+    # Candidate set: odd integers > 1, streamed in blocks through the filter stages.
+    pipeline = FilterPipeline(
+        stages=[
+            FilterStage(
+                name="Touchard congruence", predicate=touchard_mask, cost=1.0, selectivity=2 / 9
+            ),
+            FilterStage(
+                name="Euler form (q^a*m^2)",
+                predicate=partial(euler_form_mask, spf=spf),
+                cost=20.0,
+                selectivity=0.3,
+            ),
+        ],
+        # A fixed order keeps every block filtered the same way, so each stage's input is the
+        # previous stage's output and the survival curve does not depend on machine timings.
+        adaptive=False,
+    )
+    blocks = arange_blocks(3, params.n_max + 1, step=2, block_size=params.block_size)
+    for _ in pipeline.run(blocks):
+        pass
+
+    first = pipeline.counters[pipeline.order[0]]
+    stages = ["odd integers", *pipeline.order]
+    counts_arr = np.array(
+        [first.seen, *(pipeline.counters[n].passed for n in pipeline.order)], dtype=np.int64
+    )
     fig1 = _plot_survival(stages=stages, counts=counts_arr)
     save_figure(out_dir=out_paths.figures_dir, name="fig_01_survival_curve", fig=fig1)
 
@@ -3,8 +3,9 @@
 This experiment searches for integers n ≤ N where the perfect condition σ(n) = 2n is
 almost satisfied, but not exactly.
 
-It uses a divisor-sum sieve to compute σ(1..N), then ranks candidates by deviation
-from perfection.
+It streams σ(1..N) in blocks from the shared multiplicative-function sieve and keeps only a
+bounded top-k of the smallest deviations from perfection (plus a decimated scatter sample), so
+peak memory is O(block + k) rather than O(N).
 
 Usage (repository convention):
     make run EXP=e006
@@ -29,6 +30,8 @@ from mathxlab.exp.cli import parse_experiment_args
 from mathxlab.exp.io import prepare_out_dir, save_figure, write_json
 from mathxlab.exp.logging import LoggingConfig, get_logger, setup_logging
 from mathxlab.exp.random import set_global_seed
+from mathxlab.num.multiplicative import iter_sigma_blocks
+from mathxlab.num.streaming import TopK
 from mathxlab.plots.helpers import finalize_figure
 
 # ------------------------------------------------------------------------------
@@ -44,27 +47,74 @@ class Params:
         n_max: Upper bound N (inclusive).
         top_k: Number of best near-misses to keep.
         stride_scatter: Downsampling stride for scatter plot.
+        block_size: Integers per streamed σ block.
+        max_scatter_points: Cap on scatter samples; the stride grows with N to respect it.
     """
 
     n_max: int
     top_k: int
     stride_scatter: int
+    block_size: int
+    max_scatter_points: int
 
 
 # ------------------------------------------------------------------------------
-def sigma_sieve(n_max: int) -> np.ndarray:
-    """Compute σ(0..N) via a divisor-sum sieve.
+@dataclass(frozen=True, slots=True)
+class NearMissScan:
+    """Result of a near-miss scan over one range of n.
 
     Args:
-        n_max: Upper bound N (inclusive).
+        top: The top-k non-perfect n ranked by |σ(n) - 2n| (payload columns n, sigma).
+        scatter_n: Decimated sample of n (n ≡ 1 mod stride).
+        scatter_rel: Relative deviation |σ(n)/n - 2| for scatter_n.
+    """
+
+    top: TopK
+    scatter_n: np.ndarray
+    scatter_rel: np.ndarray
+
+
+# ------------------------------------------------------------------------------
+def scan_near_misses(
+    start: int, stop: int, *, top_k: int, stride: int, block_size: int
+) -> NearMissScan:
+    """Scan n in [start, stop) for near misses to σ(n) = 2n.
+
+    Results for disjoint ranges (e.g. from worker processes) combine with ``TopK.merge`` and
+    by concatenating the scatter samples.
+
+    Args:
+        start: First n (must be ≥ 1).
+        stop: End of the range (exclusive).
+        top_k: Number of near misses to keep.
+        stride: Scatter sample stride.
+        block_size: Integers per streamed σ block.
 
     Returns:
-        sigma array with sigma[n] = σ(n).
+        The top-k tracker and the decimated scatter sample for this range.
     """
-    sigma = np.zeros(n_max + 1, dtype=np.int64)
-    for d in range(1, n_max + 1):
-        sigma[d::d] += d
-    return sigma
+    top = TopK(k=top_k, columns=("n", "sigma"))
+    sample_n: list[np.ndarray] = []
+    sample_rel: list[np.ndarray] = []
+
+    for lo, s in iter_sigma_blocks(start, stop, block_size=block_size):
+        n = np.arange(lo, lo + s.size, dtype=np.int64)
+        d1 = np.abs(s - 2 * n)
+
+        # Exclude perfect numbers (d1 == 0, exact integer test) from the ranking.
+        ok = d1 != 0
+        top.update(d1[ok], n=n[ok], sigma=s[ok])
+
+        first = (1 - lo) % stride
+        n_s = n[first::stride]
+        sample_n.append(n_s)
+        sample_rel.append(np.abs(s[first::stride] / n_s.astype(np.float64) - 2.0))
+
+    return NearMissScan(
+        top=top,
+        scatter_n=np.concatenate(sample_n) if sample_n else np.array([], dtype=np.int64),
+        scatter_rel=np.concatenate(sample_rel) if sample_rel else np.array([], dtype=np.float64),
+    )
 
 
 # ------------------------------------------------------------------------------
@@ -120,10 +170,10 @@ def _plot_scatter(*, n: np.ndarray, rel_dev: np.ndarray) -> fig.Figure:
 
 
 # ------------------------------------------------------------------------------
-def _plot_topk(*, idx: np.ndarray, d1: np.ndarray) -> fig.Figure:
+def _plot_topk(*, d1: np.ndarray) -> fig.Figure:
     """Plot absolute deviation for the top-k near misses."""
     fig_obj, ax = plt.subplots()
-    ax.plot(np.arange(idx.size), d1, marker="o")
+    ax.plot(np.arange(d1.size), d1, marker="o")
     ax.set_title("Top-k near misses by |σ(n)-2n|")
     ax.set_xlabel("rank")
     ax.set_ylabel("|σ(n)-2n|")
@@ -149,45 +199,36 @@ def main() -> int:
         n_max=300_000,
         top_k=50,
         stride_scatter=10,
+        block_size=1 << 20,
+        max_scatter_points=200_000,
     )
 
     out_paths = prepare_out_dir(out_dir=args.out_dir)
 
-    logger.info("Computing sigma sieve up to N=%d", params.n_max)
-    sigma = sigma_sieve(params.n_max)
-
-    n = np.arange(1, params.n_max + 1, dtype=np.int64)
-    s = sigma[1:]
-
-    # Identify perfect numbers exactly
-    perfect_mask = s == (2 * n)
-    # Deviation measures
-    d1 = np.abs(s - 2 * n).astype(np.int64)
-    rel = np.abs((s / n.astype(np.float64)) - 2.0)
-
-    # Exclude perfect numbers from ranking
-    d1_rank = d1.copy()
-    d1_rank[perfect_mask] = np.iinfo(np.int64).max
-
-    # Top-k indices (smallest deviations)
-    idx = np.argpartition(d1_rank, params.top_k)[: params.top_k]
-    idx = idx[np.argsort(d1_rank[idx])]
+    stride = max(params.stride_scatter, -(-params.n_max // params.max_scatter_points))
+    logger.info("Streaming sigma sieve up to N=%d", params.n_max)
+    scan = scan_near_misses(
+        1,
+        params.n_max + 1,
+        top_k=params.top_k,
+        stride=stride,
+        block_size=params.block_size,
+    )
 
     top: list[tuple[int, int, int, float]] = []
-    for i in idx:
-        nn = int(n[i])
-        ss = int(s[i])
-        dd1 = int(d1[i])
-        dd2 = float(rel[i])
-        top.append((nn, ss, dd1, dd2))
-
-    # Scatter plot (downsample for readability)
-    n_s = n[:: params.stride_scatter]
-    rel_s = rel[:: params.stride_scatter]
-    fig1 = _plot_scatter(n=n_s, rel_dev=rel_s)
+    for d1, nn, ss in zip(
+        scan.top.keys.tolist(),
+        scan.top.values["n"].tolist(),
+        scan.top.values["sigma"].tolist(),
+        strict=True,
+    ):
+        top.append((nn, ss, d1, abs(ss / nn - 2.0)))
+
+    # Scatter plot (downsampled for readability)
+    fig1 = _plot_scatter(n=scan.scatter_n, rel_dev=scan.scatter_rel)
     save_figure(out_dir=out_paths.figures_dir, name="fig_01_near_miss_scatter", fig=fig1)
 
-    fig2 = _plot_topk(idx=idx, d1=np.array([d1[i] for i in idx], dtype=np.int64))
+    fig2 = _plot_topk(d1=scan.top.keys)
     save_figure(out_dir=out_paths.figures_dir, name="fig_02_topk_deviation", fig=fig2)
 
     write_json(out_paths.params_path, data=asdict(params))
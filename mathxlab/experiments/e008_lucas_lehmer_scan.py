@@ -1,7 +1,9 @@
 """E008 — Lucas–Lehmer scan for Mersenne primes.
 
 This experiment applies the Lucas–Lehmer test (LLT) to M_p = 2^p - 1
-for prime exponents p up to a chosen bound.
+for prime exponents p up to a chosen bound. Exponents first pass through
+trial factoring and P-1 (depths chosen by a cost model), so the LLT only
+runs on exponents without a cheaply found factor.
 
 Usage (repository convention):
     make run EXP=e008
@@ -17,7 +19,6 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from time import perf_counter
 
 import matplotlib.figure as fig
 import matplotlib.pyplot as plt
@@ -27,6 +28,11 @@ from mathxlab.exp.cli import parse_experiment_args
 from mathxlab.exp.io import prepare_out_dir, save_figure, write_json
 from mathxlab.exp.logging import LoggingConfig, get_logger, setup_logging
 from mathxlab.exp.random import set_global_seed
+from mathxlab.num.mersenne import LLT_ALGORITHM
+from mathxlab.num.mersenne_checkpoint import LltCheckpointer
+from mathxlab.num.mersenne_pipeline import MersennePipeline
+from mathxlab.num.mersenne_store import MersenneStore
+from mathxlab.num.primes import primes_up_to
 from mathxlab.plots.helpers import finalize_figure
 
 # ------------------------------------------------------------------------------
@@ -48,54 +54,18 @@ class Params:
 
 
 # ------------------------------------------------------------------------------
-def primes_up_to(n: int) -> np.ndarray:
-    """Sieve of Eratosthenes.
-
-    Args:
-        n: Upper bound (inclusive).
-
-    Returns:
-        Sorted array of primes ≤ n.
-    """
-    if n < 2:
-        return np.array([], dtype=np.int64)
-    sieve = np.ones(n + 1, dtype=bool)
-    sieve[:2] = False
-    limit = int(n**0.5)
-    for p in range(2, limit + 1):
-        if sieve[p]:
-            sieve[p * p : n + 1 : p] = False
-    return np.flatnonzero(sieve).astype(np.int64)
-
-
-# ------------------------------------------------------------------------------
-def lucas_lehmer_is_prime(p: int) -> bool:
-    """Lucas–Lehmer test for M_p = 2^p - 1 (p prime).
-
-    Args:
-        p: Prime exponent.
-
-    Returns:
-        True iff M_p is prime.
-    """
-    if p == 2:
-        return True  # M_2 = 3
-    mp = (1 << p) - 1
-    s = 4
-    for _ in range(p - 2):
-        s = (s * s - 2) % mp
-    return s == 0
-
-
-# ------------------------------------------------------------------------------
-def _plot_time(*, p: np.ndarray, t_ms: np.ndarray) -> fig.Figure:
-    """Plot LLT runtime vs p."""
+def _plot_time(*, p: np.ndarray, t_ms: np.ndarray, stage: np.ndarray) -> fig.Figure:
+    """Plot runtime of the deciding stage vs p."""
     fig_obj, ax = plt.subplots()
-    ax.plot(p, t_ms, marker="o", linestyle="none")
-    ax.set_title("Lucas–Lehmer runtime per exponent")
+    for name, label in (("llt", "Lucas–Lehmer"), ("tf", "trial factor"), ("pm1", "P-1")):
+        sel = stage == name
+        if np.any(sel):
+            ax.plot(p[sel], t_ms[sel], marker="o", linestyle="none", label=label)
+    ax.set_title("Runtime of the deciding stage per exponent")
     ax.set_xlabel("prime exponent p")
     ax.set_ylabel("time (ms)")
     ax.set_yscale("log")
+    ax.legend()
     finalize_figure(fig_obj)
     return fig_obj
 
@@ -114,7 +84,13 @@ def _plot_cumulative(*, idx: np.ndarray, cum: np.ndarray) -> fig.Figure:
 
 # ------------------------------------------------------------------------------
 def _write_report(
-    *, report_path: Path, params: Params, tested_p: list[int], is_mp_prime: list[bool]
+    *,
+    report_path: Path,
+    params: Params,
+    tested_p: list[int],
+    is_mp_prime: list[bool],
+    stage_lines: list[str],
+    untimed: int,
 ) -> None:
     """Write a short Markdown report.
 
@@ -123,6 +99,8 @@ def _write_report(
         params: Experiment parameters.
         tested_p: Prime exponents tested.
         is_mp_prime: Corresponding primality outcomes.
+        stage_lines: Per-stage pipeline table (Markdown lines).
+        untimed: Cached filter decisions left out of the timing figure.
     """
     found = [p for p, ok in zip(tested_p, is_mp_prime, strict=True) if ok]
     lines = [
@@ -149,11 +127,15 @@ def _write_report(
         lines.append(", ".join(str(p) for p in found))
     else:
         lines.append("_none in this range (or max_tests too small)_")
+    lines += ["", "## Pipeline stages", "", *stage_lines]
     lines += [
         "",
         "## Notes",
         "- LLT is a deterministic primality test specialized to M_p = 2^p - 1.",
+        "- A factor found by trial factoring or P-1 proves M_p composite without an LLT.",
         "- Only prime exponents p need to be tested: if 2^n-1 is prime, then n must be prime.",
+        f"- fig_01 omits `{untimed}` exponents decided by cached trial factoring / P-1 results"
+        " (no timing is stored for them).",
         "",
     ]
     report_path.write_text("\n".join(lines), encoding="utf-8")
@@ -179,21 +161,29 @@ def main() -> int:
     )
 
     out_paths = prepare_out_dir(out_dir=args.out_dir)
+    store = None if args.cache_dir is None else MersenneStore.in_dir(args.cache_dir)
+    checkpoint = LltCheckpointer(
+        directory=out_paths.root / "checkpoints",
+        algorithm=LLT_ALGORITHM,
+        interval=args.checkpoint_interval,
+        resume=args.resume,
+    )
+    pipeline = MersennePipeline(store=store, checkpoint=checkpoint)
 
     p_all = primes_up_to(params.p_max)
     tested_p: list[int] = []
     is_mp_prime: list[bool] = []
     t_ms: list[float] = []
+    stages: list[str] = []
+    timed: list[bool] = []
 
-    for p in p_all[: params.max_tests]:
-        p_i = int(p)
-        t0 = perf_counter()
-        ok = lucas_lehmer_is_prime(p_i)
-        dt = (perf_counter() - t0) * 1000.0
-
-        tested_p.append(p_i)
-        is_mp_prime.append(bool(ok))
-        t_ms.append(float(dt))
+    for res in pipeline.run(p_all[: params.max_tests].tolist()):
+        tested_p.append(res.p)
+        is_mp_prime.append(res.is_prime)
+        t_ms.append(res.seconds * 1000.0)
+        stages.append(res.stage)
+        # The store keeps no timings for cached trial-factoring / P-1 decisions.
+        timed.append(not res.cached or res.stage == "llt")
 
     p_arr = np.array(tested_p, dtype=np.int64)
     t_arr = np.array(t_ms, dtype=np.float64)
@@ -201,7 +191,8 @@ def main() -> int:
     cum = np.cumsum(np.array(is_mp_prime, dtype=np.int64))
     idx = np.arange(1, cum.size + 1, dtype=np.int64)
 
-    fig1 = _plot_time(p=p_arr, t_ms=t_arr)
+    sel = np.array(timed, dtype=bool)
+    fig1 = _plot_time(p=p_arr[sel], t_ms=t_arr[sel], stage=np.array(stages)[sel])
     save_figure(out_dir=out_paths.figures_dir, name="fig_01_time_vs_p", fig=fig1)
 
     fig2 = _plot_cumulative(idx=idx, cum=cum)
@@ -209,7 +200,12 @@ def main() -> int:
 
     write_json(out_paths.params_path, data=asdict(params))
     _write_report(
-        report_path=out_paths.report_path, params=params, tested_p=tested_p, is_mp_prime=is_mp_prime
+        report_path=out_paths.report_path,
+        params=params,
+        tested_p=tested_p,
+        is_mp_prime=is_mp_prime,
+        stage_lines=pipeline.report_lines(),
+        untimed=len(timed) - int(sel.sum()),
     )
 
     logger.info("Experiment E008 completed successfully. Artifacts saved to: %s", args.out_dir)
@@ -7,9 +7,13 @@ A necessary condition for q | (2^p - 1) is:
     2^p ≡ 1 (mod q)
 
 Additionally, if p is an odd prime and q | (2^p - 1), then:
-    q ≡ 1 (mod 2p)
+    q ≡ 1 (mod 2p)  and  q ≡ ±1 (mod 8)
 
-This experiment searches q of the form q = 2*p*k + 1 up to a limit q_max.
+This experiment searches q of the form q = 2*p*k + 1 up to a limit q_max, using class-based
+trial factoring (residue classes of k mod 4620 plus a small-prime pre-sieve).
+
+Per-exponent progress (highest k searched, factor found) is kept in the shared result cache
+(``--cache-dir``), so raising q_max only searches the new range.
 
 Usage (repository convention):
     make run EXP=e009
@@ -34,6 +38,9 @@ from mathxlab.exp.cli import parse_experiment_args
 from mathxlab.exp.io import prepare_out_dir, save_figure, write_json
 from mathxlab.exp.logging import LoggingConfig, get_logger, setup_logging
 from mathxlab.exp.random import set_global_seed
+from mathxlab.num.mersenne_store import MersenneStore
+from mathxlab.num.primes import primes_up_to
+from mathxlab.num.trial_factor import extend_trial_factor, trial_factor
 from mathxlab.plots.helpers import finalize_figure
 
 # ------------------------------------------------------------------------------
@@ -49,82 +56,35 @@ class Params:
         p_max: Upper bound for prime exponents p (inclusive).
         max_tests: Cap on how many prime exponents to test.
         q_max: Upper bound for candidate factors q.
-        require_q_prime: If True, sieve primes up to q_max and test only prime q.
     """
 
     p_max: int
     max_tests: int
     q_max: int
-    require_q_prime: bool
-
-
-# ------------------------------------------------------------------------------
-def primes_up_to(n: int) -> np.ndarray:
-    """Sieve of Eratosthenes.
-
-    Args:
-        n: Upper bound (inclusive).
-
-    Returns:
-        Sorted array of primes ≤ n.
-    """
-    if n < 2:
-        return np.array([], dtype=np.int64)
-    sieve = np.ones(n + 1, dtype=bool)
-    sieve[:2] = False
-    limit = int(n**0.5)
-    for p in range(2, limit + 1):
-        if sieve[p]:
-            sieve[p * p : n + 1 : p] = False
-    return np.flatnonzero(sieve).astype(np.int64)
-
-
-# ------------------------------------------------------------------------------
-def _prime_mask_up_to(n: int) -> np.ndarray:
-    """Return boolean mask is_prime[0..n]."""
-    is_prime = np.ones(n + 1, dtype=bool)
-    if n >= 0:
-        is_prime[0] = False
-    if n >= 1:
-        is_prime[1] = False
-    limit = int(n**0.5)
-    for p in range(2, limit + 1):
-        if is_prime[p]:
-            is_prime[p * p : n + 1 : p] = False
-    return is_prime
 
 
 # ------------------------------------------------------------------------------
 def find_small_factor_for_mp(
-    p: int, *, q_max: int, require_q_prime: bool, is_prime_q: np.ndarray | None
+    p: int, *, q_max: int, store: MersenneStore | None = None
 ) -> int | None:
-    """Find a small factor q of M_p = 2^p - 1 up to q_max.
+    """Find the smallest factor q of M_p = 2^p - 1 up to q_max.
+
+    Uses the class-based trial-factoring engine in :mod:`mathxlab.num.trial_factor`. The
+    smallest factor of the form 2pk + 1 is always prime, so no primality table is needed.
 
     Args:
         p: Prime exponent.
-        q_max: Search limit for q.
-        require_q_prime: Whether to restrict to prime q.
-        is_prime_q: Boolean mask for primality up to q_max, required if require_q_prime is True.
+        q_max: Search limit for q (must be < 2^50).
+        store: Optional progress store; the search resumes after the recorded k.
 
     Returns:
-        A factor q if found, otherwise None.
+        The smallest factor q if found, otherwise None.
     """
     if p == 2:
         return None  # M_2 is prime; factor search not meaningful here
-    step = 2 * p
-    # q = 1 (mod 2p)
-    k_max = (q_max - 1) // step
-    for k in range(1, k_max + 1):
-        q = step * k + 1
-        if require_q_prime:
-            if is_prime_q is None:
-                raise ValueError("is_prime_q must be provided when require_q_prime=True")
-            if not bool(is_prime_q[q]):
-                continue
-        # Check 2^p ≡ 1 (mod q)
-        if pow(2, p, q) == 1:
-            return q
-    return None
+    if store is not None:
+        return extend_trial_factor(p, q_max=q_max, store=store).factor
+    return trial_factor(p, q_max=q_max).factor
 
 
 # ------------------------------------------------------------------------------
@@ -179,7 +139,6 @@ def _write_report(
         f"- p_max: `{params.p_max}`",
         f"- max_tests: `{params.max_tests}`",
         f"- q_max: `{params.q_max}`",
-        f"- require_q_prime: `{params.require_q_prime}`",
         "",
         "## Results",
         f"- tested exponents: `{len(tested_p)}`",
@@ -195,7 +154,7 @@ def _write_report(
     lines += [
         "",
         "## Notes",
-        "- The congruence filter q ≡ 1 (mod 2p) is necessary but not sufficient.",
+        "- Candidates q = 2pk + 1 are restricted to q ≡ ±1 (mod 8) and pre-sieved by small primes.",
         "- A found q certifies M_p is composite; it does not factor M_p completely.",
         "",
     ]
@@ -220,26 +179,19 @@ def main() -> int:
         p_max=10_000,
         max_tests=800,
         q_max=5_000_000,
-        require_q_prime=True,
     )
 
     out_paths = prepare_out_dir(out_dir=args.out_dir)
+    store = None if args.cache_dir is None else MersenneStore.in_dir(args.cache_dir)
 
     p_all = primes_up_to(params.p_max)[: params.max_tests]
 
-    is_prime_q = _prime_mask_up_to(params.q_max) if params.require_q_prime else None
-
     tested_p: list[int] = []
     factor_q: list[int | None] = []
 
     for p in p_all:
         p_i = int(p)
-        q = find_small_factor_for_mp(
-            p_i,
-            q_max=params.q_max,
-            require_q_prime=params.require_q_prime,
-            is_prime_q=is_prime_q,
-        )
+        q = find_small_factor_for_mp(p_i, q_max=params.q_max, store=store)
         tested_p.append(p_i)
         factor_q.append(q)
 
@@ -5,8 +5,9 @@ Euclid–Euler theorem:
         N = 2^(p-1) * (2^p - 1)
     is an even perfect number.
 
-This experiment finds small Mersenne primes (via Lucas–Lehmer) in a range
-and constructs the corresponding perfect numbers, reporting their sizes.
+This experiment finds small Mersenne primes (via Lucas–Lehmer, after
+trial-factoring and P-1 filters) in a range and constructs the corresponding
+perfect numbers, reporting their sizes.
 
 Usage (repository convention):
     make run EXP=e010
@@ -22,7 +23,6 @@ from __future__ import annotations
 import math
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from time import perf_counter
 
 import matplotlib.figure as fig
 import matplotlib.pyplot as plt
@@ -32,6 +32,11 @@ from mathxlab.exp.cli import parse_experiment_args
 from mathxlab.exp.io import prepare_out_dir, save_figure, write_json
 from mathxlab.exp.logging import LoggingConfig, get_logger, setup_logging
 from mathxlab.exp.random import set_global_seed
+from mathxlab.num.mersenne import LLT_ALGORITHM
+from mathxlab.num.mersenne_checkpoint import LltCheckpointer
+from mathxlab.num.mersenne_pipeline import MersennePipeline
+from mathxlab.num.mersenne_store import MersenneStore
+from mathxlab.num.primes import primes_up_to
 from mathxlab.plots.helpers import finalize_figure
 
 # ------------------------------------------------------------------------------
@@ -52,46 +57,6 @@ class Params:
     max_tests: int
 
 
-# ------------------------------------------------------------------------------
-def primes_up_to(n: int) -> np.ndarray:
-    """Sieve of Eratosthenes.
-
-    Args:
-        n: Upper bound (inclusive).
-
-    Returns:
-        Sorted array of primes ≤ n.
-    """
-    if n < 2:
-        return np.array([], dtype=np.int64)
-    sieve = np.ones(n + 1, dtype=bool)
-    sieve[:2] = False
-    limit = int(n**0.5)
-    for p in range(2, limit + 1):
-        if sieve[p]:
-            sieve[p * p : n + 1 : p] = False
-    return np.flatnonzero(sieve).astype(np.int64)
-
-
-# ------------------------------------------------------------------------------
-def lucas_lehmer_is_prime(p: int) -> bool:
-    """Lucas–Lehmer test for M_p = 2^p - 1 (p prime).
-
-    Args:
-        p: Prime exponent.
-
-    Returns:
-        True iff M_p is prime.
-    """
-    if p == 2:
-        return True
-    mp = (1 << p) - 1
-    s = 4
-    for _ in range(p - 2):
-        s = (s * s - 2) % mp
-    return s == 0
-
-
 # ------------------------------------------------------------------------------
 def _perfect_from_p(p: int) -> int:
     """Construct even perfect number from a Mersenne prime exponent p."""
@@ -143,7 +108,12 @@ def _plot_digits(*, idx: np.ndarray, digits: np.ndarray) -> fig.Figure:
 
 # ------------------------------------------------------------------------------
 def _write_report(
-    *, report_path: Path, params: Params, found_p: list[int], runtimes_ms: list[float]
+    *,
+    report_path: Path,
+    params: Params,
+    found_p: list[int],
+    runtimes_ms: list[float],
+    stage_lines: list[str],
 ) -> None:
     """Write a short Markdown report.
 
@@ -151,7 +121,8 @@ def _write_report(
         report_path: Path to report.md.
         params: Experiment parameters.
         found_p: Exponents p where M_p is prime.
-        runtimes_ms: LLT runtimes in milliseconds for each tested p.
+        runtimes_ms: Runtimes of the deciding stage in milliseconds for each tested p.
+        stage_lines: Per-stage pipeline table (Markdown lines).
     """
     lines = [
         "# E010 — Even perfect numbers from Mersenne primes",
@@ -184,6 +155,7 @@ def _write_report(
     for p in found_p:
         lines.append(f"| {p} | {_digits_perfect(p)} |")
 
+    lines += ["", "## Pipeline stages", "", *stage_lines]
     lines += [
         "",
         "## Notes",
@@ -214,20 +186,24 @@ def main() -> int:
     )
 
     out_paths = prepare_out_dir(out_dir=args.out_dir)
+    store = None if args.cache_dir is None else MersenneStore.in_dir(args.cache_dir)
+    checkpoint = LltCheckpointer(
+        directory=out_paths.root / "checkpoints",
+        algorithm=LLT_ALGORITHM,
+        interval=args.checkpoint_interval,
+        resume=args.resume,
+    )
+    pipeline = MersennePipeline(store=store, checkpoint=checkpoint)
 
     p_all = primes_up_to(params.p_max)[: params.max_tests]
 
     found_p: list[int] = []
     t_ms: list[float] = []
 
-    for p in p_all:
-        p_i = int(p)
-        t0 = perf_counter()
-        ok = lucas_lehmer_is_prime(p_i)
-        dt = (perf_counter() - t0) * 1000.0
-        t_ms.append(float(dt))
-        if ok:
-            found_p.append(p_i)
+    for res in pipeline.run(p_all.tolist()):
+        t_ms.append(res.seconds * 1000.0)
+        if res.is_prime:
+            found_p.append(res.p)
 
     digits = np.array([_digits_perfect(p) for p in found_p], dtype=np.int64)
     idx = np.arange(1, digits.size + 1, dtype=np.int64)
@@ -240,7 +216,11 @@ def main() -> int:
 
     write_json(out_paths.params_path, data=asdict(params))
     _write_report(
-        report_path=out_paths.report_path, params=params, found_p=found_p, runtimes_ms=t_ms
+        report_path=out_paths.report_path,
+        params=params,
+        found_p=found_p,
+        runtimes_ms=t_ms,
+        stage_lines=pipeline.report_lines(),
     )
 
     logger.info("Experiment E010 completed successfully. Artifacts saved to: %s", args.out_dir)
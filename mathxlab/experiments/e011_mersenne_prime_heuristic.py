@@ -8,7 +8,8 @@ This experiment compares:
 to:
     expected_count(p_max) = sum_{p prime ≤ p_max} 1 / (p * ln 2)
 
-The observed count is computed via Lucas–Lehmer.
+The observed count is computed via Lucas–Lehmer, after trial-factoring and
+P-1 filters remove exponents with a cheaply found factor.
 
 Usage (repository convention):
     make run EXP=e011
@@ -32,6 +33,11 @@ from mathxlab.exp.cli import parse_experiment_args
 from mathxlab.exp.io import prepare_out_dir, save_figure, write_json
 from mathxlab.exp.logging import LoggingConfig, get_logger, setup_logging
 from mathxlab.exp.random import set_global_seed
+from mathxlab.num.mersenne import LLT_ALGORITHM
+from mathxlab.num.mersenne_checkpoint import LltCheckpointer
+from mathxlab.num.mersenne_pipeline import MersennePipeline
+from mathxlab.num.mersenne_store import MersenneStore
+from mathxlab.num.primes import primes_up_to
 from mathxlab.plots.helpers import finalize_figure
 
 # ------------------------------------------------------------------------------
@@ -52,46 +58,6 @@ class Params:
     max_tests: int
 
 
-# ------------------------------------------------------------------------------
-def primes_up_to(n: int) -> np.ndarray:
-    """Sieve of Eratosthenes.
-
-    Args:
-        n: Upper bound (inclusive).
-
-    Returns:
-        Sorted array of primes ≤ n.
-    """
-    if n < 2:
-        return np.array([], dtype=np.int64)
-    sieve = np.ones(n + 1, dtype=bool)
-    sieve[:2] = False
-    limit = int(n**0.5)
-    for p in range(2, limit + 1):
-        if sieve[p]:
-            sieve[p * p : n + 1 : p] = False
-    return np.flatnonzero(sieve).astype(np.int64)
-
-
-# ------------------------------------------------------------------------------
-def lucas_lehmer_is_prime(p: int) -> bool:
-    """Lucas–Lehmer test for M_p = 2^p - 1 (p prime).
-
-    Args:
-        p: Prime exponent.
-
-    Returns:
-        True iff M_p is prime.
-    """
-    if p == 2:
-        return True
-    mp = (1 << p) - 1
-    s = 4
-    for _ in range(p - 2):
-        s = (s * s - 2) % mp
-    return s == 0
-
-
 # ------------------------------------------------------------------------------
 def _plot_observed_expected(
     *, p: np.ndarray, observed: np.ndarray, expected: np.ndarray
@@ -110,7 +76,14 @@ def _plot_observed_expected(
 
 # ------------------------------------------------------------------------------
 def _write_report(
-    *, report_path: Path, params: Params, last_p: int, obs: int, exp: float, found_p: list[int]
+    *,
+    report_path: Path,
+    params: Params,
+    last_p: int,
+    obs: int,
+    exp: float,
+    found_p: list[int],
+    stage_lines: list[str],
 ) -> None:
     """Write a short Markdown report.
 
@@ -121,6 +94,7 @@ def _write_report(
         obs: Observed count.
         exp: Expected count (heuristic).
         found_p: Exponents found where M_p is prime.
+        stage_lines: Per-stage pipeline table (Markdown lines).
     """
     lines = [
         "# E011 — Heuristic vs observed counts of Mersenne primes",
@@ -147,6 +121,7 @@ def _write_report(
         lines.append(", ".join(str(p) for p in found_p))
     else:
         lines.append("_none in this range (or max_tests too small)_")
+    lines += ["", "## Pipeline stages", "", *stage_lines]
     lines += [
         "",
         "## Notes",
@@ -177,6 +152,14 @@ def main() -> int:
     )
 
     out_paths = prepare_out_dir(out_dir=args.out_dir)
+    store = None if args.cache_dir is None else MersenneStore.in_dir(args.cache_dir)
+    checkpoint = LltCheckpointer(
+        directory=out_paths.root / "checkpoints",
+        algorithm=LLT_ALGORITHM,
+        interval=args.checkpoint_interval,
+        resume=args.resume,
+    )
+    pipeline = MersennePipeline(store=store, checkpoint=checkpoint)
 
     p_all = primes_up_to(params.p_max)[: params.max_tests]
 
@@ -189,10 +172,9 @@ def main() -> int:
     exp = 0.0
     ln2 = float(np.log(2.0))
 
-    for p in p_all:
-        p_i = int(p)
-        ok = lucas_lehmer_is_prime(p_i)
-        if ok:
+    for res in pipeline.run(p_all.tolist()):
+        p_i = res.p
+        if res.is_prime:
             obs += 1
             found_p.append(p_i)
 
@@ -218,6 +200,7 @@ def main() -> int:
         obs=obs,
         exp=exp,
         found_p=found_p,
+        stage_lines=pipeline.report_lines(),
     )
 
     logger.info("Experiment E011 completed successfully. Artifacts saved to: %s", args.out_dir)
@@ -0,0 +1,194 @@
+"""Dense Taylor error volumes stored as memory-mapped ``.npy`` files.
+
+An :class:`ErrorVolume` holds |sin(x) - T_d(x; x0)| for every (center x0, degree d, grid point x)
+as a float32 array of shape (centers, degrees, points). It is stored in a standard ``.npy`` file
+(readable with ``np.load(..., mmap_mode="r")``), next to a JSON sidecar that records the axes.
+
+:meth:`ErrorVolume.compute` fills the file tile by tile: one center and a block of grid points
+at a time, with all degrees from one pass of
+:func:`mathxlab.num.series.taylor_sin_partial_sums`. Tiles go to a thread pool and write disjoint
+regions of the memory map. Reading is equally bounded. :meth:`ErrorVolume.degree_slice` and
+:meth:`ErrorVolume.center_slice` return memory-mapped views, and :meth:`ErrorVolume.reduce_x`
+builds (center x degree) heatmaps by streaming a few centers at a time. The whole volume never
+has to fit in RAM.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from mathxlab.num.series import SeriesWorkspace, taylor_sin_partial_sums
+
+DEFAULT_X_TILE = 1 << 14
+"""Grid points per tile (per center, all degrees)."""
+
+DEFAULT_CENTER_TILE = 16
+"""Centers read at once by :meth:`ErrorVolume.reduce_x`."""
+
+_REDUCTIONS = ("max", "mean")
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class ErrorVolume:
+    """A (center x degree x point) float32 error volume backed by an ``.npy`` file.
+
+    Args:
+        path: The ``.npy`` file (the axes live in ``path.with_suffix(".json")``).
+        centers: Expansion centers (float64, one per first-axis index).
+        degrees: Polynomial degrees (one per second-axis index).
+        x: Grid points (float64, one per third-axis index).
+        data: Read-only memory map of the volume.
+    """
+
+    path: Path
+    centers: np.ndarray
+    degrees: tuple[int, ...]
+    x: np.ndarray
+    data: np.ndarray
+
+    @classmethod
+    def compute(
+        cls,
+        path: Path,
+        *,
+        centers: Sequence[float] | np.ndarray,
+        degrees: Sequence[int],
+        x_min: float,
+        x_max: float,
+        num_points: int,
+        x_tile: int = DEFAULT_X_TILE,
+        workers: int | None = None,
+    ) -> ErrorVolume:
+        """Compute the volume on ``np.linspace(x_min, x_max, num_points)`` and write it to path.
+
+        Args:
+            path: Output ``.npy`` file (overwritten; parent directories are created).
+            centers: Expansion centers.
+            degrees: Polynomial degrees (any order).
+            x_min: First grid point.
+            x_max: Last grid point.
+            num_points: Grid size.
+            x_tile: Grid points per tile.
+            workers: Threads (default: ``os.cpu_count()``).
+
+        Returns:
+            The volume, opened read-only.
+
+        Raises:
+            ValueError: If an axis is empty or x_tile / workers is < 1.
+        """
+        n_workers = (os.cpu_count() or 1) if workers is None else workers
+        if len(centers) == 0 or len(degrees) == 0 or num_points < 1:
+            raise ValueError("centers, degrees and the grid must be non-empty")
+        if x_tile < 1 or n_workers < 1:
+            raise ValueError("x_tile and workers must be >= 1")
+        c_arr = np.asarray(centers, dtype=np.float64)
+        degs = tuple(int(d) for d in degrees)
+        x = np.linspace(x_min, x_max, num_points, dtype=np.float64)
+        sin_x = np.sin(x)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        vol = np.lib.format.open_memmap(
+            path, mode="w+", dtype=np.float32, shape=(c_arr.size, len(degs), num_points)
+        )
+        tiles = [(c, lo) for c in range(c_arr.size) for lo in range(0, num_points, x_tile)]
+        n_workers = min(n_workers, len(tiles))
+
+        def work(first: int) -> None:
+            ws = SeriesWorkspace.allocate()
+            buf = np.empty((len(degs), x_tile))
+            for c, lo in tiles[first::n_workers]:
+                hi = min(lo + x_tile, num_points)
+                err = taylor_sin_partial_sums(
+                    x[lo:hi], float(c_arr[c]), degs, out=buf[:, : hi - lo], workspace=ws
+                )
+                np.subtract(err, sin_x[lo:hi], out=err)
+                np.abs(err, out=err)
+                vol[c, :, lo:hi] = err
+
+        if n_workers == 1:
+            work(0)
+        else:
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                list(pool.map(work, range(n_workers)))
+        vol.flush()
+
+        meta = {
+            "centers": c_arr.tolist(),
+            "degrees": list(degs),
+            "x_min": x_min,
+            "x_max": x_max,
+            "num_points": num_points,
+        }
+        path.with_suffix(".json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path: Path) -> ErrorVolume:
+        """Open a volume written by :meth:`compute`, memory-mapped read-only.
+
+        Raises:
+            ValueError: If the sidecar does not match the array shape.
+        """
+        meta = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        data = np.load(path, mmap_mode="r")
+        centers = np.asarray(meta["centers"], dtype=np.float64)
+        degrees = tuple(int(d) for d in meta["degrees"])
+        x = np.linspace(meta["x_min"], meta["x_max"], meta["num_points"], dtype=np.float64)
+        if data.shape != (centers.size, len(degrees), x.size):
+            raise ValueError(f"volume shape {data.shape} does not match its sidecar")
+        return cls(path=path, centers=centers, degrees=degrees, x=x, data=data)
+
+    def degree_index(self, degree: int) -> int:
+        """Second-axis index of a degree.
+
+        Raises:
+            KeyError: If the degree is not in the volume.
+        """
+        try:
+            return self.degrees.index(degree)
+        except ValueError:
+            raise KeyError(f"degree {degree} not in volume") from None
+
+    def degree_slice(self, degree: int, *, x_stride: int = 1) -> np.ndarray:
+        """Memory-mapped (center x point) errors for one degree, optionally thinned in x."""
+        return self.data[:, self.degree_index(degree), ::x_stride]
+
+    def center_slice(self, center_index: int, *, x_stride: int = 1) -> np.ndarray:
+        """Memory-mapped (degree x point) errors for one center, optionally thinned in x."""
+        return self.data[center_index, :, ::x_stride]
+
+    def reduce_x(self, how: str = "max", *, center_tile: int = DEFAULT_CENTER_TILE) -> np.ndarray:
+        """Reduce over the grid axis, reading center_tile centers at a time.
+
+        Args:
+            how: ``"max"`` or ``"mean"``.
+            center_tile: Centers per read.
+
+        Returns:
+            float64 array of shape (centers, degrees).
+
+        Raises:
+            ValueError: If ``how`` is unknown or center_tile < 1.
+        """
+        if how not in _REDUCTIONS:
+            raise ValueError(f"how must be one of {_REDUCTIONS}")
+        if center_tile < 1:
+            raise ValueError("center_tile must be >= 1")
+        n_c, n_d = self.data.shape[:2]
+        out = np.empty((n_c, n_d), dtype=np.float64)
+        for c0 in range(0, n_c, center_tile):
+            tile = self.data[c0 : c0 + center_tile]
+            if how == "max":
+                out[c0 : c0 + center_tile] = tile.max(axis=2)
+            else:
+                out[c0 : c0 + center_tile] = tile.mean(axis=2, dtype=np.float64)
+        return out
@@ -0,0 +1,261 @@
+"""Factorization of single large integers: Miller–Rabin, Brent's rho and ECM.
+
+:func:`factorint` factors one Python int (64-bit and well beyond) in these steps:
+
+1. trial division by the primes below 1000;
+2. a Miller–Rabin test on the cofactor;
+3. Brent's variant of Pollard's rho, with a bounded iteration budget, to split composites;
+4. if rho runs out of budget, sympy's elliptic-curve method (ECM), when it is available,
+   otherwise rho with further polynomials.
+
+Miller–Rabin with the first 13 prime bases is deterministic for n < 3.3 * 10^24, which covers all
+64-bit integers. Above that bound the same bases plus 12 more make it a probable-prime test.
+Factorizations are memoized, so repeated queries and aliquot sequences that revisit the same
+integers cost a dictionary lookup. With this, σ(n) for n around 10^30 usually takes
+milliseconds. The exception is n with two or more prime factors above ~10^12, which go to ECM.
+For n ≈ 10^30 with two prime factors near 10^15 that takes 0.3-4 s on a desktop core, and the
+time grows quickly with the size of the second-largest prime factor.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from math import gcd, isqrt, prod
+
+from mathxlab.num.primes import primes_up_to
+
+try:
+    from sympy.ntheory import ecm as _sympy_ecm
+except ImportError:  # sympy < 1.13 has no ECM
+    _sympy_ecm = None
+
+_SMALL_PRIMES: tuple[int, ...] = tuple(primes_up_to(1000).tolist())
+
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MR_EXTRA_BASES = (43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+MR_DETERMINISTIC_LIMIT = 3_317_044_064_679_887_385_961_981
+"""Miller–Rabin with bases 2..41 is exact below this bound."""
+
+RHO_BUDGET = 1 << 13
+"""Rho iterations tried per composite before handing it to ECM (finds factors up to ~10^7)."""
+
+_RHO_BATCH = 128
+"""Rho steps whose differences are multiplied together before one gcd."""
+
+CACHE_SIZE = 1 << 16
+"""Memoized factorizations (least recently used entries are evicted)."""
+
+
+# ------------------------------------------------------------------------------
+def _strong_probable_prime(n: int, a: int, d: int, s: int) -> bool:
+    """Strong probable-prime test of odd n to base a, where n - 1 = d * 2^s with d odd."""
+    x = pow(a, d, n)
+    if x in (1, n - 1):
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+# ------------------------------------------------------------------------------
+def is_prime(n: int) -> bool:
+    """Miller–Rabin primality test.
+
+    Exact for n < MR_DETERMINISTIC_LIMIT (all 64-bit integers). Above it, a composite passes
+    all 25 bases with negligible probability.
+
+    Args:
+        n: Integer to test.
+
+    Returns:
+        True if n is prime (probable prime above MR_DETERMINISTIC_LIMIT).
+    """
+    if n < 2:
+        return False
+    for p in _MR_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    bases = _MR_BASES if n < MR_DETERMINISTIC_LIMIT else _MR_BASES + _MR_EXTRA_BASES
+    return all(_strong_probable_prime(n, a, d, s) for a in bases)
+
+
+# ------------------------------------------------------------------------------
+def pollard_brent(n: int, *, c: int = 1, max_iterations: int | None = None) -> int | None:
+    """Find a nontrivial factor of composite n with Brent's variant of Pollard's rho.
+
+    Iterates x -> x^2 + c (mod n) with Brent's cycle detection. The differences are
+    multiplied in batches, so there is one gcd per batch instead of one per step.
+
+    Args:
+        n: Odd composite integer.
+        c: Polynomial constant (change it to retry after a failure).
+        max_iterations: Step budget (unlimited if None).
+
+    Returns:
+        A factor 1 < f < n, or None if this polynomial failed or the budget ran out.
+    """
+    y, r, q, g = 2, 1, 1, 1
+    x = ys = y
+    steps = 0
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(_RHO_BATCH, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = gcd(q, n)
+            k += _RHO_BATCH
+        steps += 2 * r
+        r *= 2
+        if max_iterations is not None and steps > max_iterations and g == 1:
+            return None
+    if g == n:
+        # The batch overshot: redo it one step at a time.
+        g = 1
+        while g == 1:
+            ys = (ys * ys + c) % n
+            g = gcd(abs(x - ys), n)
+    return g if g != n else None
+
+
+# ------------------------------------------------------------------------------
+def _split(n: int) -> int:
+    """Return a nontrivial factor of odd composite n that is not a perfect square."""
+    f = pollard_brent(n, max_iterations=RHO_BUDGET)
+    if f is not None:
+        return f
+    if _sympy_ecm is not None:
+        return int(min(_sympy_ecm(n)))
+    c = 3
+    while (f := pollard_brent(n, c=c)) is None:
+        c += 2
+    return f
+
+
+# ------------------------------------------------------------------------------
+@lru_cache(maxsize=CACHE_SIZE)
+def _factor_large(n: int) -> tuple[tuple[int, int], ...]:
+    """Factor n > 1 with no prime factor below 1000; returns sorted (prime, exponent) pairs."""
+    if is_prime(n):
+        return ((n, 1),)
+    r = isqrt(n)
+    if r * r == n:
+        return tuple((p, 2 * e) for p, e in _factor_large(r))
+    f = _split(n)
+    merged = dict(_factor_large(f))
+    for p, e in _factor_large(n // f):
+        merged[p] = merged.get(p, 0) + e
+    return tuple(sorted(merged.items()))
+
+
+# ------------------------------------------------------------------------------
+def factorint(n: int) -> dict[int, int]:
+    """Prime factorization of a positive integer of any size.
+
+    Args:
+        n: Integer ≥ 1.
+
+    Returns:
+        Dictionary {prime: exponent}, ascending by prime (empty for n = 1).
+
+    Raises:
+        ValueError: If n < 1.
+    """
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    factors: dict[int, int] = {}
+    x = n
+    for p in _SMALL_PRIMES:
+        if p * p > x:
+            break
+        if x % p == 0:
+            e = 0
+            while x % p == 0:
+                x //= p
+                e += 1
+            factors[p] = e
+    if x > 1:
+        if x < _SMALL_PRIMES[-1] ** 2:
+            factors[x] = 1
+        else:
+            factors.update(_factor_large(x))
+    return factors
+
+
+# ------------------------------------------------------------------------------
+def clear_cache() -> None:
+    """Drop all memoized factorizations."""
+    _factor_large.cache_clear()
+
+
+# ------------------------------------------------------------------------------
+def sigma(n: int) -> int:
+    """Sum of divisors σ(n) of a positive integer of any size.
+
+    Args:
+        n: Integer ≥ 1.
+
+    Returns:
+        σ(n).
+    """
+    return prod((p ** (e + 1) - 1) // (p - 1) for p, e in factorint(n).items())
+
+
+# ------------------------------------------------------------------------------
+def aliquot_sum(n: int) -> int:
+    """Sum of proper divisors s(n) = σ(n) - n.
+
+    Args:
+        n: Integer ≥ 1.
+
+    Returns:
+        s(n).
+    """
+    return sigma(n) - n
+
+
+# ------------------------------------------------------------------------------
+def aliquot_sequence(n: int, *, max_steps: int, max_value: int | None = None) -> list[int]:
+    """Iterate n, s(n), s(s(n)), ... until the sequence ends, cycles or hits a limit.
+
+    The sequence stops at 1, at the first repeated term (the repeat is included), after
+    max_steps iterations, or at the first term above max_value.
+
+    Args:
+        n: Starting value (≥ 1).
+        max_steps: Maximum number of s(.) evaluations.
+        max_value: Optional bound on terms.
+
+    Returns:
+        The terms computed, starting with n.
+
+    Raises:
+        ValueError: If n < 1 or max_steps < 0.
+    """
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    if max_steps < 0:
+        raise ValueError("max_steps must be >= 0")
+    terms = [n]
+    seen = {n}
+    x = n
+    for _ in range(max_steps):
+        if x <= 1 or (max_value is not None and x > max_value):
+            break
+        x = aliquot_sum(x)
+        terms.append(x)
+        if x in seen:
+            break
+        seen.add(x)
+    return terms
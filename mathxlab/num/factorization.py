@@ -0,0 +1,218 @@
+"""Batched integer factorization in CSR layout.
+
+:func:`factorize_batch` factors a whole int64 array at once and returns a :class:`Factorization`.
+Row i holds the prime factorization of n[i] as ``primes[offsets[i]:offsets[i + 1]]`` with
+matching ``exponents``, primes ascending. This is the compressed sparse row (CSR) layout, so
+arithmetic functions reduce to per-entry NumPy work plus one segmented reduction per row.
+
+Values are factored in three vectorized phases:
+
+1. powers of two come from the lowest set bit;
+2. values above the SPF table limit are trial-divided by a shared prime table (one array
+   operation per prime over the values still active). A value leaves this phase once its
+   cofactor fits the SPF table or has no divisor ≤ √cofactor;
+3. everything that fits the table is peeled with SPF lookups (one pass per distinct prime).
+
+Inputs are capped at :data:`MAX_VALUE` (2^48), where the trial-division table needs the primes up
+to 2^24; larger integers belong to :func:`mathxlab.num.factorint.factorint`. Multiplicative
+functions on the result (σ, τ, φ) are computed in int64 and are exact while the function value
+stays below 2^63.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import isqrt
+
+import numpy as np
+
+from mathxlab.num.primes import primes_in_range, primes_up_to
+from mathxlab.num.spf import SpfTable
+
+DEFAULT_SPF_LIMIT = 1 << 24
+"""Largest SPF table :func:`factorize_batch` builds on its own (16 MiB of uint16 codes)."""
+
+MAX_VALUE = 1 << 48
+"""Largest input of :func:`factorize_batch` (trial division then uses the ~1.1M primes < 2^24)."""
+
+_PRUNE_EVERY = 32
+"""Trial-division primes between removals of finished values from the active set."""
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class Factorization:
+    """Prime factorizations of many integers in CSR layout.
+
+    Args:
+        n: The factored integers (int64, shape (m,)).
+        offsets: Row boundaries (int64, shape (m + 1,)).
+        primes: Prime of each entry (int64), ascending within a row.
+        exponents: Exponent of each entry (int64).
+    """
+
+    n: np.ndarray
+    offsets: np.ndarray
+    primes: np.ndarray
+    exponents: np.ndarray
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of distinct prime factors of each n (ω(n))."""
+        return np.diff(self.offsets)
+
+    def row(self, i: int) -> dict[int, int]:
+        """Factorization of n[i] as {prime: exponent}."""
+        lo, hi = int(self.offsets[i]), int(self.offsets[i + 1])
+        return dict(zip(self.primes[lo:hi].tolist(), self.exponents[lo:hi].tolist(), strict=True))
+
+    def _row_prod(self, values: np.ndarray) -> np.ndarray:
+        """Product of per-entry values over each row (1 for n = 1)."""
+        out = np.ones(self.n.size, dtype=np.int64)
+        nonempty = self.counts > 0
+        if values.size:
+            out[nonempty] = np.multiply.reduceat(values, self.offsets[:-1][nonempty])
+        return out
+
+    def _row_sum(self, values: np.ndarray) -> np.ndarray:
+        """Sum of per-entry values over each row (0 for n = 1)."""
+        rows = np.repeat(np.arange(self.n.size), self.counts)
+        return np.bincount(rows, weights=values, minlength=self.n.size).astype(np.int64)
+
+    def _prime_power_sums(self) -> tuple[np.ndarray, np.ndarray]:
+        """Per entry: (p^e, 1 + p + ... + p^e), without intermediate overflow."""
+        p, e = self.primes, self.exponents
+        power = np.ones_like(p)
+        total = np.ones_like(p)
+        for k in range(1, int(e.max(initial=0)) + 1):
+            step = k <= e
+            power = np.where(step, power * p, power)
+            total += np.where(step, power, 0)
+        return power, total
+
+    def sigma(self) -> np.ndarray:
+        """Sum of divisors σ(n)."""
+        return self._row_prod(self._prime_power_sums()[1])
+
+    def tau(self) -> np.ndarray:
+        """Number of divisors τ(n)."""
+        return self._row_prod(self.exponents + 1)
+
+    def phi(self) -> np.ndarray:
+        """Euler's totient φ(n)."""
+        power = self._prime_power_sums()[0]
+        return self._row_prod(power // self.primes * (self.primes - 1))
+
+    def euler_form(self) -> np.ndarray:
+        """Mask of n = q^a * m^2 with q prime, gcd(q, m) = 1 and q ≡ a ≡ 1 (mod 4).
+
+        This is Euler's necessary form for an odd perfect number. Exactly one prime may have
+        an odd exponent, and it must satisfy both congruences.
+        """
+        odd = (self.exponents & 1) == 1
+        good = odd & (self.primes % 4 == 1) & (self.exponents % 4 == 1)
+        return np.asarray((self._row_sum(odd) == 1) & (self._row_sum(good) == 1), dtype=bool)
+
+
+# ------------------------------------------------------------------------------
+def _strip(x: np.ndarray, rows: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """Divide x[rows] by p as often as possible (p divides each once); returns exponents."""
+    x[rows] //= p
+    e = np.ones(rows.size, dtype=np.int64)
+    more = np.flatnonzero(x[rows] % p == 0)
+    while more.size:
+        x[rows[more]] //= p[more]
+        e[more] += 1
+        more = more[x[rows[more]] % p[more] == 0]
+    return e
+
+
+# ------------------------------------------------------------------------------
+def factorize_batch(
+    n: np.ndarray, *, spf: SpfTable | None = None, primes: np.ndarray | None = None
+) -> Factorization:
+    """Factor every integer of an array.
+
+    Args:
+        n: Integers ≥ 1 (any shape; flattened).
+        spf: SPF table used for values up to ``spf.n_max``. Built up to
+            min(max(n), DEFAULT_SPF_LIMIT) if omitted.
+        primes: All primes up to some bound, ascending, for the trial-division phase, e.g.
+            ``primes_up_to(isqrt(n_max))``. Extended with the missing primes if it stops below
+            √max(n); computed if omitted and needed.
+
+    Returns:
+        CSR factorization, one row per input value.
+
+    Raises:
+        ValueError: If a value is < 1 or > MAX_VALUE.
+    """
+    x = np.array(n, dtype=np.int64).ravel()
+    if x.size and int(x.min()) < 1:
+        raise ValueError("values must be >= 1")
+    if x.size and int(x.max()) > MAX_VALUE:
+        raise ValueError("values must be <= 2**48 (use mathxlab.num.factorint for larger n)")
+    n_in = x.copy()
+    top = int(x.max(initial=1))
+    table = spf if spf is not None else SpfTable.build(max(min(top, DEFAULT_SPF_LIMIT), 2))
+
+    rows_out: list[np.ndarray] = []
+    primes_out: list[np.ndarray] = []
+    exps_out: list[np.ndarray] = []
+
+    def emit(rows: np.ndarray, p: np.ndarray | int, e: np.ndarray) -> None:
+        rows_out.append(rows)
+        primes_out.append(np.broadcast_to(np.asarray(p, dtype=np.int64), rows.shape).copy())
+        exps_out.append(e)
+
+    # Phase 1: powers of two.
+    even = np.flatnonzero((x & 1) == 0)
+    if even.size:
+        low = x[even] & -x[even]
+        e2 = np.log2(low.astype(np.float64)).astype(np.int64)  # exact for powers of two
+        x[even] >>= e2
+        emit(even, 2, e2)
+
+    # Phase 2: trial division for values above the SPF table.
+    active = np.flatnonzero(x > table.n_max)
+    if active.size:
+        root = isqrt(int(x[active].max()))
+        plist = primes_up_to(root) if primes is None else np.asarray(primes, dtype=np.int64)
+        covered = int(plist[-1]) if plist.size else 1
+        if covered < root:
+            # Cofactors left after this phase are emitted as primes, which is only sound if
+            # every prime ≤ √cofactor was tried.
+            plist = np.concatenate([plist, primes_in_range(covered + 1, root + 1)])
+        for j, p in enumerate(plist[plist > 2].tolist()):
+            if j % _PRUNE_EVERY == 0:
+                xa = x[active]
+                active = active[(xa > table.n_max) & (p * p <= xa)]
+                if not active.size:
+                    break
+            hit = active[x[active] % p == 0]
+            if hit.size:
+                emit(hit, p, _strip(x, hit, np.full(hit.size, p, dtype=np.int64)))
+        # Cofactors that are still too large for the table have no small divisor: prime.
+        big = np.flatnonzero(x > table.n_max)
+        if big.size:
+            emit(big, x[big].copy(), np.ones(big.size, dtype=np.int64))
+            x[big] = 1
+
+    # Phase 3: SPF peeling.
+    active = np.flatnonzero(x > 1)
+    while active.size:
+        p = table.spf(x[active])
+        emit(active, p, _strip(x, active, p))
+        active = active[x[active] > 1]
+
+    if rows_out:
+        rows = np.concatenate(rows_out)
+        ps = np.concatenate(primes_out)
+        es = np.concatenate(exps_out)
+        order = np.lexsort((ps, rows))
+        rows, ps, es = rows[order], ps[order], es[order]
+    else:
+        rows = ps = es = np.zeros(0, dtype=np.int64)
+    offsets = np.zeros(n_in.size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_in.size), out=offsets[1:])
+    return Factorization(n=n_in, offsets=offsets, primes=ps, exponents=es)
@@ -0,0 +1,252 @@
+"""Block-streaming filter pipelines with per-stage cost accounting.
+
+A :class:`FilterPipeline` applies a sequence of vectorized predicates to a stream of candidate
+blocks (e.g. odd integers in windows of 2^16). Each block flows through the stages lazily, and
+only its survivors reach the next stage. Peak memory is then one block, independent of the
+range size.
+
+Each :class:`FilterStage` declares a relative cost per element and an expected selectivity
+(fraction passed). For independent filters, the expected work is minimized by running stages in
+increasing order of the rank cost / (1 - selectivity). The pipeline starts from the declared
+values. With ``adaptive=True`` it re-sorts after every block using the measured time per element
+and pass rate, which also corrects declarations that were wrong.
+
+Survivors can be consumed as they are produced (:meth:`FilterPipeline.run`) or spilled to a
+directory of ``.npy`` files (:meth:`FilterPipeline.run_to_disk`) and read back memory-mapped
+with :func:`iter_spilled`. Per-stage counters record elements seen and passed plus time spent.
+They are logged after each run.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_SPILL_PATTERN = "survivors_*.npy"
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class FilterStage:
+    """One vectorized filter.
+
+    Args:
+        name: Stage name (unique within a pipeline).
+        predicate: Maps a 1D block to a boolean mask of the same length (True = keep).
+        cost: Declared relative cost per element (any unit, consistent across stages).
+        selectivity: Declared expected fraction of elements passed, in [0, 1].
+    """
+
+    name: str
+    predicate: Callable[[np.ndarray], np.ndarray]
+    cost: float = 1.0
+    selectivity: float = 0.5
+
+    def __post_init__(self) -> None:
+        if not self.cost > 0:
+            raise ValueError("cost must be > 0")
+        if not 0.0 <= self.selectivity <= 1.0:
+            raise ValueError("selectivity must be in [0, 1]")
+
+
+# ------------------------------------------------------------------------------
+@dataclass(slots=True)
+class StageCounters:
+    """Measured work of one stage.
+
+    Args:
+        name: Stage name.
+        seen: Elements that entered the stage.
+        passed: Elements that survived it.
+        seconds: Wall time spent in the predicate.
+    """
+
+    name: str
+    seen: int = 0
+    passed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def survival(self) -> float:
+        """Fraction of seen elements that passed (1.0 before any input)."""
+        return self.passed / self.seen if self.seen else 1.0
+
+    @property
+    def throughput(self) -> float:
+        """Elements per second (inf before any timed input)."""
+        return self.seen / self.seconds if self.seconds > 0 else math.inf
+
+
+# ------------------------------------------------------------------------------
+def arange_blocks(start: int, stop: int, *, step: int = 1, block_size: int) -> Iterator[np.ndarray]:
+    """Yield ``np.arange(start, stop, step)`` in int64 blocks of at most block_size elements.
+
+    Args:
+        start: First value.
+        stop: End (exclusive).
+        step: Positive stride.
+        block_size: Elements per block (≥ 1).
+
+    Yields:
+        Consecutive blocks.
+
+    Raises:
+        ValueError: If step or block_size is < 1.
+    """
+    if step < 1 or block_size < 1:
+        raise ValueError("step and block_size must be >= 1")
+    span = step * block_size
+    for lo in range(start, stop, span):
+        yield np.arange(lo, min(lo + span, stop), step, dtype=np.int64)
+
+
+# ------------------------------------------------------------------------------
+def _rank(cost: float, selectivity: float) -> float:
+    """Ordering key cost / (1 - selectivity); stages that drop nothing go last."""
+    drop = 1.0 - selectivity
+    return cost / drop if drop > 0 else math.inf
+
+
+# ------------------------------------------------------------------------------
+@dataclass(slots=True)
+class FilterPipeline:
+    """Stream blocks through filter stages in cost-effective order.
+
+    Args:
+        stages: Stages to apply (all must pass for an element to survive).
+        adaptive: Re-sort stages after every block by measured time per element and pass rate.
+        min_seen: Elements a stage must have seen before its measurements replace the
+            declared cost and selectivity.
+    """
+
+    stages: list[FilterStage]
+    adaptive: bool = False
+    min_seen: int = 1024
+    counters: dict[str, StageCounters] = field(init=False)
+    order: list[str] = field(init=False)
+    _by_name: dict[str, FilterStage] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        names = [s.name for s in self.stages]
+        if len(set(names)) != len(names):
+            raise ValueError("stage names must be unique")
+        self._by_name = {s.name: s for s in self.stages}
+        self.counters = {n: StageCounters(name=n) for n in names}
+        self.order = sorted(
+            names, key=lambda n: _rank(self._by_name[n].cost, self._by_name[n].selectivity)
+        )
+
+    def _reorder(self) -> None:
+        """Re-sort stages by measured rank where enough data exists, else declared rank."""
+        per_elem = {
+            n: c.seconds / c.seen for n, c in self.counters.items() if c.seen >= self.min_seen
+        }
+        # Declared costs are relative: convert them to seconds with the measured stages' ratio.
+        ratios = [per_elem[n] / self._by_name[n].cost for n in per_elem]
+        scale = sum(ratios) / len(ratios) if ratios else 1.0
+
+        def key(n: str) -> float:
+            c = self.counters[n]
+            if n in per_elem:
+                return _rank(per_elem[n], c.survival)
+            s = self._by_name[n]
+            return _rank(s.cost * scale, s.selectivity)
+
+        new = sorted(self.order, key=key)
+        if new != self.order:
+            logger.info("Filter order changed: %s -> %s", self.order, new)
+            self.order = new
+
+    def filter_block(self, block: np.ndarray) -> np.ndarray:
+        """Apply all stages to one block and update the counters.
+
+        Args:
+            block: 1D candidate block.
+
+        Returns:
+            Survivors, in their original order.
+        """
+        out = block
+        for name in self.order:
+            if out.size == 0:
+                break
+            c = self.counters[name]
+            t0 = perf_counter()
+            keep = np.asarray(self._by_name[name].predicate(out), dtype=bool)
+            c.seconds += perf_counter() - t0
+            c.seen += out.size
+            out = out[keep]
+            c.passed += out.size
+        if self.adaptive:
+            self._reorder()
+        return out
+
+    def run(self, blocks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Filter a stream of blocks lazily.
+
+        Args:
+            blocks: Candidate blocks.
+
+        Yields:
+            Survivors of each block (possibly empty), in input order.
+        """
+        for block in blocks:
+            yield self.filter_block(block)
+        self.log_summary()
+
+    def run_to_disk(self, blocks: Iterable[np.ndarray], directory: Path) -> int:
+        """Filter a stream of blocks and spill non-empty survivor blocks to ``.npy`` files.
+
+        Files from an earlier spill in the same directory are removed first.
+
+        Args:
+            blocks: Candidate blocks.
+            directory: Output directory (created if missing).
+
+        Returns:
+            Total number of survivors written.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        for old in directory.glob(_SPILL_PATTERN):
+            old.unlink()
+        total = 0
+        for i, out in enumerate(self.run(blocks)):
+            if out.size:
+                np.save(directory / f"survivors_{i:08d}.npy", out)
+                total += out.size
+        return total
+
+    def log_summary(self) -> None:
+        """Log survival and throughput per stage, in the current order."""
+        for name in self.order:
+            c = self.counters[name]
+            logger.info(
+                "stage %-24s seen=%d passed=%d survival=%.4f throughput=%.3g/s",
+                name,
+                c.seen,
+                c.passed,
+                c.survival,
+                c.throughput,
+            )
+
+
+# ------------------------------------------------------------------------------
+def iter_spilled(directory: Path) -> Iterator[np.ndarray]:
+    """Read survivor blocks written by :meth:`FilterPipeline.run_to_disk`, in order.
+
+    Args:
+        directory: Spill directory.
+
+    Yields:
+        Memory-mapped survivor blocks.
+    """
+    for path in sorted(directory.glob(_SPILL_PATTERN)):
+        yield np.load(path, mmap_mode="r")
@@ -0,0 +1,262 @@
+"""FFT squaring modulo M_p = 2^p - 1 via the irrational-base discrete weighted transform.
+
+The Crandall–Fagin IBDWT writes a residue x mod M_p with n variable-width digits,
+
+    x = sum_j x_j 2^ceil(p j / n),
+
+where digit j has ceil(p (j+1) / n) - ceil(p j / n) bits (so every width is floor(p/n) or
+ceil(p/n)). Weighting digit j by a_j = 2^(ceil(p j / n) - p j / n) turns the cyclic convolution
+of a length-n real FFT into multiplication modulo 2^p - 1, so there is no zero padding and no
+separate reduction step. The carry out of the top digit wraps to digit 0 because 2^p ≡ 1.
+
+Digits are kept balanced (|x_j| ≤ 2^(b_j - 1)), which keeps convolution outputs near
+sqrt(n) 2^(2b) and lets float64 FFTs carry about 18-20 bits per digit. After each inverse
+transform every output should be within rounding distance of an integer. The largest distance
+seen is tracked as the round-off error, and a result is rejected once it reaches
+``max_roundoff``.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from time import monotonic
+
+import numpy as np
+
+from mathxlab.num.mersenne_checkpoint import LltCheckpointer, LltState
+
+DEFAULT_MAX_ROUNDOFF = 0.4
+_MAX_BITS_BASE = 23.5  # digit width budget at n = 1; shrinks by log2(n) / 4 as n grows
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class IbdwtPlan:
+    """Precomputed digit layout and weights for one (p, n).
+
+    Args:
+        p: Mersenne exponent.
+        n: FFT length (number of digits).
+        shifts: Bit position ceil(p j / n) of each digit.
+        bits: Width b_j of each digit.
+        base: 2^b_j as float64.
+        weight: Forward weights a_j.
+        inv_weight: Inverse weights 1 / a_j (``irfft`` already divides by n).
+    """
+
+    p: int
+    n: int
+    shifts: np.ndarray
+    bits: np.ndarray
+    base: np.ndarray
+    weight: np.ndarray
+    inv_weight: np.ndarray
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class IbdwtResult:
+    """Outcome of an IBDWT Lucas–Lehmer run.
+
+    Args:
+        residue: Final residue s_(p-2) mod M_p (0 iff M_p is prime).
+        fft_length: FFT length used.
+        max_roundoff: Largest distance of an inverse-transform output from an integer.
+    """
+
+    residue: int
+    fft_length: int
+    max_roundoff: float
+
+
+# ------------------------------------------------------------------------------
+def max_digit_bits(n: int) -> float:
+    """Average digit width that float64 FFTs of length n handle with a safe round-off margin.
+
+    Args:
+        n: FFT length.
+
+    Returns:
+        Upper bound for p / n.
+    """
+    return _MAX_BITS_BASE - 0.25 * math.log2(n)
+
+
+# ------------------------------------------------------------------------------
+def choose_fft_length(p: int) -> int:
+    """Smallest FFT length of the form {1, 3, 5} * 2^k that keeps p / n within budget.
+
+    Args:
+        p: Mersenne exponent.
+
+    Returns:
+        FFT length n (n ≤ p, so every digit has at least one bit).
+    """
+    k = 2
+    while True:
+        # Candidates in increasing order within the octave [2^k, 2^(k+1)).
+        for n in (1 << k, 5 << (k - 2), 3 << (k - 1)):
+            if p / n <= max_digit_bits(n):
+                return min(n, p)
+        k += 1
+
+
+# ------------------------------------------------------------------------------
+def make_plan(p: int, n: int | None = None) -> IbdwtPlan:
+    """Build the digit layout and weights for squaring modulo 2^p - 1.
+
+    Args:
+        p: Mersenne exponent (must be ≥ 3).
+        n: FFT length; chosen with :func:`choose_fft_length` if omitted.
+
+    Returns:
+        The plan.
+
+    Raises:
+        ValueError: If p < 3 or n is not in [2, p].
+    """
+    if p < 3:
+        raise ValueError("p must be >= 3")
+    if n is None:
+        n = choose_fft_length(p)
+    if not 2 <= n <= p:
+        raise ValueError("fft length must satisfy 2 <= n <= p")
+
+    j = np.arange(n, dtype=np.int64)
+    shifts = -((-p * j) // n)
+    bits = np.diff(np.append(shifts, p))
+    # ceil(p j / n) - p j / n = (n ceil(p j / n) - p j) / n, with an exact integer numerator.
+    weight = np.exp2((n * shifts - p * j) / n)
+    return IbdwtPlan(
+        p=p,
+        n=n,
+        shifts=shifts,
+        bits=bits,
+        base=np.exp2(bits.astype(np.float64)),
+        weight=weight,
+        inv_weight=1.0 / weight,
+    )
+
+
+# ------------------------------------------------------------------------------
+def _balance(z: np.ndarray, plan: IbdwtPlan) -> np.ndarray:
+    """Propagate carries (with wraparound) until every digit is in [-2^(b-1), 2^(b-1)).
+
+    Each pass is fully vectorized; carries shrink by about b bits per pass, so a handful of
+    passes suffice for convolution outputs.
+    """
+    for _ in range(plan.n + 2):
+        carry = np.floor(z / plan.base + 0.5)
+        if not carry.any():
+            return z
+        z -= carry * plan.base
+        z += np.roll(carry, 1)
+    raise RuntimeError("carry propagation did not converge")
+
+
+# ------------------------------------------------------------------------------
+def to_digits(x: int, plan: IbdwtPlan) -> np.ndarray:
+    """Convert 0 ≤ x < 2^p to balanced IBDWT digits.
+
+    Args:
+        x: Residue.
+        plan: Digit layout.
+
+    Returns:
+        float64 digit vector of length n.
+    """
+    p = plan.p
+    raw = np.frombuffer(x.to_bytes((p + 7) // 8, "little"), dtype=np.uint8)
+    bit = np.unpackbits(raw, bitorder="little")[:p].astype(np.float64)
+    owner = np.repeat(np.arange(plan.n), plan.bits)
+    z = np.add.reduceat(bit * np.exp2(np.arange(p) - plan.shifts[owner]), plan.shifts)
+    return _balance(z, plan)
+
+
+# ------------------------------------------------------------------------------
+def _pack(d: np.ndarray, plan: IbdwtPlan) -> int:
+    """Pack non-negative digits d_j < 2^b_j into the integer sum d_j 2^shift_j."""
+    owner = np.repeat(np.arange(plan.n), plan.bits)
+    offset = np.arange(plan.p) - plan.shifts[owner]
+    bit = ((d.astype(np.int64)[owner] >> offset) & 1).astype(np.uint8)
+    return int.from_bytes(np.packbits(bit, bitorder="little").tobytes(), "little")
+
+
+# ------------------------------------------------------------------------------
+def from_digits(z: np.ndarray, plan: IbdwtPlan) -> int:
+    """Convert balanced digits back to the residue in [0, M_p).
+
+    Args:
+        z: Balanced digit vector.
+        plan: Digit layout.
+
+    Returns:
+        The residue.
+    """
+    mp = (1 << plan.p) - 1
+    return (_pack(np.maximum(z, 0.0), plan) - _pack(np.maximum(-z, 0.0), plan)) % mp
+
+
+# ------------------------------------------------------------------------------
+def square_digits(z: np.ndarray, plan: IbdwtPlan, *, subtract: int = 0) -> tuple[np.ndarray, float]:
+    """Compute z² - subtract modulo M_p in digit form.
+
+    Args:
+        z: Balanced digit vector.
+        plan: Digit layout.
+        subtract: Small integer subtracted before carrying (2 for the LLT).
+
+    Returns:
+        (balanced digits of the result, round-off error of this squaring).
+    """
+    spectrum = np.fft.rfft(z * plan.weight)
+    conv = np.fft.irfft(spectrum * spectrum, n=plan.n)
+    conv *= plan.inv_weight
+    out = np.rint(conv)
+    err = float(np.max(np.abs(conv - out)))
+    out[0] -= subtract
+    return _balance(out, plan), err
+
+
+# ------------------------------------------------------------------------------
+def lucas_lehmer_residue_ibdwt(
+    p: int,
+    *,
+    fft_length: int | None = None,
+    max_roundoff: float = DEFAULT_MAX_ROUNDOFF,
+    start: LltState | None = None,
+    checkpoint: LltCheckpointer | None = None,
+) -> IbdwtResult:
+    """Run the Lucas–Lehmer test for M_p with IBDWT squaring.
+
+    Args:
+        p: Prime exponent (must be ≥ 3).
+        fft_length: FFT length; chosen with :func:`choose_fft_length` if omitted.
+        max_roundoff: Abort once any output lies this far (or farther) from an integer.
+        start: Resume from this state instead of s_0 = 4.
+        checkpoint: Save progress every ``checkpoint.interval`` seconds.
+
+    Returns:
+        Final residue with the FFT length and round-off error observed.
+
+    Raises:
+        RuntimeError: If the round-off error reaches ``max_roundoff`` (use a longer FFT).
+    """
+    plan = make_plan(p, fft_length)
+    first = 0 if start is None else start.iteration
+    z = to_digits(4 if start is None else start.s, plan)
+    worst = 0.0
+    next_save = math.inf if checkpoint is None else monotonic() + checkpoint.interval
+    for i in range(first, p - 2):
+        z, err = square_digits(z, plan, subtract=2)
+        if err > worst:
+            worst = err
+            if worst >= max_roundoff:
+                raise RuntimeError(
+                    f"round-off error {worst:.3f} at iteration {i} for p={p}, n={plan.n}"
+                )
+        if checkpoint is not None and monotonic() >= next_save:
+            checkpoint.save(LltState(p=p, iteration=i + 1, s=from_digits(z, plan)))
+            next_save = monotonic() + checkpoint.interval
+    return IbdwtResult(residue=from_digits(z, plan), fft_length=plan.n, max_roundoff=worst)
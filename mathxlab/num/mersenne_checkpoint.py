@@ -0,0 +1,111 @@
+"""Checkpoints for long-running Lucas–Lehmer tests.
+
+A checkpoint stores (p, iteration, s) for one exponent in ``<directory>/llt_p<p>.ckpt``. The file
+has a one-line JSON header, with the algorithm tag and a CRC32 of the residue, followed by the
+raw residue bytes. Files are written to a temporary name, flushed, and moved into place with
+``os.replace``, so a crash mid-write leaves the previous checkpoint intact.
+
+A checkpoint is ignored on load if its header, tag, or CRC do not match. That test then starts
+over instead of continuing from a corrupt or incompatible state.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_INTERVAL_S = 300.0
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class LltState:
+    """Progress of one Lucas–Lehmer test.
+
+    Args:
+        p: Exponent.
+        iteration: Number of completed iterations (0 ≤ iteration ≤ p - 2).
+        s: Residue after ``iteration`` iterations.
+    """
+
+    p: int
+    iteration: int
+    s: int
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class LltCheckpointer:
+    """Where and how often to checkpoint Lucas–Lehmer tests.
+
+    The object only holds configuration, so it can be pickled into worker processes; each
+    exponent has its own file.
+
+    Args:
+        directory: Directory for checkpoint files (created on first save).
+        algorithm: Algorithm tag written to and required from checkpoints.
+        interval: Minimum wall-clock seconds between saves for one test.
+        resume: If False, existing checkpoints are ignored (and later overwritten).
+    """
+
+    directory: Path
+    algorithm: str
+    interval: float = DEFAULT_INTERVAL_S
+    resume: bool = True
+
+    def path(self, p: int) -> Path:
+        """Checkpoint file for exponent p."""
+        return self.directory / f"llt_p{p}.ckpt"
+
+    def load(self, p: int) -> LltState | None:
+        """Return the saved state for p, if resuming and a valid checkpoint exists."""
+        if not self.resume:
+            return None
+        try:
+            raw = self.path(p).read_bytes()
+        except OSError:
+            return None
+        head, _, body = raw.partition(b"\n")
+        try:
+            meta = json.loads(head)
+        except ValueError:
+            return None
+        if (
+            meta.get("p") != p
+            or meta.get("algorithm") != self.algorithm
+            or meta.get("crc32") != zlib.crc32(body)
+            or not 0 <= meta.get("iteration", -1) <= p - 2
+        ):
+            return None
+        return LltState(p=p, iteration=meta["iteration"], s=int.from_bytes(body, "little"))
+
+    def save(self, state: LltState) -> None:
+        """Atomically write a checkpoint.
+
+        Args:
+            state: Progress to save.
+        """
+        body = state.s.to_bytes((state.s.bit_length() + 7) // 8, "little")
+        head = json.dumps(
+            {
+                "p": state.p,
+                "iteration": state.iteration,
+                "algorithm": self.algorithm,
+                "crc32": zlib.crc32(body),
+            }
+        ).encode("utf-8")
+        path = self.path(state.p)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as fh:
+            fh.write(head + b"\n" + body)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+
+    def clear(self, p: int) -> None:
+        """Remove the checkpoint for p (after the test has finished)."""
+        self.path(p).unlink(missing_ok=True)
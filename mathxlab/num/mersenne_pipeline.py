@@ -0,0 +1,447 @@
+"""Staged Mersenne survey: trial factoring, then P-1, then Lucas–Lehmer.
+
+Most M_p with p prime are composite, and many have a small factor that is far cheaper to find
+than a full Lucas–Lehmer test (LLT). :class:`MersennePipeline` sends each exponent through
+three stages and stops at the first one that decides it:
+
+1. trial factoring (:mod:`mathxlab.num.trial_factor`) up to 2^tf_bits,
+2. P-1 (:mod:`mathxlab.num.pminus1`) with bounds B1, B2,
+3. the LLT (:func:`~mathxlab.num.mersenne_scan.scan_lucas_lehmer`) for the survivors.
+
+The depth of each filter comes from :class:`CostModel`, a per-exponent estimate of the time for
+an LLT, a trial-factoring bit level, and a P-1 run. Each stage gets the depth that maximizes
+expected time saved, i.e. the chance it eliminates p times the LLT time, minus its own cost.
+Two heuristics supply the chances:
+
+- M_p has a factor between 2^(b-1) and 2^b with probability about 1/b.
+- P-1 catches such a factor q when (q - 1) / 2p is smooth. The Dickman function estimates how
+  likely that is.
+
+A stage whose best depth has no positive expected gain is skipped. Small exponents therefore go
+straight to the LLT.
+
+With a :class:`~mathxlab.num.mersenne_store.MersenneStore`, known LLT results and known factors
+decide an exponent without any work. Trial factoring and P-1 also record their progress there.
+Per-stage counts and times are collected in :attr:`MersennePipeline.stats`.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import cache
+from time import process_time
+
+import numpy as np
+
+from mathxlab.num.mersenne import FFT_CROSSOVER, LLT_ALGORITHM
+from mathxlab.num.mersenne_checkpoint import LltCheckpointer
+from mathxlab.num.mersenne_scan import scan_lucas_lehmer
+from mathxlab.num.mersenne_store import MersenneStore
+from mathxlab.num.modarith import MAX_MODULUS
+from mathxlab.num.pminus1 import PM1_ALGORITHM, cached_pminus1, pminus1
+from mathxlab.num.primes import primes_up_to
+from mathxlab.num.trial_factor import TF_ALGORITHM, extend_trial_factor, trial_factor
+
+STAGES = ("tf", "pm1", "llt")
+_TF_MAX_BITS = MAX_MODULUS.bit_length() - 1  # q_max = 2^bits - 1 must stay below 2^50
+_PM1_B1_GRID = tuple(100 * 2**i for i in range(15))  # 100 .. ~1.6e6
+_PM1_B2_RATIOS = (1, 10, 30, 100)  # ratio 1 = stage 1 only
+_PM1_EXTRA_BITS = 128  # bit levels above the TF depth considered for P-1 success
+_RHO_STEP = 1 / 128
+_RHO_MAX = 40.0
+
+
+# ------------------------------------------------------------------------------
+@cache
+def _rho_table() -> np.ndarray:
+    """Dickman rho on the grid 0, h, 2h, ..., _RHO_MAX (h = 1/128).
+
+    Integrates rho'(u) = -rho(u - 1) / u with the trapezoid rule.
+    """
+    n = round(_RHO_MAX / _RHO_STEP) + 1
+    per_unit = round(1 / _RHO_STEP)
+    u = np.arange(n) * _RHO_STEP
+    rho = np.ones(n)
+    for i in range(per_unit + 1, n):
+        f0 = rho[i - 1 - per_unit] / u[i - 1]
+        f1 = rho[i - per_unit] / u[i]
+        rho[i] = max(rho[i - 1] - 0.5 * _RHO_STEP * (f0 + f1), 0.0)
+    return rho
+
+
+# ------------------------------------------------------------------------------
+def dickman_rho(u: np.ndarray | float) -> np.ndarray:
+    """Dickman's rho: the chance that a random integer n has no prime factor above n^(1/u).
+
+    Args:
+        u: Values ≥ 0 (anything above 40 returns 0).
+
+    Returns:
+        rho(u), interpolated from a precomputed table.
+    """
+    uu = np.asarray(u, dtype=np.float64)
+    table = _rho_table()
+    return np.asarray(np.interp(uu, np.arange(table.size) * _RHO_STEP, table, right=0.0))
+
+
+# ------------------------------------------------------------------------------
+def smooth_probability(k: np.ndarray, b1: int, b2: int) -> np.ndarray:
+    """Chance that k is B1-smooth apart from at most one prime in (B1, B2].
+
+    Uses rho(u) + ∫_1^s rho(u - t) / t dt with u = ln k / ln B1 and s = ln B2 / ln B1.
+
+    Args:
+        k: Values (> 1) to estimate for.
+        b1: Smoothness bound (≥ 2).
+        b2: Single-large-prime bound (≥ b1).
+
+    Returns:
+        Estimated probabilities, same shape as k.
+    """
+    u = np.log(np.asarray(k, dtype=np.float64)) / math.log(b1)
+    p = dickman_rho(u)
+    s = math.log(b2) / math.log(b1)
+    if s > 1.0:
+        t = np.linspace(1.0, s, 17)
+        w = np.full(t.size, (s - 1.0) / (t.size - 1))
+        w[[0, -1]] *= 0.5
+        p = p + (dickman_rho(np.maximum(u[..., None] - t, 0.0)) * (w / t)).sum(axis=-1)
+    return np.asarray(np.minimum(p, 1.0), dtype=np.float64)
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class CostModel:
+    """Time estimates (seconds) for each stage, fitted to this package's kernels.
+
+    Defaults come from timings on a single desktop core. Only ratios between the stages matter
+    for the plan, so they carry over reasonably to other machines.
+
+    Args:
+        int_square_base: Fixed cost of one big-int modular squaring.
+        int_square_coeff: Coefficient c in c * p^1.58 for a big-int squaring.
+        fft_square_base: Fixed (NumPy dispatch) cost of one IBDWT squaring.
+        fft_square_coeff: Coefficient c in c * p * log2(p) for an IBDWT squaring.
+        pm1_mul_ratio: Cost of one P-1 modular multiplication relative to a big-int squaring.
+        tf_call: Fixed cost of one trial-factoring call.
+        tf_candidate: Cost per candidate q that reaches the 2^p mod q kernel.
+        tf_survivors: Share of k values that survive the class filter and the sieve.
+    """
+
+    int_square_base: float = 1e-6
+    int_square_coeff: float = 2.7e-11
+    fft_square_base: float = 1.5e-4
+    fft_square_coeff: float = 1.5e-10
+    pm1_mul_ratio: float = 1.5
+    tf_call: float = 1e-3
+    tf_candidate: float = 6e-7
+    tf_survivors: float = 0.05
+
+    def int_square_seconds(self, p: int) -> float:
+        """One squaring modulo M_p with Python integers."""
+        return self.int_square_base + self.int_square_coeff * float(p**1.58)
+
+    def llt_seconds(self, p: int) -> float:
+        """One full LLT with the ``auto`` backend."""
+        if p < FFT_CROSSOVER:
+            return p * self.int_square_seconds(p)
+        return p * (self.fft_square_base + self.fft_square_coeff * p * math.log2(p))
+
+    def tf_level_seconds(self, p: int, bits: int) -> float:
+        """Trial factoring the candidates q in (2^(bits-1), 2^bits]."""
+        return self.tf_candidate * self.tf_survivors * 2.0 ** (bits - 1) / (2 * p)
+
+    def pm1_seconds(self, p: int, b1: int, b2: int) -> float:
+        """P-1 with bounds (b1, b2); b2 ≤ b1 means stage 1 only."""
+        ops = math.log2(math.e) * b1
+        if b2 > b1:
+            ops += 2.0 * (b2 / math.log(b2) - b1 / math.log(b1))
+        return ops * self.pm1_mul_ratio * self.int_square_seconds(p)
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class StagePlan:
+    """Filter depths chosen for one exponent.
+
+    Args:
+        p: Exponent.
+        tf_bits: Trial factor up to q < 2^tf_bits (0 skips trial factoring).
+        b1: P-1 stage-1 bound (0 skips P-1).
+        b2: P-1 stage-2 bound (equal to b1 for stage 1 only).
+        llt_seconds: Estimated LLT time the filters try to save.
+    """
+
+    p: int
+    tf_bits: int
+    b1: int
+    b2: int
+    llt_seconds: float
+
+
+# ------------------------------------------------------------------------------
+def plan_stages(p: int, cost: CostModel) -> StagePlan:
+    """Choose trial-factoring depth and P-1 bounds for M_p by expected time saved.
+
+    Trial factoring goes one bit level at a time while a level's chance (1/b) times the LLT
+    time exceeds its cost. It is dropped entirely if the total gain does not cover the per-call
+    overhead. P-1 then picks the (B1, B2) pair with the largest positive expected gain, counting
+    only factors above the trial-factoring depth.
+
+    Args:
+        p: Odd prime exponent.
+        cost: Time estimates.
+
+    Returns:
+        The plan (zero depths for stages that do not pay off).
+    """
+    llt = cost.llt_seconds(p)
+    b_lo = (2 * p + 1).bit_length()
+    tf_bits, gain = 0, -cost.tf_call
+    for b in range(b_lo, _TF_MAX_BITS + 1):
+        level_gain = llt / b - cost.tf_level_seconds(p, b)
+        if level_gain <= 0:
+            break
+        tf_bits, gain = b, gain + level_gain
+    if gain <= 0:
+        tf_bits = 0
+
+    bits = np.arange(max(tf_bits, b_lo - 1) + 1, min(p, max(tf_bits, b_lo) + _PM1_EXTRA_BITS))
+    # Representative k = (q - 1) / 2p for q in the middle of each level.
+    k = np.maximum(2.0 ** (bits - 0.5) / (2 * p), 2.0)
+    best = (0.0, 0, 0)
+    # Success chance grows with the bounds, so the largest bounds give an upper bound on any
+    # gain. Most exponents are settled by this single estimate.
+    top = float((smooth_probability(k, _PM1_B1_GRID[-1], _PM1_B1_GRID[-1] * 100) / bits).sum())
+    if top * llt > cost.pm1_seconds(p, _PM1_B1_GRID[0], _PM1_B1_GRID[0]):
+        for b1 in _PM1_B1_GRID:
+            for ratio in _PM1_B2_RATIOS:
+                b2 = b1 * ratio
+                if cost.pm1_seconds(p, b1, b2) >= top * llt:
+                    continue
+                chance = float((smooth_probability(k, b1, b2) / bits).sum())
+                net = chance * llt - cost.pm1_seconds(p, b1, b2)
+                if net > best[0]:
+                    best = (net, b1, b2)
+    return StagePlan(p=p, tf_bits=tf_bits, b1=best[1], b2=best[2], llt_seconds=llt)
+
+
+# ------------------------------------------------------------------------------
+@dataclass(slots=True)
+class StageStats:
+    """Work done by one pipeline stage.
+
+    Args:
+        name: Stage name ("tf", "pm1" or "llt").
+        tested: Exponents that entered the stage.
+        eliminated: Exponents decided by the stage (for "llt": all that finished).
+        cached: Of those decided, how many were answered from the store.
+        seconds: CPU time spent in the stage (worker time for the LLT).
+    """
+
+    name: str
+    tested: int = 0
+    eliminated: int = 0
+    cached: int = 0
+    seconds: float = 0.0
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class PipelineResult:
+    """Outcome for one exponent.
+
+    Args:
+        p: Exponent.
+        is_prime: True iff M_p is prime.
+        stage: Stage that decided the exponent ("tf", "pm1" or "llt").
+        factor: Proper factor found by trial factoring or P-1 (None if M_p is prime or the LLT
+            decided).
+        seconds: Time spent on the deciding stage. A cached LLT reports its recorded time; the
+            store keeps no timings for trial factoring or P-1, so their cached decisions report
+            0.0.
+        cached: True if the deciding result came from the store.
+    """
+
+    p: int
+    is_prime: bool
+    stage: str
+    factor: int | None
+    seconds: float
+    cached: bool = False
+
+
+# ------------------------------------------------------------------------------
+def _tf_decision(p: int, factor: int, *, seconds: float, cached: bool = False) -> PipelineResult:
+    """Result for a trial-factoring hit (for tiny p the smallest divisor can be M_p itself)."""
+    prime = factor == (1 << p) - 1
+    return PipelineResult(
+        p=p,
+        is_prime=prime,
+        stage="tf",
+        factor=None if prime else factor,
+        seconds=seconds,
+        cached=cached,
+    )
+
+
+# ------------------------------------------------------------------------------
+@dataclass(slots=True)
+class MersennePipeline:
+    """Trial factoring -> P-1 -> LLT survey with cost-model-driven filter depths.
+
+    Trial factoring and P-1 run in this process. The LLT runs through
+    :func:`~mathxlab.num.mersenne_scan.scan_lucas_lehmer` (process pool, store, checkpoints).
+
+    Args:
+        cost: Time estimates used to plan each exponent.
+        workers: LLT worker processes (default: ``os.cpu_count()``).
+        backend: LLT squaring backend.
+        store: Optional store for LLT results, factoring progress, and P-1 outcomes.
+        checkpoint: Optional checkpoint policy for long LLTs.
+    """
+
+    cost: CostModel = field(default_factory=CostModel)
+    workers: int | None = None
+    backend: str = "auto"
+    store: MersenneStore | None = None
+    checkpoint: LltCheckpointer | None = None
+    stats: dict[str, StageStats] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.stats = {name: StageStats(name=name) for name in STAGES}
+
+    def _known(self, ps: list[int]) -> dict[int, PipelineResult]:
+        """Exponents the store already decides, preferring the cheapest stage."""
+        if self.store is None:
+            return {}
+        known: dict[int, PipelineResult] = {}
+        for llt in self.store.get_llt(ps, algorithm=LLT_ALGORITHM).values():
+            known[llt.p] = PipelineResult(
+                p=llt.p,
+                is_prime=llt.is_prime,
+                stage="llt",
+                factor=None,
+                seconds=llt.seconds,
+                cached=True,
+            )
+        for pm1 in self.store.get_pm1(ps, algorithm=PM1_ALGORITHM).values():
+            if pm1.factor is not None:
+                known[pm1.p] = PipelineResult(
+                    p=pm1.p,
+                    is_prime=False,
+                    stage="pm1",
+                    factor=pm1.factor,
+                    seconds=0.0,
+                    cached=True,
+                )
+        for tf in self.store.get_tf(ps, algorithm=TF_ALGORITHM).values():
+            if tf.factor is not None:
+                known[tf.p] = _tf_decision(tf.p, tf.factor, seconds=0.0, cached=True)
+        return known
+
+    def _filter(self, plan: StagePlan, primes: np.ndarray) -> PipelineResult | None:
+        """Run trial factoring and P-1 for one exponent; None if it survives both."""
+        p = plan.p
+        if plan.tf_bits:
+            st = self.stats["tf"]
+            st.tested += 1
+            t0 = process_time()
+            q_max = (1 << plan.tf_bits) - 1
+            if self.store is None:
+                tf = trial_factor(p, q_max=q_max)
+            else:
+                tf = extend_trial_factor(p, q_max=q_max, store=self.store)
+            dt = process_time() - t0
+            st.seconds += dt
+            if tf.factor is not None:
+                st.eliminated += 1
+                return _tf_decision(p, tf.factor, seconds=dt)
+        if plan.b1:
+            st = self.stats["pm1"]
+            st.tested += 1
+            t0 = process_time()
+            if self.store is None:
+                pm1 = pminus1(p, b1=plan.b1, b2=plan.b2, primes=primes)
+            else:
+                pm1 = cached_pminus1(p, b1=plan.b1, b2=plan.b2, store=self.store, primes=primes)
+            dt = process_time() - t0
+            st.seconds += dt
+            if pm1.factor is not None:
+                st.eliminated += 1
+                return PipelineResult(
+                    p=p, is_prime=False, stage="pm1", factor=pm1.factor, seconds=dt
+                )
+        return None
+
+    def run(self, exponents: Iterable[int]) -> Iterator[PipelineResult]:
+        """Decide M_p for every exponent.
+
+        The filters run for all exponents first. The LLT survivors are then scanned, and results
+        are yielded as the scan produces them, in input order.
+
+        Args:
+            exponents: Odd prime exponents (p = 2 is passed straight to the LLT).
+
+        Yields:
+            One result per exponent, in input order.
+        """
+        ps = [int(p) for p in exponents]
+        decided = self._known(ps)
+        res: PipelineResult | None
+        for res in decided.values():
+            st = self.stats[res.stage]
+            st.tested += 1
+            st.eliminated += 1
+            st.cached += 1
+
+        plans = [plan_stages(p, self.cost) for p in sorted(set(ps) - decided.keys()) if p > 2]
+        b_max = max((pl.b2 for pl in plans if pl.b1), default=0)
+        primes = primes_up_to(b_max) if b_max else np.empty(0, dtype=np.int64)
+        for pl in plans:
+            res = self._filter(pl, primes)
+            if res is not None:
+                decided[pl.p] = res
+
+        survivors = [p for p in ps if p not in decided]
+        llt = self.stats["llt"]
+        scan = scan_lucas_lehmer(
+            survivors,
+            workers=self.workers,
+            backend=self.backend,
+            store=self.store,
+            checkpoint=self.checkpoint,
+        )
+        for p in ps:
+            if p in decided:
+                yield decided[p]
+                continue
+            r = next(scan)
+            llt.tested += 1
+            llt.eliminated += 1
+            if r.cached:
+                llt.cached += 1
+            else:
+                llt.seconds += r.seconds
+            yield PipelineResult(
+                p=r.p,
+                is_prime=r.is_prime,
+                stage="llt",
+                factor=None,
+                seconds=r.seconds,
+                cached=r.cached,
+            )
+
+    def report_lines(self) -> list[str]:
+        """Markdown table of per-stage counts and times."""
+        lines = [
+            "| stage | tested | decided | from cache | CPU seconds |",
+            "|:---|---:|---:|---:|---:|",
+        ]
+        for s in self.stats.values():
+            lines.append(
+                f"| {s.name} | {s.tested} | {s.eliminated} | {s.cached} | {s.seconds:.3f} |"
+            )
+        return lines
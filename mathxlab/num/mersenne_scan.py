@@ -0,0 +1,162 @@
+"""Parallel Lucas–Lehmer scans over many exponents.
+
+The cost of one Lucas–Lehmer test grows roughly like p^2 to p^3, so in a scan over ascending
+exponents the last few tests dominate. :func:`scan_lucas_lehmer` distributes the tests over a
+process pool and submits the most expensive exponents first (longest-processing-time-first
+scheduling). No large job is then left to start at the end while other workers sit idle.
+Runs of cheap exponents share one task, so inter-process overhead stays small relative to the
+work itself.
+
+Results are yielded in input order, each with the time the test took in its worker. With a
+:class:`~mathxlab.num.mersenne_store.MersenneStore`, already-tested exponents are answered from
+the store. Workers write each new result as soon as it is computed, so an interrupted scan
+keeps its finished work. With an :class:`~mathxlab.num.mersenne_checkpoint.LltCheckpointer`,
+long individual tests save their progress as they run and can be resumed as well.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+
+from mathxlab.num.mersenne import LLT_ALGORITHM, lucas_lehmer_residue
+from mathxlab.num.mersenne_checkpoint import LltCheckpointer
+from mathxlab.num.mersenne_store import LltRecord, MersenneStore
+
+_COST_EXPONENT = 2.5  # rough growth of LLT cost in p across the int and FFT backends
+_TASKS_PER_WORKER = 16  # batching granularity: ~this many tasks per worker in total
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class LucasLehmerResult:
+    """Outcome of one Lucas–Lehmer test.
+
+    Args:
+        p: Exponent tested.
+        is_prime: True iff M_p = 2^p - 1 is prime.
+        seconds: Wall-clock time of the test inside its worker (as recorded, if cached).
+        cached: True if the result came from the store.
+    """
+
+    p: int
+    is_prime: bool
+    seconds: float
+    cached: bool = False
+
+
+# ------------------------------------------------------------------------------
+def _run_batch(
+    exponents: list[int],
+    backend: str,
+    store: MersenneStore | None,
+    checkpoint: LltCheckpointer | None,
+) -> list[LucasLehmerResult]:
+    """Test a batch of exponents sequentially (executed inside a worker process)."""
+    out: list[LucasLehmerResult] = []
+    for p in exponents:
+        t0 = perf_counter()
+        residue = lucas_lehmer_residue(p, backend=backend, checkpoint=checkpoint)
+        dt = perf_counter() - t0
+        if store is not None:
+            store.put_llt(LltRecord(p=p, algorithm=LLT_ALGORITHM, residue=residue, seconds=dt))
+        out.append(LucasLehmerResult(p=p, is_prime=residue == 0, seconds=dt))
+    return out
+
+
+# ------------------------------------------------------------------------------
+def plan_batches(exponents: list[int], *, workers: int) -> list[list[int]]:
+    """Group exponents into tasks, most expensive first.
+
+    Exponents are sorted by decreasing p and packed greedily until a task reaches about
+    1 / (workers * 16) of the estimated total cost. Large exponents therefore run alone, while
+    runs of small ones share a task.
+
+    Args:
+        exponents: Exponents to test.
+        workers: Number of worker processes.
+
+    Returns:
+        Batches in submission order (largest estimated cost first).
+    """
+    order = sorted(exponents, reverse=True)
+    costs = [float(p) ** _COST_EXPONENT for p in order]
+    target = sum(costs) / (workers * _TASKS_PER_WORKER)
+
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    acc = 0.0
+    for p, c in zip(order, costs, strict=True):
+        batch.append(p)
+        acc += c
+        if acc >= target:
+            batches.append(batch)
+            batch, acc = [], 0.0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+# ------------------------------------------------------------------------------
+def scan_lucas_lehmer(
+    exponents: Iterable[int],
+    *,
+    workers: int | None = None,
+    backend: str = "auto",
+    store: MersenneStore | None = None,
+    checkpoint: LltCheckpointer | None = None,
+) -> Iterator[LucasLehmerResult]:
+    """Run Lucas–Lehmer tests for many exponents, in parallel if workers > 1.
+
+    Args:
+        exponents: Exponents to test (prime p ≥ 2).
+        workers: Number of worker processes (default: ``os.cpu_count()``). With 1 worker the
+            tests run in this process.
+        backend: Squaring backend passed to :func:`~mathxlab.num.mersenne.lucas_lehmer_residue`.
+        store: Optional result store that is consulted first and receives new results.
+        checkpoint: Optional checkpoint policy for the individual tests. Seconds reported for a
+            resumed test only cover the resumed part.
+
+    Yields:
+        One result per exponent, in input order.
+
+    Raises:
+        ValueError: If workers < 1.
+    """
+    ps = [int(p) for p in exponents]
+    n_workers = (os.cpu_count() or 1) if workers is None else workers
+    if n_workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    done: dict[int, LucasLehmerResult] = {}
+    if store is not None:
+        for rec in store.get_llt(ps, algorithm=LLT_ALGORITHM).values():
+            done[rec.p] = LucasLehmerResult(
+                p=rec.p, is_prime=rec.is_prime, seconds=rec.seconds, cached=True
+            )
+    todo = sorted({p for p in ps if p not in done})
+
+    if n_workers == 1 or len(todo) <= 1:
+        for p in ps:
+            if p not in done:
+                done.update((r.p, r) for r in _run_batch([p], backend, store, checkpoint))
+            yield done[p]
+        return
+
+    pool = ProcessPoolExecutor(max_workers=n_workers)
+    try:
+        pending: dict[int, Future[list[LucasLehmerResult]]] = {}
+        for batch in plan_batches(todo, workers=n_workers):
+            fut = pool.submit(_run_batch, batch, backend, store, checkpoint)
+            for p in batch:
+                pending[p] = fut
+
+        for p in ps:
+            if p not in done:
+                done.update((r.p, r) for r in pending[p].result())
+            yield done[p]
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,368 @@
+"""On-disk store for Mersenne test results, shared across runs and worker processes.
+
+Results are kept in a small SQLite database keyed by (exponent, algorithm tag). The ``llt`` table
+holds Lucas–Lehmer residues. The ``tf`` table holds trial-factoring progress: the highest k
+searched for q = 2pk + 1 and the factor found, if any. The ``pm1`` table holds the P-1 bounds
+tried and the factor found, if any. The tags (:data:`mathxlab.num.mersenne.LLT_ALGORITHM`,
+:data:`mathxlab.num.trial_factor.TF_ALGORITHM`, :data:`mathxlab.num.pminus1.PM1_ALGORITHM`) are
+bumped whenever an algorithm changes in a way that could affect results, so records from an
+older implementation are never reused.
+
+Each call opens its own short-lived connection, so a :class:`MersenneStore` can be pickled into
+worker processes. The database runs in WAL mode with a busy timeout, so concurrent writers wait
+for each other instead of failing.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_FILENAME = "mersenne.sqlite3"
+
+TABLES = ("llt", "tf", "pm1")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS llt (
+        p INTEGER NOT NULL,
+        algorithm TEXT NOT NULL,
+        residue BLOB NOT NULL,
+        seconds REAL NOT NULL,
+        PRIMARY KEY (p, algorithm)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS tf (
+        p INTEGER NOT NULL,
+        algorithm TEXT NOT NULL,
+        k_searched INTEGER NOT NULL,
+        factor TEXT,
+        PRIMARY KEY (p, algorithm)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pm1 (
+        p INTEGER NOT NULL,
+        algorithm TEXT NOT NULL,
+        b1 INTEGER NOT NULL,
+        b2 INTEGER NOT NULL,
+        factor TEXT,
+        stage INTEGER NOT NULL,
+        PRIMARY KEY (p, algorithm)
+    )
+    """,
+)
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class LltRecord:
+    """One stored Lucas–Lehmer result.
+
+    Args:
+        p: Exponent.
+        algorithm: Algorithm/version tag that produced the residue.
+        residue: Final residue s_(p-2) mod M_p.
+        seconds: Time the original test took.
+    """
+
+    p: int
+    algorithm: str
+    residue: int
+    seconds: float
+
+    @property
+    def is_prime(self) -> bool:
+        """True iff M_p is prime (zero residue)."""
+        return self.residue == 0
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class TfRecord:
+    """Trial-factoring progress for one exponent.
+
+    Args:
+        p: Exponent.
+        algorithm: Algorithm/version tag of the search.
+        k_searched: Every q = 2pk + 1 with k ≤ k_searched has been tested.
+        factor: Smallest factor found (None if none up to k_searched).
+    """
+
+    p: int
+    algorithm: str
+    k_searched: int
+    factor: int | None
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class Pm1Record:
+    """P-1 outcome for one exponent.
+
+    Args:
+        p: Exponent.
+        algorithm: Algorithm/version tag of the run.
+        b1: Stage-1 bound used.
+        b2: Stage-2 bound used (equal to b1 if stage 2 was skipped).
+        factor: Divisor found (None if the bounds found nothing).
+        stage: Stage that found the factor (1 or 2), or 0 if none was found.
+    """
+
+    p: int
+    algorithm: str
+    b1: int
+    b2: int
+    factor: int | None
+    stage: int
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class StoreSummary:
+    """Record count and exponent range for one table and algorithm tag.
+
+    Args:
+        table: Table name ("llt", "tf" or "pm1").
+        algorithm: Algorithm/version tag.
+        count: Number of stored exponents.
+        p_min: Smallest stored exponent.
+        p_max: Largest stored exponent.
+        hits: Exponents with M_p prime ("llt") or with a known factor ("tf", "pm1").
+    """
+
+    table: str
+    algorithm: str
+    count: int
+    p_min: int
+    p_max: int
+    hits: int
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class MersenneStore:
+    """Handle to a result database (created on first use).
+
+    Args:
+        path: SQLite database file.
+        timeout: Seconds to wait for a lock held by another writer.
+    """
+
+    path: Path
+    timeout: float = 60.0
+
+    @classmethod
+    def in_dir(cls, cache_dir: Path) -> MersenneStore:
+        """Store at the default file name inside a cache directory."""
+        return cls(path=cache_dir / DEFAULT_FILENAME)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(
+            sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        ) as conn:
+            conn.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            # In WAL mode this still never corrupts the database; at worst a power loss drops
+            # the last few results, which are recomputed on the next run.
+            conn.execute("PRAGMA synchronous = NORMAL")
+            for ddl in _SCHEMA:
+                conn.execute(ddl)
+            yield conn
+
+    def get_llt(self, exponents: Iterable[int], *, algorithm: str) -> dict[int, LltRecord]:
+        """Look up stored results.
+
+        Args:
+            exponents: Exponents to look up.
+            algorithm: Only records with this tag are returned.
+
+        Returns:
+            Mapping p -> record for the exponents that have a stored result.
+        """
+        wanted = sorted({int(p) for p in exponents})
+        if not wanted:
+            return {}
+        out: dict[int, LltRecord] = {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT p, residue, seconds FROM llt WHERE algorithm = ? AND p BETWEEN ? AND ?",
+                (algorithm, wanted[0], wanted[-1]),
+            )
+            keep = set(wanted)
+            for p, residue, seconds in rows:
+                if p in keep:
+                    out[p] = LltRecord(
+                        p=p,
+                        algorithm=algorithm,
+                        residue=int.from_bytes(residue, "little"),
+                        seconds=seconds,
+                    )
+        return out
+
+    def put_llt(self, record: LltRecord) -> None:
+        """Insert or replace one result.
+
+        Args:
+            record: Result to store.
+        """
+        residue = record.residue.to_bytes((record.residue.bit_length() + 7) // 8, "little")
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llt (p, algorithm, residue, seconds) VALUES (?, ?, ?, ?)",
+                (record.p, record.algorithm, residue, record.seconds),
+            )
+
+    def get_tf(self, exponents: Iterable[int], *, algorithm: str) -> dict[int, TfRecord]:
+        """Look up trial-factoring progress.
+
+        Args:
+            exponents: Exponents to look up.
+            algorithm: Only records with this tag are returned.
+
+        Returns:
+            Mapping p -> record for the exponents that have stored progress.
+        """
+        wanted = sorted({int(p) for p in exponents})
+        if not wanted:
+            return {}
+        out: dict[int, TfRecord] = {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT p, k_searched, factor FROM tf WHERE algorithm = ? AND p BETWEEN ? AND ?",
+                (algorithm, wanted[0], wanted[-1]),
+            )
+            keep = set(wanted)
+            for p, k_searched, factor in rows:
+                if p in keep:
+                    out[p] = TfRecord(
+                        p=p,
+                        algorithm=algorithm,
+                        k_searched=k_searched,
+                        factor=None if factor is None else int(factor),
+                    )
+        return out
+
+    def put_tf(self, record: TfRecord) -> None:
+        """Insert or replace trial-factoring progress for one exponent.
+
+        Factors are stored as decimal text because they may exceed SQLite's 64-bit integers.
+
+        Args:
+            record: Progress to store.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tf (p, algorithm, k_searched, factor) VALUES (?, ?, ?, ?)",
+                (
+                    record.p,
+                    record.algorithm,
+                    record.k_searched,
+                    None if record.factor is None else str(record.factor),
+                ),
+            )
+
+    def get_pm1(self, exponents: Iterable[int], *, algorithm: str) -> dict[int, Pm1Record]:
+        """Look up P-1 outcomes.
+
+        Args:
+            exponents: Exponents to look up.
+            algorithm: Only records with this tag are returned.
+
+        Returns:
+            Mapping p -> record for the exponents that have a stored outcome.
+        """
+        wanted = sorted({int(p) for p in exponents})
+        if not wanted:
+            return {}
+        out: dict[int, Pm1Record] = {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT p, b1, b2, factor, stage FROM pm1 "
+                "WHERE algorithm = ? AND p BETWEEN ? AND ?",
+                (algorithm, wanted[0], wanted[-1]),
+            )
+            keep = set(wanted)
+            for p, b1, b2, factor, stage in rows:
+                if p in keep:
+                    out[p] = Pm1Record(
+                        p=p,
+                        algorithm=algorithm,
+                        b1=b1,
+                        b2=b2,
+                        factor=None if factor is None else int(factor),
+                        stage=stage,
+                    )
+        return out
+
+    def put_pm1(self, record: Pm1Record) -> None:
+        """Insert or replace the P-1 outcome for one exponent.
+
+        Args:
+            record: Outcome to store.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pm1 (p, algorithm, b1, b2, factor, stage) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    record.p,
+                    record.algorithm,
+                    record.b1,
+                    record.b2,
+                    None if record.factor is None else str(record.factor),
+                    record.stage,
+                ),
+            )
+
+    def summary(self) -> list[StoreSummary]:
+        """Per-table, per-tag record counts, ordered by table and tag."""
+        with self._connect() as conn:
+            llt = conn.execute(
+                "SELECT algorithm, COUNT(*), MIN(p), MAX(p), SUM(residue = x'') FROM llt "
+                "GROUP BY algorithm ORDER BY algorithm"
+            ).fetchall()
+            tf = conn.execute(
+                "SELECT algorithm, COUNT(*), MIN(p), MAX(p), COUNT(factor) FROM tf "
+                "GROUP BY algorithm ORDER BY algorithm"
+            ).fetchall()
+            pm1 = conn.execute(
+                "SELECT algorithm, COUNT(*), MIN(p), MAX(p), COUNT(factor) FROM pm1 "
+                "GROUP BY algorithm ORDER BY algorithm"
+            ).fetchall()
+        return [
+            StoreSummary(table=table, algorithm=a, count=c, p_min=lo, p_max=hi, hits=int(k))
+            for table, rows in (("llt", llt), ("tf", tf), ("pm1", pm1))
+            for a, c, lo, hi, k in rows
+        ]
+
+    def clear(self, *, table: str | None = None, algorithm: str | None = None) -> int:
+        """Delete stored results.
+
+        Args:
+            table: Only clear this table ("llt", "tf" or "pm1"; default: all).
+            algorithm: Only delete records with this tag (default: all records).
+
+        Returns:
+            Number of records deleted.
+
+        Raises:
+            ValueError: If the table name is unknown.
+        """
+        if table is not None and table not in TABLES:
+            raise ValueError(f"Unknown table: {table!r} (expected one of {TABLES})")
+        removed = 0
+        with self._connect() as conn:
+            for name in TABLES if table is None else (table,):
+                if algorithm is None:
+                    cur = conn.execute(f"DELETE FROM {name}")
+                else:
+                    cur = conn.execute(f"DELETE FROM {name} WHERE algorithm = ?", (algorithm,))
+                removed += cur.rowcount
+        return removed
@@ -0,0 +1,89 @@
+"""Vectorized modular arithmetic over arrays of moduli.
+
+For moduli below 2^32, every residue product fits in uint64, so square-and-multiply runs as
+whole-array NumPy operations. The cost is one square, one reduction, and at most one doubling
+per bit of the exponent, independent of how many moduli are processed.
+
+Moduli up to 2^50 use a float-quotient product instead. The quotient floor(a b / q) is estimated
+in float64 (off by at most one), and a b - quot q is evaluated in wrapping 64-bit integer
+arithmetic. The true remainder is small, so the wrapped value is exact after one correction.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+MAX_MODULUS = 1 << 50
+_NATIVE_LIMIT = 1 << 32
+
+
+# ------------------------------------------------------------------------------
+def mulmod(a: np.ndarray, b: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Compute a * b mod q element-wise for 0 ≤ a, b < q < 2^50.
+
+    Args:
+        a: First factors (int64).
+        b: Second factors (int64).
+        q: Moduli (int64).
+
+    Returns:
+        int64 array of a * b mod q.
+    """
+    quot = np.floor(a.astype(np.float64) * b.astype(np.float64) / q.astype(np.float64))
+    with np.errstate(over="ignore"):
+        r = a * b - quot.astype(np.int64) * q
+    r += np.where(r < 0, q, 0)
+    r -= np.where(r >= q, q, 0)
+    return np.asarray(r, dtype=np.int64)
+
+
+# ------------------------------------------------------------------------------
+def pow2_mod(e: int, q: np.ndarray) -> np.ndarray:
+    """Compute 2^e mod q element-wise.
+
+    Left-to-right binary exponentiation: each bit squares the residue, and each set bit also
+    doubles it (a shift plus one conditional subtraction instead of a second reduction).
+
+    Args:
+        e: Non-negative exponent.
+        q: Moduli with 2 ≤ q < 2^50 (any integer dtype).
+
+    Returns:
+        Array of 2^e mod q, same shape as q (uint64 if all q < 2^32, else int64).
+
+    Raises:
+        ValueError: If e < 0 or a modulus is outside [2, 2^50).
+    """
+    if e < 0:
+        raise ValueError("e must be >= 0")
+    qa = np.asarray(q)
+    if qa.size and (int(qa.min()) < 2 or int(qa.max()) >= MAX_MODULUS):
+        raise ValueError("moduli must satisfy 2 <= q < 2**50")
+
+    r: np.ndarray
+    if qa.size and int(qa.max()) >= _NATIVE_LIMIT:
+        qi = qa.astype(np.int64)
+        r = np.ones_like(qi)
+        if e == 0:
+            return r
+        r = 2 % qi
+        for bit in bin(e)[3:]:
+            r = mulmod(r, r, qi)
+            if bit == "1":
+                r <<= 1
+                r -= np.where(r >= qi, qi, 0)
+        return r
+
+    qq = qa.astype(np.uint64)
+    r = np.ones_like(qq)
+    if e == 0:
+        return r
+    # The leading bit contributes r = 2 directly (2 < q for every q ≥ 3; q = 2 is handled by %).
+    r = np.uint64(2) % qq
+    for bit in bin(e)[3:]:
+        r *= r
+        r %= qq
+        if bit == "1":
+            r <<= np.uint64(1)
+            r -= np.where(r >= qq, qq, np.uint64(0))
+    return r
@@ -0,0 +1,404 @@
+"""Sieve engine for multiplicative arithmetic functions.
+
+Computes σ(n), σ_k(n), τ(n), φ(n) and μ(n) for all n in a range from a single prime-power
+pass: for every prime p ≤ √N the p-part f(p^e) of each multiple of p is written with strided
+slice assignments (one per power p^e) and multiplied in once, so no per-element exponent
+arrays, lookups or divisions are needed. Primes that hit a block only a few times are handled
+together in one vectorized scatter. Whatever remains after removing the small primes is 1 or a
+single prime q > √N, which is handled in one vectorized step at the end.
+
+This peels off prime powers exactly as a smallest-prime-factor factorization would, but does
+O(π(√N)) NumPy operations per chunk instead of O(N) Python-level slice updates.
+
+Any window [A, A+L) can be sieved on its own using only the primes up to √(A+L), so
+:func:`iter_multiplicative_blocks` streams values far beyond what fits in RAM:
+
+    for start, sigma in iter_sigma_blocks(10**11, 10**11 + 10**9):
+        ...  # sigma[i] = σ(start + i)
+
+Supported function names:
+    - ``"sigma"``: sum of divisors σ(n)
+    - ``"sigma_<k>"``: σ_k(n) = Σ_{d | n} d^k (e.g. ``"sigma_2"``)
+    - ``"tau"``: number of divisors τ(n)
+    - ``"phi"``: Euler's totient φ(n)
+    - ``"mu"``: Möbius function μ(n)
+
+All values are stored as int64 (μ as int8); index 0 is defined as 0. Requests whose σ_k values
+could exceed int64 (σ_k(n) ≤ n^k (1 + ln n), and ≤ ζ(2) n^k for k ≥ 2) are rejected up front.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from math import isqrt, log, pi
+
+import numpy as np
+
+from mathxlab.num.primes import primes_up_to
+
+# ------------------------------------------------------------------------------
+DEFAULT_CHUNK_SIZE = 1 << 20
+"""Integers processed per chunk (bounds the size of the per-chunk scratch arrays)."""
+
+_SLICE_HITS = 16
+"""Primes with at least this many multiples per chunk are handled with strided slices."""
+
+_EXACT_FLOAT_LIMIT = 1 << 53
+"""Integers below this bound are represented exactly in float64."""
+
+_LOG_INT64_MAX = 63 * log(2)
+"""Natural log of 2^63: σ_k(N) must stay below this to fit in int64."""
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class _FunctionSpec:
+    """How to evaluate one multiplicative function.
+
+    Args:
+        name: Function name as requested by the caller.
+        dtype: Output dtype.
+        prime_power: Scalar f(p^e).
+        prime: Vectorized f(p) for an array of primes p.
+        log_bound: Upper bound on ln f(n) for 1 ≤ n ≤ N, or None if f always fits the dtype.
+    """
+
+    name: str
+    dtype: type[np.signedinteger]
+    prime_power: Callable[[int, int], int]
+    prime: Callable[[np.ndarray], np.ndarray]
+    log_bound: Callable[[int], float] | None = None
+
+
+# ------------------------------------------------------------------------------
+def _sigma_k_log_bound(n: int, k: int) -> float:
+    """Upper bound on ln σ_k(m) for m ≤ n, from σ_k(m) = m^k Σ_{d | m} d^-k."""
+    if k == 0:
+        return log(n)
+    factor = 1 + log(n) if k == 1 else pi * pi / 6
+    return k * log(n) + log(factor)
+
+
+# ------------------------------------------------------------------------------
+def _sigma_k_spec(name: str, k: int) -> _FunctionSpec:
+    """Build the spec for σ_k (σ_0 = τ, σ_1 = σ)."""
+    return _FunctionSpec(
+        name=name,
+        dtype=np.int64,
+        prime_power=lambda p, e: sum(p ** (j * k) for j in range(e + 1)),
+        prime=lambda q: 1 + q**k,
+        log_bound=lambda n: _sigma_k_log_bound(n, k),
+    )
+
+
+# ------------------------------------------------------------------------------
+def _parse_function(name: str) -> _FunctionSpec:
+    """Map a function name to its spec.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    match name:
+        case "sigma":
+            return _sigma_k_spec(name, 1)
+        case "tau":
+            return _FunctionSpec(
+                name=name,
+                dtype=np.int64,
+                prime_power=lambda p, e: e + 1,
+                prime=lambda q: np.full_like(q, 2),
+            )
+        case "phi":
+            return _FunctionSpec(
+                name=name,
+                dtype=np.int64,
+                prime_power=lambda p, e: 1 if e == 0 else p ** (e - 1) * (p - 1),
+                prime=lambda q: q - 1,
+            )
+        case "mu":
+            return _FunctionSpec(
+                name=name,
+                dtype=np.int8,
+                prime_power=lambda p, e: (1, -1)[e] if e < 2 else 0,
+                prime=lambda q: np.full_like(q, -1),
+            )
+    if name.startswith("sigma_") and name[6:].isdigit():
+        return _sigma_k_spec(name, int(name[6:]))
+    raise ValueError(f"Unknown multiplicative function: {name!r}")
+
+
+# ------------------------------------------------------------------------------
+def _parse_functions(functions: tuple[str, ...], n_max: int) -> tuple[_FunctionSpec, ...]:
+    """Parse and de-duplicate function names (keeping their order).
+
+    Raises:
+        ValueError: If a name is unknown, or a function could overflow int64 for n ≤ n_max.
+    """
+    specs = tuple(_parse_function(name) for name in dict.fromkeys(functions))
+    for spec in specs:
+        if spec.log_bound is not None and n_max > 1 and spec.log_bound(n_max) >= _LOG_INT64_MAX:
+            raise ValueError(f"{spec.name}(n) can overflow int64 for n up to {n_max}")
+    return specs
+
+
+# ------------------------------------------------------------------------------
+def _apply_sliced_prime(
+    p: int,
+    lo: int,
+    hi: int,
+    *,
+    smooth: np.ndarray,
+    specs: tuple[_FunctionSpec, ...],
+    out: tuple[np.ndarray, ...],
+) -> None:
+    """Multiply the p-part of every multiple of p in [lo, hi) into smooth and out."""
+    start = ((lo + p - 1) // p) * p
+    if start >= hi:
+        return
+    view = slice(start - lo, None, p)
+
+    # Multiples of p^e (e ≥ 2) as (offset, step) into the sub-array of multiples of p.
+    levels: list[tuple[int, int]] = []
+    pe = p * p
+    while pe < hi:
+        start_e = ((lo + pe - 1) // pe) * pe
+        if start_e >= hi:
+            break
+        levels.append(((start_e - start) // p, pe // p))
+        pe *= p
+
+    if not levels:
+        smooth[view] *= p
+        for spec, arr in zip(specs, out, strict=True):
+            arr[view] *= spec.prime_power(p, 1)
+        return
+
+    # Build the p-part f(p^e) of every multiple of p: start from f(p) and let each higher
+    # power overwrite its own multiples. This avoids per-element exponents and divisions.
+    part = np.empty((hi - 1 - start) // p + 1, dtype=np.int64)
+    part.fill(p)
+    for e, (offset, step) in enumerate(levels, start=2):
+        part[offset::step] = p**e
+    smooth[view] *= part
+    for spec, arr in zip(specs, out, strict=True):
+        part.fill(spec.prime_power(p, 1))
+        for e, (offset, step) in enumerate(levels, start=2):
+            part[offset::step] = spec.prime_power(p, e)
+        arr[view] *= part
+
+
+# ------------------------------------------------------------------------------
+def _apply_scattered_primes(
+    primes: np.ndarray,
+    lo: int,
+    hi: int,
+    *,
+    smooth: np.ndarray,
+    specs: tuple[_FunctionSpec, ...],
+    out: tuple[np.ndarray, ...],
+) -> None:
+    """Multiply the p-parts of primes that hit [lo, hi) only a few times each.
+
+    All hits of all primes are generated in one vectorized step. Different primes can hit the
+    same n, so updates go through ``np.multiply.at``. Hits with p² | n are rare for these
+    primes and are corrected one at a time afterwards.
+    """
+    first = ((lo + primes - 1) // primes) * primes
+    keep = first < hi
+    primes = primes[keep]
+    first = first[keep]
+    if primes.size == 0:
+        return
+
+    hits = (hi - 1 - first) // primes + 1
+    rank = np.arange(int(hits.sum()), dtype=np.int64) - np.repeat(np.cumsum(hits) - hits, hits)
+    p_hit = np.repeat(primes, hits)
+    n_hit = np.repeat(first, hits) + rank * p_hit
+    pos = n_hit - lo
+
+    np.multiply.at(smooth, pos, p_hit)
+    for spec, arr in zip(specs, out, strict=True):
+        np.multiply.at(arr, pos, spec.prime(p_hit).astype(spec.dtype))
+
+    square = np.flatnonzero(n_hit % (p_hit * p_hit) == 0)
+    for i in square.tolist():
+        p, n, j = int(p_hit[i]), int(n_hit[i]), int(pos[i])
+        e = 1
+        while n % (p ** (e + 1)) == 0:
+            e += 1
+        smooth[j] *= p ** (e - 1)
+        for spec, arr in zip(specs, out, strict=True):
+            arr[j] = arr[j] // spec.prime_power(p, 1) * spec.prime_power(p, e)
+
+
+# ------------------------------------------------------------------------------
+def _sieve_window(
+    lo: int,
+    hi: int,
+    *,
+    primes: np.ndarray,
+    specs: tuple[_FunctionSpec, ...],
+    out: tuple[np.ndarray, ...],
+) -> None:
+    """Evaluate multiplicative functions for lo ≤ n < hi, writing into out.
+
+    Args:
+        lo: First integer of the window (must be ≥ 1).
+        hi: End of the window (exclusive).
+        primes: All primes ≤ √(hi-1) (more is fine).
+        specs: Functions to evaluate.
+        out: One output view of length hi-lo per spec, in the same order.
+    """
+    smooth = np.ones(hi - lo, dtype=np.int64)
+    for arr in out:
+        arr.fill(1)
+
+    primes = primes[: int(np.searchsorted(primes, isqrt(hi - 1), side="right"))]
+    split = int(np.searchsorted(primes, max(1, (hi - lo) // _SLICE_HITS), side="right"))
+    for p in primes[:split].tolist():
+        _apply_sliced_prime(p, lo, hi, smooth=smooth, specs=specs, out=out)
+    if split < primes.size:
+        _apply_scattered_primes(primes[split:], lo, hi, smooth=smooth, specs=specs, out=out)
+
+    # The cofactor n / (√N-smooth part of n) is 1 or a single prime q > √N.
+    n = np.arange(lo, hi, dtype=np.int64)
+    # smooth divides n, so below 2^53 the float quotient is exact and much cheaper than int64 //.
+    rem = np.rint(n / smooth).astype(np.int64) if hi <= _EXACT_FLOAT_LIMIT else n // smooth
+    big = np.flatnonzero(rem > 1)
+    if big.size:
+        q = rem[big]
+        for spec, arr in zip(specs, out, strict=True):
+            arr[big] *= spec.prime(q).astype(spec.dtype)
+
+
+# ------------------------------------------------------------------------------
+def multiplicative_sieve(
+    n_max: int,
+    functions: tuple[str, ...] = ("sigma",),
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, np.ndarray]:
+    """Compute several multiplicative functions for 0..N in one pass.
+
+    Args:
+        n_max: Upper bound N (inclusive).
+        functions: Function names to compute (see module docstring).
+        chunk_size: Integers processed per chunk.
+
+    Returns:
+        Mapping from function name to an array of length N+1 (index 0 holds 0).
+
+    Raises:
+        ValueError: If n_max < 1, chunk_size < 1, a function name is unknown, or a function's
+            values could overflow int64 for n ≤ n_max.
+    """
+    if n_max < 1:
+        raise ValueError("n_max must be >= 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    specs = _parse_functions(functions, n_max)
+    results = {spec.name: np.zeros(n_max + 1, dtype=spec.dtype) for spec in specs}
+    primes = primes_up_to(isqrt(n_max))
+
+    for lo in range(1, n_max + 1, chunk_size):
+        hi = min(lo + chunk_size, n_max + 1)
+        _sieve_window(
+            lo,
+            hi,
+            primes=primes,
+            specs=specs,
+            out=tuple(results[spec.name][lo:hi] for spec in specs),
+        )
+    return results
+
+
+# ------------------------------------------------------------------------------
+def iter_multiplicative_blocks(
+    start: int,
+    stop: int,
+    functions: tuple[str, ...] = ("sigma",),
+    *,
+    block_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[int, dict[str, np.ndarray]]]:
+    """Stream multiplicative functions over [start, stop) block by block.
+
+    Only the primes up to √(stop-1) and one block are held in memory, so this scales to ranges
+    (e.g. up to 10^11) whose full tables would not fit in RAM.
+
+    Args:
+        start: First integer (must be ≥ 1).
+        stop: End of the range (exclusive).
+        functions: Function names to compute (see module docstring).
+        block_size: Integers per yielded block.
+
+    Yields:
+        Tuples (block_start, values) where values[name][i] = f(block_start + i). Each block
+        owns fresh arrays, so callers may keep them.
+
+    Raises:
+        ValueError: If start < 1 or block_size < 1, a function name is unknown, or a function's
+            values could overflow int64 below stop.
+    """
+    if start < 1:
+        raise ValueError("start must be >= 1")
+    if block_size < 1:
+        raise ValueError("block_size must be >= 1")
+
+    specs = _parse_functions(functions, max(start, stop - 1))
+    if stop <= start:
+        return
+    primes = primes_up_to(isqrt(stop - 1))
+
+    for lo in range(start, stop, block_size):
+        hi = min(lo + block_size, stop)
+        values = {spec.name: np.empty(hi - lo, dtype=spec.dtype) for spec in specs}
+        _sieve_window(lo, hi, primes=primes, specs=specs, out=tuple(values[s.name] for s in specs))
+        yield lo, values
+
+
+# ------------------------------------------------------------------------------
+def iter_sigma_blocks(
+    start: int, stop: int, *, block_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Stream σ(n) over [start, stop) block by block.
+
+    Args:
+        start: First integer (must be ≥ 1).
+        stop: End of the range (exclusive).
+        block_size: Integers per yielded block.
+
+    Yields:
+        Tuples (block_start, sigma) with sigma[i] = σ(block_start + i).
+    """
+    for lo, values in iter_multiplicative_blocks(start, stop, ("sigma",), block_size=block_size):
+        yield lo, values["sigma"]
+
+
+# ------------------------------------------------------------------------------
+def sigma_window(start: int, length: int) -> np.ndarray:
+    """Compute σ(n) for n in [start, start + length).
+
+    Args:
+        start: First integer A (must be ≥ 1).
+        length: Window length L.
+
+    Returns:
+        int64 array sigma with sigma[i] = σ(A + i).
+    """
+    blocks = [s for _, s in iter_sigma_blocks(start, start + length)]
+    return np.concatenate(blocks) if blocks else np.array([], dtype=np.int64)
+
+
+# ------------------------------------------------------------------------------
+def sigma_sieve(n_max: int) -> np.ndarray:
+    """Compute σ(0..N).
+
+    Args:
+        n_max: Upper bound N (inclusive).
+
+    Returns:
+        NumPy array sigma of length N+1 with sigma[n] = σ(n) (and sigma[0] = 0).
+    """
+    return multiplicative_sieve(n_max, ("sigma",))["sigma"]
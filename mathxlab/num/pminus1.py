@@ -0,0 +1,248 @@
+"""Pollard P-1 factoring specialized to Mersenne numbers M_p = 2^p - 1.
+
+Every prime factor q of M_p satisfies q ≡ 1 (mod 2p), so q - 1 = 2p·m. P-1 finds q whenever m is
+smooth. In stage 1 all prime factors of m are ≤ B1 (with their powers). Stage 2 additionally
+allows one prime factor in (B1, B2].
+
+Stage 1 computes x = 3^E mod M_p with E = 2p · ∏_{r ≤ B1} r^floor(log_r B1). Base 2 is useless
+here, since 2^p ≡ 1 (mod M_p). Stage 2 walks the primes r in (B1, B2] and multiplies
+(x^r - 1) into an accumulator. Consecutive x^r are linked by a small table of x^d over the prime
+gaps d, so each prime costs two modular multiplications. A gcd with M_p then reveals any factor
+caught.
+
+All arithmetic reduces modulo M_p with the shift-and-mask fold, as in :mod:`mathxlab.num.mersenne`.
+If a gcd returns M_p itself (several factors caught at once, common for small p), the stage is
+repeated with a gcd after every prime so that a proper divisor is split off.
+
+:func:`cached_pminus1` records the bounds tried and any factor found in a
+:class:`~mathxlab.num.mersenne_store.MersenneStore`, so a later run with the same or smaller
+bounds is answered from the store.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from itertools import pairwise
+
+import numpy as np
+
+from mathxlab.num.mersenne_store import MersenneStore, Pm1Record
+from mathxlab.num.primes import primes_up_to
+
+# Tag stored with P-1 outcomes; bump when a change could alter results.
+PM1_ALGORITHM = "pminus1/1"
+_BASE = 3
+_GCD_EVERY = 1024  # stage-2 primes between gcd checks in the fine-grained retry
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class PMinus1Result:
+    """Outcome of P-1 on one M_p.
+
+    Args:
+        p: Exponent.
+        factor: Nontrivial divisor of M_p found (not necessarily prime), or None.
+        stage: Stage that found the factor (1 or 2), or 0 if none was found.
+        b1: Stage-1 bound used.
+        b2: Stage-2 bound used (equal to b1 if stage 2 was skipped).
+    """
+
+    p: int
+    factor: int | None
+    stage: int
+    b1: int
+    b2: int
+
+
+# ------------------------------------------------------------------------------
+def _mulmod(a: int, b: int, p: int, mp: int) -> int:
+    """a * b mod M_p for 0 ≤ a, b < M_p using two shift-and-mask folds."""
+    x = a * b
+    x = (x & mp) + (x >> p)
+    x = (x & mp) + (x >> p)
+    return x - mp if x >= mp else x
+
+
+# ------------------------------------------------------------------------------
+def _powmod(x: int, e: int, p: int, mp: int) -> int:
+    """x^e mod M_p by left-to-right binary exponentiation."""
+    r = x
+    for bit in bin(e)[3:]:
+        r = _mulmod(r, r, p, mp)
+        if bit == "1":
+            r = _mulmod(r, x, p, mp)
+    return r
+
+
+# ------------------------------------------------------------------------------
+def _split(g: int, mp: int) -> int | None:
+    """Return g if it is a proper divisor of M_p, else None."""
+    return g if 1 < g < mp else None
+
+
+# ------------------------------------------------------------------------------
+def _stage1(p: int, mp: int, primes: list[int], b1: int, *, fine: bool) -> tuple[int, int]:
+    """Run stage 1; returns (x = 3^E mod M_p, gcd(x - 1, M_p)).
+
+    With ``fine=True`` the gcd is taken after every prime power and the first proper divisor is
+    returned early, so factors caught together by the combined exponent are separated.
+    """
+    x = _powmod(_BASE, 2 * p, p, mp)
+    if fine and _split(g := math.gcd(x - 1, mp), mp):
+        return x, g
+    e_acc = 1
+    for r in primes:
+        if r > b1:
+            break
+        rk = r
+        while rk * r <= b1:
+            rk *= r
+        if fine:
+            x = _powmod(x, rk, p, mp)
+            if _split(g := math.gcd(x - 1, mp), mp):
+                return x, g
+        else:
+            e_acc *= rk
+    if not fine:
+        x = _powmod(x, e_acc, p, mp)
+    return x, math.gcd(x - 1, mp)
+
+
+# ------------------------------------------------------------------------------
+def _stage2(x: int, p: int, mp: int, primes: list[int], b1: int, b2: int, *, fine: bool) -> int:
+    """Run stage 2 for primes r in (b1, b2]; returns gcd(prod (x^r - 1), M_p).
+
+    With ``fine=True`` the gcd is taken every _GCD_EVERY primes and the first proper divisor is
+    returned early, so factors caught together in one block are separated.
+    """
+    todo = [r for r in primes if b1 < r <= b2]
+    if not todo:
+        return 1
+    gaps = {b - a for a, b in pairwise(todo)}
+    x2 = _mulmod(x, x, p, mp)
+    table: dict[int, int] = {}
+    xd = x2
+    for d in range(2, max(gaps, default=2) + 1, 2):
+        if d in gaps:
+            table[d] = xd
+        xd = _mulmod(xd, x2, p, mp)
+
+    y = _powmod(x, todo[0], p, mp)
+    acc = (y - 1) % mp
+    for i, r in enumerate(todo[1:], start=1):
+        y = _mulmod(y, table[r - todo[i - 1]], p, mp)
+        step = _mulmod(acc, (y - 1) % mp, p, mp)
+        if fine and i % _GCD_EVERY == 0 and (g := math.gcd(step, mp)) > 1:
+            if g < mp:
+                return g
+            # Caught everything since the last check: rescan this block one prime at a time.
+            return _stage2_single(x, p, mp, todo[i - _GCD_EVERY : i + 1])
+        acc = step
+    g = math.gcd(acc, mp)
+    if g == mp and fine:
+        return _stage2_single(x, p, mp, todo[(len(todo) - 1) // _GCD_EVERY * _GCD_EVERY :])
+    return g
+
+
+# ------------------------------------------------------------------------------
+def _stage2_single(x: int, p: int, mp: int, primes: list[int]) -> int:
+    """Test x^r - 1 for each prime separately (fallback when a block catches all factors).
+
+    Returns the first proper divisor found, or M_p if no single prime separates the factors.
+    """
+    for r in primes:
+        if f := _split(math.gcd(_powmod(x, r, p, mp) - 1, mp), mp):
+            return f
+    return mp
+
+
+# ------------------------------------------------------------------------------
+def pminus1(
+    p: int, *, b1: int, b2: int | None = None, primes: np.ndarray | None = None
+) -> PMinus1Result:
+    """Run P-1 stage 1 (and optionally stage 2) on M_p.
+
+    Args:
+        p: Odd prime exponent.
+        b1: Stage-1 bound (must be ≥ 2).
+        b2: Stage-2 bound (> b1 enables stage 2; None or ≤ b1 skips it).
+        primes: Ascending table holding every prime ≤ max(b1, b2), e.g.
+            ``primes_up_to(b2)`` from :mod:`mathxlab.num.primes`. Computed if omitted; pass one
+            in to share the sieve across many exponents.
+
+    Returns:
+        The factor found (if any) and the stage that found it.
+
+    Raises:
+        ValueError: If p < 3, b1 < 2, or the prime table is visibly too short.
+    """
+    if p < 3:
+        raise ValueError("p must be an odd prime >= 3")
+    if b1 < 2:
+        raise ValueError("b1 must be >= 2")
+    bound = b1 if b2 is None or b2 <= b1 else b2
+    table = primes_up_to(bound) if primes is None else primes
+    # Bertrand: a table built up to the bound ends with a prime above bound / 2.
+    if table.size == 0 or 2 * int(table[-1]) <= bound:
+        raise ValueError("prime table does not cover the stage bounds")
+    plist = [int(r) for r in table[table <= bound]]
+    mp = (1 << p) - 1
+
+    x, g = _stage1(p, mp, plist, b1, fine=False)
+    if g == mp:
+        x, g = _stage1(p, mp, plist, b1, fine=True)
+    if (f := _split(g, mp)) is not None:
+        return PMinus1Result(p=p, factor=f, stage=1, b1=b1, b2=bound)
+    if bound == b1:
+        return PMinus1Result(p=p, factor=None, stage=0, b1=b1, b2=b1)
+
+    g = _stage2(x, p, mp, plist, b1, bound, fine=False)
+    if g == mp:
+        g = _stage2(x, p, mp, plist, b1, bound, fine=True)
+    f = _split(g, mp)
+    return PMinus1Result(p=p, factor=f, stage=2 if f is not None else 0, b1=b1, b2=bound)
+
+
+# ------------------------------------------------------------------------------
+def cached_pminus1(
+    p: int,
+    *,
+    b1: int,
+    b2: int | None = None,
+    store: MersenneStore,
+    primes: np.ndarray | None = None,
+) -> PMinus1Result:
+    """Run P-1 on M_p unless the store already answers it.
+
+    A stored factor is always reused, and so is a stored failure whose bounds cover the requested
+    ones. Otherwise P-1 runs with the requested bounds and the outcome is written back.
+
+    Args:
+        p: Odd prime exponent.
+        b1: Stage-1 bound.
+        b2: Stage-2 bound (see :func:`pminus1`).
+        store: Store holding per-exponent outcomes.
+        primes: Optional shared prime table (see :func:`pminus1`).
+
+    Returns:
+        The stored or newly computed outcome.
+    """
+    b2_eff = b1 if b2 is None or b2 <= b1 else b2
+    rec = store.get_pm1([p], algorithm=PM1_ALGORITHM).get(p)
+    if rec is not None and (rec.factor is not None or (rec.b1 >= b1 and rec.b2 >= b2_eff)):
+        return PMinus1Result(p=p, factor=rec.factor, stage=rec.stage, b1=rec.b1, b2=rec.b2)
+
+    res = pminus1(p, b1=b1, b2=b2, primes=primes)
+    store.put_pm1(
+        Pm1Record(
+            p=p,
+            algorithm=PM1_ALGORITHM,
+            b1=res.b1,
+            b2=res.b2,
+            factor=res.factor,
+            stage=res.stage,
+        )
+    )
+    return res
@@ -0,0 +1,185 @@
+"""Prime sieves shared by the experiments.
+
+The main entry point is a segmented, odd-only sieve of Eratosthenes. Each segment stores one
+byte per odd number and is sized to stay resident in L2 cache, so memory use is bounded by the
+segment size plus the base primes up to √stop, regardless of how far the sieve runs.
+
+Typical use:
+
+    primes = primes_up_to(10_000)             # small ranges: one array
+    for block in iter_prime_blocks(2, 10**10):  # huge ranges: stream blocks
+        ...
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from math import isqrt
+
+import numpy as np
+
+# ------------------------------------------------------------------------------
+DEFAULT_SEGMENT_SIZE = 1 << 18
+"""Odd numbers per segment (one byte each, 256 KiB: fits comfortably in L2 cache)."""
+
+_SMALL_PRIME_HITS = 16
+"""Primes hitting a segment at least this often are crossed off with a strided slice."""
+
+
+# ------------------------------------------------------------------------------
+def _odd_base_primes(limit: int) -> np.ndarray:
+    """Return the odd primes ≤ limit using a plain odd-only sieve.
+
+    Used for the base primes up to √stop, which are small enough to sieve in one piece.
+
+    Args:
+        limit: Upper bound (inclusive).
+
+    Returns:
+        Sorted int64 array of odd primes ≤ limit.
+    """
+    if limit < 3:
+        return np.array([], dtype=np.int64)
+    # flags[i] represents the odd number 2*i + 1.
+    size = (limit - 1) // 2 + 1
+    flags = np.ones(size, dtype=bool)
+    flags[0] = False
+    for i in range(1, (isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            flags[(p * p) // 2 :: p] = False
+    return 2 * np.flatnonzero(flags).astype(np.int64) + 1
+
+
+# ------------------------------------------------------------------------------
+def _sieve_odd_segment(lo: int, count: int, base: np.ndarray) -> np.ndarray:
+    """Sieve one segment of odd numbers lo, lo+2, ..., lo+2*(count-1).
+
+    Small primes cross off their multiples with strided slices. Larger primes hit the segment
+    only a few times each, so their hit offsets are generated in one vectorized scatter instead
+    of a Python-level loop over thousands of primes.
+
+    Args:
+        lo: First odd number of the segment.
+        count: Number of odd numbers in the segment.
+        base: Odd base primes (all primes p with p*p ≤ the segment end must be included).
+
+    Returns:
+        Boolean array flags where flags[i] is True iff lo + 2*i is prime.
+    """
+    flags = np.ones(count, dtype=bool)
+    hi = lo + 2 * count  # exclusive
+    base = base[base * base < hi]
+    if base.size == 0:
+        return flags
+
+    # First odd multiple of p that is ≥ max(p*p, lo).
+    first = np.maximum(base * base, ((lo + base - 1) // base) * base)
+    first += base * ((first & 1) == 0)
+    offsets = (first - lo) // 2
+
+    split = int(np.searchsorted(base, max(1, count // _SMALL_PRIME_HITS), side="right"))
+    for p, off in zip(base[:split].tolist(), offsets[:split].tolist(), strict=True):
+        flags[off::p] = False
+
+    large = base[split:]
+    large_off = offsets[split:]
+    keep = large_off < count
+    large = large[keep]
+    large_off = large_off[keep]
+    if large.size:
+        hits = (count - 1 - large_off) // large + 1
+        total = int(hits.sum())
+        starts = np.repeat(large_off, hits)
+        steps = np.repeat(large, hits)
+        rank = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(hits) - hits, hits)
+        flags[starts + rank * steps] = False
+    return flags
+
+
+# ------------------------------------------------------------------------------
+def iter_prime_blocks(
+    start: int, stop: int, *, segment_size: int = DEFAULT_SEGMENT_SIZE
+) -> Iterator[np.ndarray]:
+    """Yield the primes in [start, stop) as consecutive ascending blocks.
+
+    Memory use is O(segment_size + π(√stop)), so this can enumerate primes up to 10^10 and
+    beyond while only ever holding one segment.
+
+    Args:
+        start: Lower bound (inclusive).
+        stop: Upper bound (exclusive).
+        segment_size: Odd numbers sieved per segment.
+
+    Yields:
+        Non-empty int64 arrays of primes in ascending order.
+
+    Raises:
+        ValueError: If segment_size is not positive.
+    """
+    if segment_size < 1:
+        raise ValueError("segment_size must be >= 1")
+    start = max(start, 2)
+    if stop <= start:
+        return
+    if start == 2:
+        yield np.array([2], dtype=np.int64)
+        start = 3
+
+    base = _odd_base_primes(isqrt(stop - 1))
+    lo = start | 1
+    while lo < stop:
+        count = min(segment_size, (stop - lo + 1) // 2)
+        flags = _sieve_odd_segment(lo, count, base)
+        if lo == 1:
+            flags[0] = False
+        block = lo + 2 * np.flatnonzero(flags).astype(np.int64)
+        if block.size:
+            yield block
+        lo += 2 * count
+
+
+# ------------------------------------------------------------------------------
+def primes_in_range(start: int, stop: int) -> np.ndarray:
+    """Return all primes in [start, stop).
+
+    Args:
+        start: Lower bound (inclusive).
+        stop: Upper bound (exclusive).
+
+    Returns:
+        Sorted int64 array of primes.
+    """
+    blocks = list(iter_prime_blocks(start, stop))
+    if not blocks:
+        return np.array([], dtype=np.int64)
+    return np.concatenate(blocks)
+
+
+# ------------------------------------------------------------------------------
+def primes_up_to(n: int) -> np.ndarray:
+    """Return all primes ≤ n.
+
+    Args:
+        n: Upper bound (inclusive).
+
+    Returns:
+        Sorted int64 array of primes ≤ n.
+    """
+    return primes_in_range(2, n + 1)
+
+
+# ------------------------------------------------------------------------------
+def prime_mask_up_to(n: int) -> np.ndarray:
+    """Return a boolean primality lookup table for 0..n.
+
+    Args:
+        n: Upper bound (inclusive).
+
+    Returns:
+        Boolean array is_prime of length n+1.
+    """
+    is_prime = np.zeros(max(n, 0) + 1, dtype=bool)
+    for block in iter_prime_blocks(2, n + 1):
+        is_prime[block] = True
+    return is_prime
@@ -0,0 +1,178 @@
+"""Chunked, thread-parallel error statistics for Taylor series over huge grids.
+
+:func:`taylor_sin_error_stats` evaluates :func:`mathxlab.num.series.taylor_sin_partial_sums` and
+compares it with ``np.sin`` on an implicit uniform grid. The grid is split into blocks, and each
+block is generated, evaluated and reduced on the spot to per-degree max / mean absolute error
+and a histogram of log10 |error|. Neither the grid nor the error array is ever materialized, so
+10^9 points need only ``workers`` blocks of memory.
+
+Blocks are shared out round-robin to a thread pool. NumPy ufuncs release the GIL, so the threads
+evaluate in parallel. Each worker owns its workspace, output buffers and :class:`ErrorStats`,
+and the per-worker statistics are merged at the end.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from mathxlab.num.series import SeriesWorkspace, taylor_sin_partial_sums
+from mathxlab.num.streaming import StreamingHistogram
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+"""Grid points per block handed to a worker (each block is evaluated in workspace chunks)."""
+
+DEFAULT_LOG10_EDGES = np.linspace(-17.0, 3.0, 81)
+"""Histogram edges for log10 |error| (four bins per decade)."""
+
+
+# ------------------------------------------------------------------------------
+@dataclass(slots=True)
+class ErrorStats:
+    """Streaming absolute-error statistics, one row per polynomial degree.
+
+    Args:
+        degrees: Degrees the rows refer to.
+        edges: Bin edges for the log10 |error| histograms. Exact zeros count as underflow.
+    """
+
+    degrees: tuple[int, ...]
+    edges: np.ndarray = field(default_factory=lambda: DEFAULT_LOG10_EDGES.copy())
+    count: int = field(init=False, default=0)
+    max_abs: np.ndarray = field(init=False)
+    argmax_x: np.ndarray = field(init=False)
+    sum_abs: np.ndarray = field(init=False)
+    histograms: list[StreamingHistogram] = field(init=False)
+
+    def __post_init__(self) -> None:
+        k = len(self.degrees)
+        self.max_abs = np.full(k, -np.inf)
+        self.argmax_x = np.full(k, np.nan)
+        self.sum_abs = np.zeros(k)
+        self.histograms = [StreamingHistogram(edges=self.edges) for _ in range(k)]
+
+    @property
+    def mean_abs(self) -> np.ndarray:
+        """Mean absolute error per degree (NaN before any update)."""
+        return self.sum_abs / self.count if self.count else np.full(len(self.degrees), np.nan)
+
+    def update(self, x: np.ndarray, abs_err: np.ndarray) -> None:
+        """Add one block.
+
+        Args:
+            x: Grid points of the block (shape (m,)).
+            abs_err: Absolute errors, shape (len(degrees), m).
+        """
+        if x.size == 0:
+            return
+        idx = np.argmax(abs_err, axis=1)
+        block_max = abs_err[np.arange(len(self.degrees)), idx]
+        better = block_max > self.max_abs
+        self.max_abs[better] = block_max[better]
+        self.argmax_x[better] = x[idx[better]]
+        self.sum_abs += abs_err.sum(axis=1)
+        self.count += x.size
+        with np.errstate(divide="ignore"):
+            for hist, row in zip(self.histograms, abs_err, strict=True):
+                hist.update(np.log10(row))
+
+    def merge(self, other: ErrorStats) -> None:
+        """Add the statistics of another accumulator over the same degrees and edges.
+
+        Raises:
+            ValueError: If the degrees differ (mismatched edges raise from the histograms).
+        """
+        if other.degrees != self.degrees:
+            raise ValueError("cannot merge ErrorStats with different degrees")
+        better = other.max_abs > self.max_abs
+        self.max_abs[better] = other.max_abs[better]
+        self.argmax_x[better] = other.argmax_x[better]
+        self.sum_abs += other.sum_abs
+        self.count += other.count
+        for mine, theirs in zip(self.histograms, other.histograms, strict=True):
+            mine.merge(theirs)
+
+
+# ------------------------------------------------------------------------------
+def _grid_block(x_min: float, x_max: float, num_points: int, lo: int, hi: int) -> np.ndarray:
+    """Points lo..hi-1 of ``np.linspace(x_min, x_max, num_points)``, endpoint exact."""
+    if num_points == 1:
+        return np.array([x_min], dtype=np.float64)
+    step = (x_max - x_min) / (num_points - 1)
+    x = np.arange(lo, hi, dtype=np.float64)
+    x *= step
+    x += x_min
+    if hi == num_points:
+        x[-1] = x_max
+    return x
+
+
+# ------------------------------------------------------------------------------
+def taylor_sin_error_stats(
+    x_min: float,
+    x_max: float,
+    num_points: int,
+    x0: float,
+    degrees: Sequence[int],
+    *,
+    edges: np.ndarray | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    workers: int | None = None,
+) -> ErrorStats:
+    """Reduce |sin(x) - T_d(x)| over a uniform grid without materializing it.
+
+    Args:
+        x_min: First grid point.
+        x_max: Last grid point.
+        num_points: Grid size (the grid matches ``np.linspace(x_min, x_max, num_points)`` up
+            to rounding).
+        x0: Expansion point.
+        degrees: Polynomial degrees.
+        edges: log10 |error| histogram edges (default: DEFAULT_LOG10_EDGES).
+        block_size: Grid points per block.
+        workers: Threads (default: ``os.cpu_count()``).
+
+    Returns:
+        Merged statistics. The mean can differ in the last bits between worker counts, because
+        partial sums are added in a different order.
+
+    Raises:
+        ValueError: If num_points, block_size or workers is < 1.
+    """
+    n_workers = (os.cpu_count() or 1) if workers is None else workers
+    if num_points < 1 or block_size < 1 or n_workers < 1:
+        raise ValueError("num_points, block_size and workers must be >= 1")
+    degs = tuple(int(d) for d in degrees)
+    hist_edges = DEFAULT_LOG10_EDGES.copy() if edges is None else np.asarray(edges, np.float64)
+    n_blocks = -(-num_points // block_size)
+    n_workers = min(n_workers, n_blocks)
+
+    def work(first: int) -> ErrorStats:
+        stats = ErrorStats(degrees=degs, edges=hist_edges)
+        ws = SeriesWorkspace.allocate()
+        y = np.empty((len(degs), block_size))
+        s = np.empty(block_size)
+        for b in range(first, n_blocks, n_workers):
+            lo = b * block_size
+            hi = min(lo + block_size, num_points)
+            m = hi - lo
+            x = _grid_block(x_min, x_max, num_points, lo, hi)
+            err = taylor_sin_partial_sums(x, x0, degs, out=y[:, :m], workspace=ws)
+            np.sin(x, out=s[:m])
+            np.subtract(err, s[:m], out=err)
+            np.abs(err, out=err)
+            stats.update(x, err)
+        return stats
+
+    if n_workers == 1:
+        return work(0)
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        parts = list(pool.map(work, range(n_workers)))
+    total = parts[0]
+    for part in parts[1:]:
+        total.merge(part)
+    return total
@@ -0,0 +1,130 @@
+"""Compact smallest-prime-factor (SPF) tables.
+
+:class:`SpfTable` stores the SPF of odd n only. Each entry is a small code rather than the prime
+itself: 0 means n is prime (or 1), and c > 0 means the SPF is ``primes[c - 1]``, where
+``primes`` holds the odd primes up to √N. Every odd composite n ≤ N has its SPF in that range.
+For N < 2^32 there are at most 6542 such primes, so codes fit in uint16 and the table takes
+N bytes, a quarter of an int32-per-n array. Larger N falls back to uint32 codes.
+
+The table is built segment by segment, each segment sized to stay in L2 cache. Within a segment,
+the primes write their odd multiples (from p^2 on) with strided slices, largest prime first, so
+the smallest prime is written last. No temporary arrays are created.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import isqrt
+
+import numpy as np
+
+from mathxlab.num.primes import primes_up_to
+
+DEFAULT_SEGMENT_SIZE = 1 << 18
+"""Odd numbers per build segment (512 KiB of uint16 codes)."""
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class SpfTable:
+    """Smallest prime factors of all n ≤ n_max (odd n stored, even n implied).
+
+    Args:
+        n_max: Upper bound N (inclusive).
+        primes: Odd primes ≤ √N (int64); code c refers to ``primes[c - 1]``.
+        codes: Code for each odd n = 2i + 1 at index i (uint16 or uint32).
+    """
+
+    n_max: int
+    primes: np.ndarray
+    codes: np.ndarray
+
+    @classmethod
+    def build(cls, n_max: int, *, segment_size: int = DEFAULT_SEGMENT_SIZE) -> SpfTable:
+        """Sieve the table for 1..n_max.
+
+        Args:
+            n_max: Upper bound N (inclusive, ≥ 1).
+            segment_size: Odd numbers per build segment.
+
+        Returns:
+            The table.
+
+        Raises:
+            ValueError: If n_max < 1 or segment_size < 1.
+        """
+        if n_max < 1:
+            raise ValueError("n_max must be >= 1")
+        if segment_size < 1:
+            raise ValueError("segment_size must be >= 1")
+        primes = primes_up_to(isqrt(n_max))[1:]
+        dtype = np.uint16 if primes.size <= np.iinfo(np.uint16).max else np.uint32
+        size = (n_max - 1) // 2 + 1
+        codes = np.zeros(size, dtype=dtype)
+
+        # Odd multiples of p from p^2 on sit at indices start, start + p, start + 2p, ...
+        start = (primes * primes) // 2
+        for i0 in range(0, size, segment_size):
+            i1 = min(i0 + segment_size, size)
+            k = int(np.searchsorted(start, i1))
+            first = np.maximum(start[:k], i0 + (start[:k] - i0) % primes[:k])
+            for j in range(k - 1, -1, -1):
+                codes[int(first[j]) : i1 : int(primes[j])] = j + 1
+        return cls(n_max=n_max, primes=primes, codes=codes)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the codes and the prime table."""
+        return self.codes.nbytes + self.primes.nbytes
+
+    def spf(self, n: np.ndarray) -> np.ndarray:
+        """Smallest prime factor of each n (2 ≤ n ≤ n_max).
+
+        Args:
+            n: Integers (any shape).
+
+        Returns:
+            int64 array of smallest prime factors, same shape as n.
+
+        Raises:
+            ValueError: If a value is outside [2, n_max].
+        """
+        nn = np.asarray(n, dtype=np.int64)
+        if nn.size and (int(nn.min()) < 2 or int(nn.max()) > self.n_max):
+            raise ValueError(f"values must satisfy 2 <= n <= {self.n_max}")
+        odd = (nn & 1) == 1
+        code = self.codes[np.where(odd, nn >> 1, 0)].astype(np.int64)
+        # primes[code - 1] for composites; the lookup table is extended by a dummy at index -1.
+        lookup = np.append(self.primes, 0)
+        out = np.where(code > 0, lookup[code - 1], nn)
+        return np.where(odd, out, 2)
+
+    def factorize(self, n: int) -> dict[int, int]:
+        """Factorize one n ≤ n_max.
+
+        Args:
+            n: Integer to factorize (1 ≤ n ≤ n_max).
+
+        Returns:
+            Dictionary {prime: exponent} (empty for n = 1).
+
+        Raises:
+            ValueError: If n is outside [1, n_max].
+        """
+        if not 1 <= n <= self.n_max:
+            raise ValueError(f"n must satisfy 1 <= n <= {self.n_max}")
+        factors: dict[int, int] = {}
+        x = n
+        if x % 2 == 0:
+            e = (x & -x).bit_length() - 1
+            factors[2] = e
+            x >>= e
+        while x > 1:
+            c = int(self.codes[x >> 1])
+            p = int(self.primes[c - 1]) if c else x
+            e = 0
+            while x % p == 0:
+                x //= p
+                e += 1
+            factors[p] = e
+        return factors
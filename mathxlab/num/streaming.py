@@ -0,0 +1,167 @@
+"""Bounded-memory accumulators for block-streamed computations.
+
+Experiments that stream values block by block (e.g. σ(n) windows from
+:mod:`mathxlab.num.multiplicative`) use these accumulators to reduce each block immediately, so
+peak memory depends on the block size and the accumulator size rather than on N.
+
+Accumulators can be merged, so partial results from separate segments or worker processes
+combine into the same result as one sequential pass.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+# ------------------------------------------------------------------------------
+@dataclass(slots=True)
+class StreamingHistogram:
+    """Histogram with fixed bin edges, updated block by block.
+
+    Values outside [edges[0], edges[-1]] are counted in ``underflow`` / ``overflow``. The last
+    bin is closed on the right, matching ``np.histogram``.
+
+    Args:
+        edges: Monotonically increasing bin edges (length bins+1).
+    """
+
+    edges: np.ndarray
+    counts: np.ndarray = field(init=False)
+    underflow: int = field(init=False, default=0)
+    overflow: int = field(init=False, default=0)
+    _uniform: bool = field(init=False, repr=False, default=False)
+
+    def __post_init__(self) -> None:
+        if self.edges.ndim != 1 or self.edges.size < 2:
+            raise ValueError("edges must be a 1D array with at least 2 entries")
+        self.counts = np.zeros(self.edges.size - 1, dtype=np.int64)
+        bins = self.edges.size - 1
+        self._uniform = np.array_equal(
+            self.edges, np.linspace(self.edges[0], self.edges[-1], bins + 1)
+        )
+
+    @classmethod
+    def uniform(cls, lo: float, hi: float, bins: int) -> StreamingHistogram:
+        """Create a histogram with ``bins`` equal-width bins over [lo, hi].
+
+        Args:
+            lo: Lower edge.
+            hi: Upper edge (must be > lo).
+            bins: Number of bins (must be ≥ 1).
+
+        Returns:
+            Empty histogram.
+        """
+        if bins < 1:
+            raise ValueError("bins must be >= 1")
+        if not hi > lo:
+            raise ValueError("hi must be > lo")
+        return cls(edges=np.linspace(lo, hi, bins + 1, dtype=np.float64))
+
+    @property
+    def total(self) -> int:
+        """Number of values seen, including out-of-range ones."""
+        return int(self.counts.sum()) + self.underflow + self.overflow
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a block of values.
+
+        Args:
+            values: Values to count (any shape; NaNs are ignored).
+        """
+        v = np.asarray(values, dtype=np.float64).ravel()
+        v = v[~np.isnan(v)]
+        lo, hi = float(self.edges[0]), float(self.edges[-1])
+        self.underflow += int(np.count_nonzero(v < lo))
+        self.overflow += int(np.count_nonzero(v > hi))
+        if self._uniform:
+            # Equal-width bins let NumPy compute bin indices directly instead of bisecting.
+            block_counts, _ = np.histogram(v, bins=self.counts.size, range=(lo, hi))
+        else:
+            block_counts, _ = np.histogram(v, bins=self.edges)
+        self.counts += block_counts
+
+    def merge(self, other: StreamingHistogram) -> None:
+        """Add the counts of another histogram with identical edges.
+
+        Raises:
+            ValueError: If the bin edges differ.
+        """
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("cannot merge histograms with different bin edges")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+
+# ------------------------------------------------------------------------------
+@dataclass(slots=True)
+class TopK:
+    """The k entries with the smallest keys seen so far, plus per-entry payload columns.
+
+    Each update partitions the current selection together with the incoming block around the
+    k-th smallest key (``np.partition``, linear time) and keeps only the winners, so memory is
+    O(block + k). Ties are broken by the first payload column, which makes the result
+    independent of how the stream was split into blocks or workers.
+
+    Args:
+        k: Number of entries to keep (must be ≥ 1).
+        columns: Names of the payload columns (int64), e.g. ``("n", "sigma")``.
+    """
+
+    k: int
+    columns: tuple[str, ...]
+    keys: np.ndarray = field(init=False)
+    values: dict[str, np.ndarray] = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.k < 1:
+            raise ValueError("k must be >= 1")
+        if not self.columns:
+            raise ValueError("at least one payload column is required")
+        self.keys = np.array([], dtype=np.int64)
+        self.values = {name: np.array([], dtype=np.int64) for name in self.columns}
+
+    def _select(self, keys: np.ndarray, values: dict[str, np.ndarray]) -> None:
+        """Keep the k smallest (key, first column) pairs of the given entries, sorted."""
+        if keys.size > self.k:
+            # Anything tied with the k-th key must survive until the tie-break below.
+            kth = np.partition(keys, self.k - 1)[self.k - 1]
+            keep = np.flatnonzero(keys <= kth)
+            keys = keys[keep]
+            values = {name: col[keep] for name, col in values.items()}
+        order = np.lexsort((values[self.columns[0]], keys))[: self.k]
+        self.keys = keys[order]
+        self.values = {name: col[order] for name, col in values.items()}
+
+    def update(self, keys: np.ndarray, **values: np.ndarray) -> None:
+        """Offer a block of entries.
+
+        Args:
+            keys: Ranking keys (smaller is better).
+            **values: One array per payload column, aligned with keys.
+
+        Raises:
+            ValueError: If the payload columns do not match.
+        """
+        if set(values) != set(self.columns):
+            raise ValueError(f"expected payload columns {self.columns}, got {tuple(values)}")
+        self._select(
+            np.concatenate([self.keys, np.asarray(keys)]),
+            {
+                name: np.concatenate([self.values[name], np.asarray(values[name])])
+                for name in self.columns
+            },
+        )
+
+    def merge(self, other: TopK) -> None:
+        """Merge the selection of another tracker (e.g. from a worker process).
+
+        Raises:
+            ValueError: If k or the payload columns differ.
+        """
+        if other.k != self.k or other.columns != self.columns:
+            raise ValueError("cannot merge TopK trackers with different k or columns")
+        self.update(other.keys, **other.values)
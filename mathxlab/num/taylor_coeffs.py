@@ -0,0 +1,304 @@
+"""Taylor coefficients of arbitrary sympy expressions, cached on disk.
+
+:func:`taylor_coefficients` turns a sympy expression f(x) into float64 coefficients c_0..c_n of
+(x - x0)^k. These evaluate with the vectorized :func:`mathxlab.num.series.horner` kernel.
+
+Expressions built from +, *, powers and exp / log / sin / cos / tan / sinh / cosh / tanh / atan
+are expanded in Taylor mode. The expression tree is walked once, and every node becomes a
+truncated power series with mpmath coefficients (30 digits), via the usual O(n^2) recurrences.
+This takes milliseconds even where ``sympy.series`` needs minutes: symbolic constants such as
+sin(1/2) swell at every order. Any other function falls back to the exact ``sympy.series``
+expansion.
+
+Either way, results can be stored in a :class:`CoefficientCache`, one small JSON file per
+(expression, x0, degree), so a slow expansion happens once per expression, not once per run.
+Floats passed as x0 are converted to the exact rational they represent, so the cache key and
+the expansion point are the same for every run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import mpmath
+import numpy as np
+import sympy
+
+ALGORITHM = "taylor/1"
+"""Tag stored with cached coefficients; bump it if the derivation changes."""
+
+_DIGITS = 30
+"""Decimal digits carried through the expansion before rounding to float64."""
+
+_Series = list[mpmath.mpf]
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class CoefficientCache:
+    """Directory of cached Taylor coefficients.
+
+    Args:
+        directory: Cache directory (created on first save).
+    """
+
+    directory: Path
+
+    def path(self, key: str) -> Path:
+        """Cache file for a key."""
+        return self.directory / f"taylor_{key}.json"
+
+    def load(self, key: str) -> np.ndarray | None:
+        """Return cached coefficients, or None if missing, unreadable or from another algorithm."""
+        try:
+            text = self.path(key).read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            meta = json.loads(text)
+        except ValueError:
+            return None
+        if meta.get("algorithm") != ALGORITHM or meta.get("key") != key:
+            return None
+        return np.asarray(meta["coeffs"], dtype=np.float64)
+
+    def save(self, key: str, coeffs: np.ndarray, *, description: str) -> None:
+        """Atomically write coefficients for a key.
+
+        Args:
+            key: Cache key from :func:`cache_key`.
+            coeffs: Coefficients to store.
+            description: Human-readable (expression, x0, degree), stored for inspection.
+        """
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        body = {
+            "algorithm": ALGORITHM,
+            "key": key,
+            "description": description,
+            "coeffs": [float(c) for c in coeffs],
+        }
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(body, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+# ------------------------------------------------------------------------------
+class _Unsupported(Exception):
+    """Raised by the Taylor-mode walker for nodes it cannot expand."""
+
+
+# ------------------------------------------------------------------------------
+class _NotAnalytic(Exception):
+    """Raised when f has no Taylor expansion at x0."""
+
+
+# ------------------------------------------------------------------------------
+def _mul(a: _Series, b: _Series) -> _Series:
+    """Truncated Cauchy product."""
+    return [mpmath.fsum(a[j] * b[k - j] for j in range(k + 1)) for k in range(len(a))]
+
+
+# ------------------------------------------------------------------------------
+def _recip(a: _Series) -> _Series:
+    """1 / a."""
+    if a[0] == 0:
+        raise _NotAnalytic
+    b = [1 / a[0]]
+    for k in range(1, len(a)):
+        b.append(-mpmath.fsum(a[j] * b[k - j] for j in range(1, k + 1)) / a[0])
+    return b
+
+
+# ------------------------------------------------------------------------------
+def _exp(a: _Series) -> _Series:
+    """exp(a), from b' = a' b."""
+    b = [mpmath.exp(a[0])]
+    for k in range(1, len(a)):
+        b.append(mpmath.fsum(j * a[j] * b[k - j] for j in range(1, k + 1)) / k)
+    return b
+
+
+# ------------------------------------------------------------------------------
+def _log(a: _Series) -> _Series:
+    """log(a) for a(x0) > 0, from a b' = a'."""
+    if not a[0] > 0:
+        raise _NotAnalytic
+    b = [mpmath.log(a[0])]
+    for k in range(1, len(a)):
+        b.append((a[k] - mpmath.fsum(j * b[j] * a[k - j] for j in range(1, k)) / k) / a[0])
+    return b
+
+
+# ------------------------------------------------------------------------------
+def _sin_cos(a: _Series, *, hyperbolic: bool) -> tuple[_Series, _Series]:
+    """(sin a, cos a) or (sinh a, cosh a), from s' = a' c and c' = -+a' s."""
+    sign = 1 if hyperbolic else -1
+    s = [mpmath.sinh(a[0]) if hyperbolic else mpmath.sin(a[0])]
+    c = [mpmath.cosh(a[0]) if hyperbolic else mpmath.cos(a[0])]
+    for k in range(1, len(a)):
+        s.append(mpmath.fsum(j * a[j] * c[k - j] for j in range(1, k + 1)) / k)
+        c.append(sign * mpmath.fsum(j * a[j] * s[k - j] for j in range(1, k + 1)) / k)
+    return s, c
+
+
+# ------------------------------------------------------------------------------
+def _atan(a: _Series) -> _Series:
+    """atan(a), by integrating a' / (1 + a^2)."""
+    da = [*(k * a[k] for k in range(1, len(a))), mpmath.mpf(0)]
+    one_plus = _mul(a, a)
+    one_plus[0] += 1
+    d = _mul(da, _recip(one_plus))
+    return [mpmath.atan(a[0]), *(d[k - 1] / k for k in range(1, len(a)))]
+
+
+# ------------------------------------------------------------------------------
+def _pow(a: _Series, e: sympy.Expr) -> _Series:
+    """a^e for a constant exponent e."""
+    if e.is_Integer:
+        n = int(e)
+        base = a if n >= 0 else _recip(a)
+        out = [mpmath.mpf(1)] + [mpmath.mpf(0)] * (len(a) - 1)
+        for _ in range(abs(n)):
+            out = _mul(out, base)
+        return out
+    scale = mpmath.mpf(sympy.N(e, _DIGITS))
+    return _exp([scale * t for t in _log(a)])
+
+
+# ------------------------------------------------------------------------------
+def _taylor_mode(node: sympy.Expr, x: sympy.Symbol, a: sympy.Expr, n: int) -> _Series:
+    """Truncated Taylor series (n terms) of node around x = a."""
+    zeros = [mpmath.mpf(0)] * (n - 1)
+    if node == x:
+        return [mpmath.mpf(sympy.N(a, _DIGITS)), mpmath.mpf(1), *zeros][:n]
+    if not node.has(x):
+        value = sympy.N(node, _DIGITS)
+        if not value.is_real:
+            raise _Unsupported
+        return [mpmath.mpf(value), *zeros]
+    args = node.args
+    if isinstance(node, sympy.Add):
+        parts = [_taylor_mode(t, x, a, n) for t in args]
+        return [mpmath.fsum(col) for col in zip(*parts, strict=True)]
+    if isinstance(node, sympy.Mul):
+        out = _taylor_mode(args[0], x, a, n)
+        for t in args[1:]:
+            out = _mul(out, _taylor_mode(t, x, a, n))
+        return out
+    if isinstance(node, sympy.Pow):
+        base = _taylor_mode(args[0], x, a, n)
+        if args[1].has(x):
+            return _exp(_mul(_taylor_mode(args[1], x, a, n), _log(base)))
+        return _pow(base, args[1])
+    if len(args) != 1:
+        raise _Unsupported
+    inner = _taylor_mode(args[0], x, a, n)
+    if isinstance(node, sympy.exp):
+        return _exp(inner)
+    if isinstance(node, sympy.log):
+        return _log(inner)
+    if isinstance(node, sympy.atan):
+        return _atan(inner)
+    if isinstance(node, sympy.sin | sympy.cos | sympy.tan):
+        s, c = _sin_cos(inner, hyperbolic=False)
+    elif isinstance(node, sympy.sinh | sympy.cosh | sympy.tanh):
+        s, c = _sin_cos(inner, hyperbolic=True)
+    else:
+        raise _Unsupported
+    if isinstance(node, sympy.sin | sympy.sinh):
+        return s
+    if isinstance(node, sympy.cos | sympy.cosh):
+        return c
+    return _mul(s, _recip(c))
+
+
+# ------------------------------------------------------------------------------
+def _series_coefficients(
+    f: sympy.Expr, x: sympy.Symbol, a: sympy.Expr, degree: int
+) -> list[sympy.Expr]:
+    """Coefficients from ``sympy.series`` (fallback for functions Taylor mode lacks)."""
+    h = sympy.Dummy("h")
+    poly_expr = sympy.series(f.subs(x, a + h), h, 0, degree + 1).removeO()
+    try:
+        poly = sympy.Poly(poly_expr, h)
+    except sympy.PolynomialError:
+        raise _NotAnalytic from None
+    return [sympy.N(poly.coeff_monomial(h**k), _DIGITS) for k in range(degree + 1)]
+
+
+# ------------------------------------------------------------------------------
+def _parse(expr: str | sympy.Expr, x0: float | str, symbol: str) -> tuple[sympy.Expr, sympy.Expr]:
+    """Sympify the expression and the expansion point (floats become exact rationals)."""
+    f = sympy.sympify(expr)
+    a = sympy.Rational(x0) if isinstance(x0, float | int) else sympy.sympify(x0)
+    if not a.is_real:
+        raise ValueError(f"x0 must be a real number, got {x0!r}")
+    extra = f.free_symbols - {sympy.Symbol(symbol)}
+    if extra:
+        raise ValueError(
+            f"expression has free symbols other than {symbol}: {sorted(map(str, extra))}"
+        )
+    return f, a
+
+
+# ------------------------------------------------------------------------------
+def cache_key(expr: str | sympy.Expr, x0: float | str, degree: int, *, symbol: str = "x") -> str:
+    """Stable hash of (expression, x0, degree, symbol) for :class:`CoefficientCache`."""
+    f, a = _parse(expr, x0, symbol)
+    text = "|".join((sympy.srepr(f), sympy.srepr(a), str(degree), symbol, ALGORITHM))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+# ------------------------------------------------------------------------------
+def taylor_coefficients(
+    expr: str | sympy.Expr,
+    x0: float | str,
+    degree: int,
+    *,
+    symbol: str = "x",
+    cache: CoefficientCache | None = None,
+) -> np.ndarray:
+    """Taylor coefficients c_k of f(x) = sum_k c_k (x - x0)^k, k = 0..degree.
+
+    Args:
+        expr: Expression in one variable, e.g. ``"exp(sin(x)) / (1 + x**2)"``.
+        x0: Expansion point (a float, or a sympy string such as ``"pi/4"``).
+        degree: Highest power (≥ 0).
+        symbol: Name of the variable in expr.
+        cache: Optional disk cache (looked up first, filled after an expansion).
+
+    Returns:
+        float64 array of length degree + 1.
+
+    Raises:
+        ValueError: If degree < 0, the input is not a univariate real expression, or f is not
+            analytic at x0.
+    """
+    if degree < 0:
+        raise ValueError("degree must be >= 0")
+    key = cache_key(expr, x0, degree, symbol=symbol)
+    if cache is not None and (hit := cache.load(key)) is not None and hit.size == degree + 1:
+        return hit
+
+    f, a = _parse(expr, x0, symbol)
+    x = sympy.Symbol(symbol)
+    try:
+        with mpmath.workdps(_DIGITS):
+            try:
+                raw = [sympy.Float(c, _DIGITS) for c in _taylor_mode(f, x, a, degree + 1)]
+            except _Unsupported:
+                raw = _series_coefficients(f, x, a, degree)
+    except _NotAnalytic:
+        raise ValueError(f"{f} is not analytic at x0 = {a}") from None
+    if not all(c.is_real and c.is_finite for c in raw):
+        raise ValueError(f"{f} is not analytic at x0 = {a}")
+    coeffs = np.array([float(c) for c in raw], dtype=np.float64)
+
+    if cache is not None:
+        cache.save(key, coeffs, description=f"{f} around {a}, degree {degree}")
+    return coeffs
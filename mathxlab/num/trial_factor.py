@@ -0,0 +1,224 @@
+"""Class-based trial factoring of Mersenne numbers M_p = 2^p - 1.
+
+Every prime factor of M_p (p an odd prime) has the form q = 2pk + 1 with q ≡ ±1 (mod 8). The
+engine splits k into residue classes modulo 4620 = 4·3·5·7·11. A class is dropped entirely when
+its q values are ≢ ±1 (mod 8) or divisible by 3, 5, 7, or 11. For p > 11 that leaves 960 of 4620
+classes, about 21% of all k.
+
+Within the surviving classes, the q values form arithmetic progressions q0 + (2p·4620)·i. These
+are sieved with small primes (one modular inverse per prime, then strided marking), so most
+composite q are removed without a global primality table. The remaining candidates go through
+the vectorized 2^p mod q kernel of :mod:`mathxlab.num.modarith`. It supports q < 2^50, so
+q_max is no longer limited by memory.
+
+Candidates are processed in bands of increasing k across all classes, so the first factor
+reported is the smallest one. That factor is prime: a composite hit would have a smaller prime
+factor of the same form.
+
+:func:`extend_trial_factor` records per-exponent progress (highest k searched, factor) in a
+:class:`~mathxlab.num.mersenne_store.MersenneStore`. Raising q_max later then only searches the
+new range.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from mathxlab.num.mersenne_store import MersenneStore, TfRecord
+from mathxlab.num.modarith import MAX_MODULUS, pow2_mod
+from mathxlab.num.primes import primes_up_to
+
+CLASS_MODULUS = 4 * 3 * 5 * 7 * 11
+DEFAULT_SIEVE_LIMIT = 1 << 16
+DEFAULT_BAND_COLUMNS = 1 << 10
+_CLASS_PRIMES = (3, 5, 7, 11)
+# Tag stored with trial-factoring progress; bump when a change could alter results.
+TF_ALGORITHM = "trial-factor/1"
+_CLASSES = np.arange(CLASS_MODULUS, dtype=np.int64)
+_RESIDUES = {m: _CLASSES % m for m in (4, *_CLASS_PRIMES)}
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class TrialFactorResult:
+    """Outcome of trial factoring one M_p.
+
+    Args:
+        p: Exponent.
+        factor: Smallest factor q ≤ q_max found (None if there is none).
+        k_searched: Every k ≤ k_searched has been tested (the end of the band that contained
+            the factor if one was found, else k_max).
+        candidates: Number of q values that reached the 2^p mod q test.
+    """
+
+    p: int
+    factor: int | None
+    k_searched: int
+    candidates: int
+
+
+# ------------------------------------------------------------------------------
+def candidate_classes(p: int) -> np.ndarray:
+    """Residues c mod 4620 for which k ≡ c can give a factor q = 2pk + 1 of M_p.
+
+    q ≡ ±1 (mod 8) holds iff pk ≡ 0 or 3 (mod 4), and r | q (r = 3, 5, 7, 11) iff
+    k ≡ -(2p)^(-1) (mod r). Both conditions only look at c modulo 4 and r.
+
+    Args:
+        p: Odd prime exponent.
+
+    Returns:
+        Sorted int64 array of surviving residues.
+    """
+    keep = (_RESIDUES[4] == 0) | (_RESIDUES[4] == (3 * p) % 4)
+    for r in _CLASS_PRIMES:
+        if p % r:
+            keep &= _RESIDUES[r] != (-pow(2 * p, -1, r)) % r
+    return np.asarray(_CLASSES[keep], dtype=np.int64)
+
+
+# ------------------------------------------------------------------------------
+def _small_prime_factor(p: int, q_lo: int, q_max: int, small: np.ndarray) -> int | None:
+    """Smallest factor among the sieving primes themselves (the sieve would discard them)."""
+    q = small[(small >= q_lo) & (small <= q_max) & (small % (2 * p) == 1)]
+    q = q[(q % 8 == 1) | (q % 8 == 7)]
+    if q.size == 0:
+        return None
+    hits = np.flatnonzero(pow2_mod(p, q) == 1)
+    return int(q[hits[0]]) if hits.size else None
+
+
+# ------------------------------------------------------------------------------
+def _sieve_band(
+    q0: np.ndarray, step: int, i_start: int, cols: int, sieve_primes: np.ndarray, p: int
+) -> np.ndarray:
+    """Mark q0[c] + step·(i_start + j) (j < cols) that are divisible by a sieving prime.
+
+    Returns:
+        Boolean grid (classes x cols), True where the candidate survives.
+    """
+    alive = np.ones((q0.size, cols), dtype=bool)
+    rows = np.arange(q0.size)
+    for r in sieve_primes.tolist():
+        if r == p:
+            continue  # q ≡ 1 (mod p) is never divisible by p
+        inv = pow(step % r, -1, r)
+        # q0 + step·i ≡ 0 (mod r)  <=>  i ≡ -q0·step^(-1) (mod r)
+        first = (-(q0 % r) * inv - i_start) % r
+        if r >= cols:
+            hit = first < cols
+            alive[rows[hit], first[hit]] = False
+        else:
+            j = first[:, None] + r * np.arange(-(-cols // r))[None, :]
+            ok = j < cols
+            alive[np.broadcast_to(rows[:, None], j.shape)[ok], j[ok]] = False
+    return alive
+
+
+# ------------------------------------------------------------------------------
+def trial_factor(
+    p: int,
+    *,
+    q_max: int,
+    k_start: int = 1,
+    sieve_limit: int = DEFAULT_SIEVE_LIMIT,
+    band_columns: int = DEFAULT_BAND_COLUMNS,
+) -> TrialFactorResult:
+    """Find the smallest factor q = 2pk + 1 ≤ q_max of M_p with k ≥ k_start.
+
+    Args:
+        p: Odd prime exponent.
+        q_max: Search limit for q (must be < 2^50).
+        k_start: First k to search (k < k_start is assumed to be excluded already).
+        sieve_limit: Largest small prime used to sieve candidates.
+        band_columns: Progression steps per class processed at once (memory ~ 960 x this).
+
+    Returns:
+        The factor (if any) and how far k has been searched.
+
+    Raises:
+        ValueError: If p < 3, k_start < 1, or q_max ≥ 2^50.
+    """
+    if p < 3:
+        raise ValueError("p must be an odd prime >= 3")
+    if k_start < 1:
+        raise ValueError("k_start must be >= 1")
+    if q_max >= MAX_MODULUS:
+        raise ValueError("q_max must be < 2**50")
+
+    k_max = (q_max - 1) // (2 * p)
+    if k_max < k_start:
+        return TrialFactorResult(p=p, factor=None, k_searched=max(k_max, k_start - 1), candidates=0)
+
+    # Every prime up to the sieve limit is checked directly: the class filter drops 3..11 and
+    # the sieve drops each sieving prime, even when it is itself a factor in range.
+    small = primes_up_to(min(sieve_limit, q_max))
+    f = _small_prime_factor(p, 2 * p * k_start + 1, q_max, small)
+    if f is not None:
+        return TrialFactorResult(p=p, factor=f, k_searched=(f - 1) // (2 * p), candidates=0)
+    small = small[(small > _CLASS_PRIMES[-1]) & (small <= math.isqrt(q_max))]
+
+    classes = candidate_classes(p)
+    if k_max < CLASS_MODULUS:
+        classes = classes[classes <= k_max]
+    step = 2 * p * CLASS_MODULUS
+    q0 = 2 * p * classes + 1
+    i_lo = (k_start - 1) // CLASS_MODULUS
+    i_hi = k_max // CLASS_MODULUS + 1
+    tested = 0
+
+    for i0 in range(i_lo, i_hi, band_columns):
+        cols = min(band_columns, i_hi - i0)
+        # Sieving a prime r costs one vectorized pass but only saves ~cells/r kernel calls, so
+        # small bands use few sieving primes.
+        r_cap = classes.size * cols * p.bit_length() // 2048
+        alive = _sieve_band(q0, step, i0, cols, small[small <= r_cap], p)
+
+        k = classes[:, None] + CLASS_MODULUS * (i0 + np.arange(cols))[None, :]
+        alive &= (k >= k_start) & (k <= k_max)
+        q = 2 * p * k[alive] + 1
+        tested += q.size
+        if q.size:
+            hits = q[pow2_mod(p, q) == 1]
+            if hits.size:
+                band_end = min(k_max, CLASS_MODULUS * (i0 + cols) - 1)
+                return TrialFactorResult(
+                    p=p, factor=int(hits.min()), k_searched=band_end, candidates=tested
+                )
+
+    return TrialFactorResult(p=p, factor=None, k_searched=k_max, candidates=tested)
+
+
+# ------------------------------------------------------------------------------
+def extend_trial_factor(p: int, *, q_max: int, store: MersenneStore) -> TrialFactorResult:
+    """Trial factor M_p up to q_max, continuing from the progress recorded in a store.
+
+    A stored factor is reused if it is ≤ q_max. Since searches always run in increasing k, a
+    stored factor above q_max also shows that there is none below. Otherwise only
+    k > k_searched is searched, and the new progress is written back.
+
+    Args:
+        p: Odd prime exponent.
+        q_max: Search limit for q (must be < 2^50).
+        store: Store holding per-exponent progress.
+
+    Returns:
+        The smallest factor ≤ q_max (if any). ``candidates`` counts only the work of this call.
+    """
+    k_max = (q_max - 1) // (2 * p)
+    rec = store.get_tf([p], algorithm=TF_ALGORITHM).get(p)
+    if rec is not None and rec.factor is not None:
+        found = rec.factor if rec.factor <= q_max else None
+        return TrialFactorResult(p=p, factor=found, k_searched=rec.k_searched, candidates=0)
+    if rec is not None and rec.k_searched >= k_max:
+        return TrialFactorResult(p=p, factor=None, k_searched=rec.k_searched, candidates=0)
+
+    k_start = 1 if rec is None else rec.k_searched + 1
+    res = trial_factor(p, q_max=q_max, k_start=k_start)
+    store.put_tf(
+        TfRecord(p=p, algorithm=TF_ALGORITHM, k_searched=res.k_searched, factor=res.factor)
+    )
+    return res
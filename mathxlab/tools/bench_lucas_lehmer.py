@@ -0,0 +1,145 @@
+"""
+Benchmark Lucas–Lehmer iterations: general ``%``, Mersenne shift-and-mask, and IBDWT FFT squaring.
+
+This script is designed to be executed as a module:
+
+    python -m mathxlab.tools.bench_lucas_lehmer
+
+A full LLT at p = 100 000 takes minutes, so each exponent is timed over a fixed number of
+iterations and reported per iteration (the test itself is p-2 identical iterations).
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from time import perf_counter
+
+from mathxlab.num.ibdwt import from_digits, make_plan, square_digits, to_digits
+from mathxlab.num.mersenne import lucas_lehmer_step
+
+DEFAULT_EXPONENTS = (1_279, 2_203, 4_423, 11_213, 21_701, 44_497, 86_243)
+
+
+# ------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class BenchRow:
+    """Per-iteration timings for one exponent.
+
+    Args:
+        p: Mersenne exponent.
+        t_mod_us: Microseconds per iteration with ``(s*s - 2) % M_p``.
+        t_fold_us: Microseconds per iteration with shift-and-mask reduction.
+        t_fft_us: Microseconds per iteration with IBDWT squaring.
+        fft_length: IBDWT FFT length.
+        max_roundoff: Largest IBDWT round-off error seen.
+    """
+
+    p: int
+    t_mod_us: float
+    t_fold_us: float
+    t_fft_us: float
+    fft_length: int
+    max_roundoff: float
+
+    @property
+    def speedup(self) -> float:
+        """Ratio t_mod / t_fold."""
+        return self.t_mod_us / self.t_fold_us
+
+
+# ------------------------------------------------------------------------------
+def bench_exponent(p: int, *, iterations: int) -> BenchRow:
+    """Time all three variants for one exponent on the same starting residue.
+
+    Args:
+        p: Mersenne exponent.
+        iterations: LLT iterations to time per variant.
+
+    Returns:
+        Timings for p.
+    """
+    mp = (1 << p) - 1
+    s0 = 4
+    # Warm up into a full-size residue so both variants square p-bit numbers.
+    while s0.bit_length() < p - 1:
+        s0 = (s0 * s0 - 2) % mp
+
+    s = s0
+    t0 = perf_counter()
+    for _ in range(iterations):
+        s = (s * s - 2) % mp
+    t_mod = perf_counter() - t0
+    ref = s
+
+    s = s0
+    t0 = perf_counter()
+    for _ in range(iterations):
+        s = lucas_lehmer_step(s, p, mp)
+    t_fold = perf_counter() - t0
+
+    if s != ref:
+        raise RuntimeError(f"reduction mismatch at p={p}")
+
+    plan = make_plan(p)
+    z = to_digits(s0, plan)
+    worst = 0.0
+    t0 = perf_counter()
+    for _ in range(iterations):
+        z, err = square_digits(z, plan, subtract=2)
+        worst = max(worst, err)
+    t_fft = perf_counter() - t0
+
+    if from_digits(z, plan) != ref:
+        raise RuntimeError(f"IBDWT mismatch at p={p}")
+    scale = 1e6 / iterations
+    return BenchRow(
+        p=p,
+        t_mod_us=t_mod * scale,
+        t_fold_us=t_fold * scale,
+        t_fft_us=t_fft * scale,
+        fft_length=plan.n,
+        max_roundoff=worst,
+    )
+
+
+# ------------------------------------------------------------------------------
+def main() -> int:
+    """CLI entrypoint.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--exponents",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_EXPONENTS),
+        help="Mersenne exponents to benchmark.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=200,
+        help="LLT iterations timed per exponent and variant (default: 200).",
+    )
+    args = parser.parse_args()
+
+    print(
+        "| p | % M_p [µs/iter] | shift-and-mask [µs/iter] | speedup "
+        "| IBDWT [µs/iter] | FFT length | round-off |"
+    )
+    print("|---:|---:|---:|---:|---:|---:|---:|")
+    for p in args.exponents:
+        row = bench_exponent(p, iterations=args.iterations)
+        print(
+            f"| {row.p} | {row.t_mod_us:.1f} | {row.t_fold_us:.1f} | {row.speedup:.2f} "
+            f"| {row.t_fft_us:.1f} | {row.fft_length} | {row.max_roundoff:.4f} |"
+        )
+    return 0
+
+
+# ------------------------------------------------------------------------------
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+"""
+Inspect or invalidate the shared Mersenne result cache (Lucas–Lehmer, trial factoring, P-1).
+
+This script is designed to be executed as a module:
+
+    python -m mathxlab.tools.mersenne_cache info
+    python -m mathxlab.tools.mersenne_cache clear [--table llt|tf|pm1] [--algorithm TAG]
+
+The ``llt`` table holds Lucas–Lehmer residues, ``tf`` holds per-exponent trial-factoring progress,
+and ``pm1`` holds the P-1 bounds tried per exponent.
+
+The cache lives in ``out/cache`` by default (the experiments' ``--cache-dir``).
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from mathxlab.exp.cli import DEFAULT_CACHE_DIR
+from mathxlab.num.mersenne import LLT_ALGORITHM
+from mathxlab.num.mersenne_store import TABLES, MersenneStore
+from mathxlab.num.pminus1 import PM1_ALGORITHM
+from mathxlab.num.trial_factor import TF_ALGORITHM
+
+
+# ------------------------------------------------------------------------------
+def main() -> int:
+    """CLI entrypoint.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Cache directory (default: {DEFAULT_CACHE_DIR}).",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("info", help="Show stored results per algorithm tag.")
+    clear = sub.add_parser("clear", help="Delete stored results.")
+    clear.add_argument(
+        "--table",
+        choices=TABLES,
+        default=None,
+        help="Only clear this table (default: all tables).",
+    )
+    clear.add_argument(
+        "--algorithm",
+        default=None,
+        help="Only delete results with this algorithm tag (default: all).",
+    )
+    args = parser.parse_args()
+
+    store = MersenneStore.in_dir(args.cache_dir)
+    if not store.path.exists():
+        print(f"No cache at {store.path}")
+        return 0
+
+    if args.command == "info":
+        print(
+            f"Cache: {store.path} (current tags: llt={LLT_ALGORITHM}, tf={TF_ALGORITHM}, "
+            f"pm1={PM1_ALGORITHM})"
+        )
+        for s in store.summary():
+            hits = "Mersenne primes" if s.table == "llt" else "with a known factor"
+            print(
+                f"  {s.table} {s.algorithm}: {s.count} exponents in [{s.p_min}, {s.p_max}], "
+                f"{s.hits} {hits}"
+            )
+        return 0
+
+    removed = store.clear(table=args.table, algorithm=args.algorithm)
+    print(f"Removed {removed} results from {store.path}")
+    return 0
+
+
+# ------------------------------------------------------------------------------
+if __name__ == "__main__":
+    raise SystemExit(main())
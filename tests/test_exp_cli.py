@@ -28,3 +28,23 @@ def test_parse_experiment_args_missing_required() -> None:
 def test_parse_experiment_args_help() -> None:
     with pytest.raises(SystemExit):
         parse_experiment_args(argv=["--help"])
+
+
+def test_parse_experiment_args_cache_dir() -> None:
+    args = parse_experiment_args(argv=["--out", "out/e008"])
+    assert args.cache_dir == Path("out/cache")
+    args = parse_experiment_args(argv=["--out", "out/e008", "--cache-dir", "/tmp/c"])
+    assert args.cache_dir == Path("/tmp/c")
+    args = parse_experiment_args(argv=["--out", "out/e008", "--no-cache"])
+    assert args.cache_dir is None
+
+
+def test_parse_experiment_args_resume() -> None:
+    args = parse_experiment_args(argv=["--out", "out/e008"])
+    assert not args.resume
+    assert args.checkpoint_interval == 300.0
+    args = parse_experiment_args(
+        argv=["--out", "out/e008", "--resume", "--checkpoint-interval", "30"]
+    )
+    assert args.resume
+    assert args.checkpoint_interval == 30.0
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mathxlab.num.error_volume import ErrorVolume
+from mathxlab.num.series import taylor_sin_partial_sums
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_volume_matches_dense_errors(tmp_path: Path, workers: int) -> None:
+    centers = np.linspace(-2.0, 2.0, 5)
+    degrees = (0, 3, 8, 21)
+    vol = ErrorVolume.compute(
+        tmp_path / "vol.npy",
+        centers=centers,
+        degrees=degrees,
+        x_min=-4.0,
+        x_max=4.0,
+        num_points=301,
+        x_tile=64,
+        workers=workers,
+    )
+    assert vol.data.shape == (5, 4, 301)
+    assert vol.data.dtype == np.float32
+    assert isinstance(vol.data, np.memmap)
+    for i, c in enumerate(centers):
+        dense = np.abs(taylor_sin_partial_sums(vol.x, c, degrees) - np.sin(vol.x))
+        np.testing.assert_allclose(vol.center_slice(i), dense, rtol=1e-6, atol=1e-30)
+
+    reopened = ErrorVolume.open(tmp_path / "vol.npy")
+    assert reopened.degrees == degrees
+    np.testing.assert_array_equal(reopened.centers, centers)
+    np.testing.assert_array_equal(reopened.degree_slice(8, x_stride=3), vol.data[:, 2, ::3])
+    full = np.asarray(vol.data, dtype=np.float64)
+    np.testing.assert_allclose(vol.reduce_x("max", center_tile=2), full.max(axis=2))
+    np.testing.assert_allclose(vol.reduce_x("mean", center_tile=3), full.mean(axis=2))
+
+
+def test_invalid_arguments(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        ErrorVolume.compute(
+            tmp_path / "v.npy", centers=[], degrees=[1], x_min=0.0, x_max=1.0, num_points=4
+        )
+    vol = ErrorVolume.compute(
+        tmp_path / "v.npy", centers=[0.0], degrees=[1], x_min=0.0, x_max=1.0, num_points=4
+    )
+    with pytest.raises(KeyError):
+        vol.degree_slice(2)
+    with pytest.raises(ValueError):
+        vol.reduce_x("median")
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+import sympy
+
+from mathxlab.num.factorint import (
+    aliquot_sequence,
+    aliquot_sum,
+    clear_cache,
+    factorint,
+    is_prime,
+    pollard_brent,
+    sigma,
+)
+
+
+def test_is_prime_small_and_strong_pseudoprimes() -> None:
+    assert [n for n in range(200) if is_prime(n)] == list(sympy.primerange(200))
+    # Strong pseudoprimes to several small bases, and 64-bit edge cases.
+    for n in [3215031751, 3825123056546413051, 318665857834031151167461, 2**64 - 59, 2**89 - 1]:
+        assert is_prime(n) == sympy.isprime(n)
+
+
+def test_pollard_brent_splits() -> None:
+    n = 1_000_003 * 998_244_353
+    f = pollard_brent(n)
+    assert f in (1_000_003, 998_244_353)
+    assert pollard_brent(n, max_iterations=2) is None
+
+
+def test_factorint_matches_sympy() -> None:
+    rng = random.Random(11)
+    values = [1, 2, 997 * 997, 2**64 - 1, (2**61 - 1) * (2**31 - 1), 10**18 + 9, 7**40]
+    values += [rng.randrange(1, 10**24) for _ in range(30)]
+    clear_cache()
+    for n in values:
+        assert factorint(n) == sympy.factorint(n)
+    with pytest.raises(ValueError):
+        factorint(0)
+
+
+def test_sigma_and_aliquot() -> None:
+    n = sympy.nextprime(10**15) * sympy.nextprime(3 * 10**14)
+    assert sigma(n) == sympy.divisor_sigma(n)
+    assert [sigma(k) for k in range(1, 50)] == [sympy.divisor_sigma(k) for k in range(1, 50)]
+    assert aliquot_sum(28) == 28
+    assert aliquot_sequence(220, max_steps=10) == [220, 284, 220]
+    assert aliquot_sequence(12, max_steps=20) == [12, 16, 15, 9, 4, 3, 1]
+    assert aliquot_sequence(12, max_steps=2) == [12, 16, 15]
+    assert aliquot_sequence(12, max_steps=20, max_value=15) == [12, 16]
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+import sympy
+
+from mathxlab.num.factorization import factorize_batch
+from mathxlab.num.primes import primes_up_to
+from mathxlab.num.spf import SpfTable
+
+
+def test_rows_match_sympy_small_and_large() -> None:
+    rng = np.random.default_rng(7)
+    n = np.concatenate([np.arange(1, 600), rng.integers(1, 10**12, 200), [999_999_999_989, 2**40]])
+    f = factorize_batch(n, spf=SpfTable.build(10_000))
+    assert f.offsets.size == n.size + 1
+    for i, v in enumerate(n.tolist()):
+        assert f.row(i) == sympy.factorint(v)
+
+
+def test_csr_layout() -> None:
+    f = factorize_batch(np.array([1, 12, 7, 1, 360]))
+    assert f.offsets.tolist() == [0, 0, 2, 3, 3, 6]
+    assert f.primes.tolist() == [2, 3, 7, 2, 3, 5]
+    assert f.exponents.tolist() == [2, 1, 1, 3, 2, 1]
+    assert f.counts.tolist() == [0, 2, 1, 0, 3]
+
+
+def test_arithmetic_reductions() -> None:
+    n = np.arange(1, 3000)
+    f = factorize_batch(n)
+    assert f.sigma().tolist() == [int(sympy.divisor_sigma(v)) for v in n.tolist()]
+    assert f.tau().tolist() == [int(sympy.divisor_count(v)) for v in n.tolist()]
+    assert f.phi().tolist() == [int(sympy.totient(v)) for v in n.tolist()]
+
+
+def test_euler_form() -> None:
+    n = np.arange(3, 2000, 2)
+    got = factorize_batch(n).euler_form()
+    expected = []
+    for v in n.tolist():
+        odd = [(p, a) for p, a in sympy.factorint(v).items() if a % 2 == 1]
+        expected.append(len(odd) == 1 and odd[0][0] % 4 == 1 and odd[0][1] % 4 == 1)
+    assert got.tolist() == expected
+
+
+def test_shared_prime_table_and_errors() -> None:
+    n = np.array([10**9 + 7, 999_999_937 * 3, 2**30 + 1])
+    f = factorize_batch(n, spf=SpfTable.build(100), primes=primes_up_to(40_000))
+    assert [f.row(i) for i in range(3)] == [sympy.factorint(int(v)) for v in n]
+    # Tables that stop below √max(n) are extended, never trusted to certify a prime.
+    for table in (primes_up_to(100), primes_up_to(600), np.array([], dtype=np.int64)):
+        f = factorize_batch(np.array([997 * 991]), spf=SpfTable.build(100), primes=table)
+        assert f.row(0) == {991: 1, 997: 1}
+    with pytest.raises(ValueError):
+        factorize_batch(np.array([0, 5]))
+    with pytest.raises(ValueError, match="factorint"):
+        factorize_batch(np.array([2**63 - 1]))
+    assert factorize_batch(np.array([], dtype=np.int64)).sigma().size == 0
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mathxlab.num.filter_pipeline import (
+    FilterPipeline,
+    FilterStage,
+    arange_blocks,
+    iter_spilled,
+)
+
+
+def _odd_square_free(x: np.ndarray) -> np.ndarray:
+    return np.asarray((x % 9 != 0) & (x % 25 != 0), dtype=bool)
+
+
+def test_arange_blocks_cover_range() -> None:
+    blocks = list(arange_blocks(3, 100, step=2, block_size=7))
+    assert all(b.size <= 7 for b in blocks)
+    np.testing.assert_array_equal(np.concatenate(blocks), np.arange(3, 100, 2))
+    with pytest.raises(ValueError):
+        next(arange_blocks(0, 10, block_size=0))
+
+
+def test_pipeline_matches_direct_masks_and_counts() -> None:
+    stages = [
+        FilterStage(name="mod3", predicate=lambda x: x % 3 == 1, cost=1.0, selectivity=1 / 3),
+        FilterStage(name="sqfree", predicate=_odd_square_free, cost=2.0, selectivity=0.8),
+    ]
+    pipe = FilterPipeline(stages=stages)
+    assert pipe.order == ["mod3", "sqfree"]
+    got = np.concatenate(list(pipe.run(arange_blocks(1, 10_000, block_size=1000))))
+    x = np.arange(1, 10_000)
+    np.testing.assert_array_equal(got, x[(x % 3 == 1) & _odd_square_free(x)])
+    assert pipe.counters["mod3"].seen == x.size
+    assert pipe.counters["sqfree"].seen == pipe.counters["mod3"].passed
+    assert pipe.counters["sqfree"].passed == got.size
+
+
+def test_adaptive_order_corrects_wrong_declarations() -> None:
+    # "keep_all" claims to drop 90% but drops nothing; "mod10" claims to drop little.
+    stages = [
+        FilterStage(name="keep_all", predicate=lambda x: x >= 0, cost=1.0, selectivity=0.1),
+        FilterStage(name="mod10", predicate=lambda x: x % 10 == 0, cost=1.0, selectivity=0.9),
+    ]
+    pipe = FilterPipeline(stages=stages, adaptive=True, min_seen=100)
+    assert pipe.order == ["keep_all", "mod10"]
+    survivors = sum(b.size for b in pipe.run(arange_blocks(0, 20_000, block_size=1000)))
+    assert survivors == 2000
+    assert pipe.order == ["mod10", "keep_all"]
+
+
+def test_spill_roundtrip(tmp_path: Path) -> None:
+    pipe = FilterPipeline(stages=[FilterStage(name="even", predicate=lambda x: x % 2 == 0)])
+    (tmp_path / "survivors_99999999.npy").write_bytes(b"stale")
+    total = pipe.run_to_disk(arange_blocks(0, 5000, block_size=512), tmp_path)
+    back = np.concatenate(list(iter_spilled(tmp_path)))
+    assert total == back.size == 2500
+    np.testing.assert_array_equal(back, np.arange(0, 5000, 2))
+
+
+def test_invalid_stages_rejected() -> None:
+    with pytest.raises(ValueError):
+        FilterStage(name="x", predicate=lambda x: x > 0, cost=0.0)
+    with pytest.raises(ValueError):
+        FilterStage(name="x", predicate=lambda x: x > 0, selectivity=1.5)
+    s = FilterStage(name="x", predicate=lambda x: x > 0)
+    with pytest.raises(ValueError):
+        FilterPipeline(stages=[s, s])
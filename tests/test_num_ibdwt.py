@@ -0,0 +1,56 @@
+import random
+
+import numpy as np
+import pytest
+
+from mathxlab.num.ibdwt import (
+    choose_fft_length,
+    from_digits,
+    lucas_lehmer_residue_ibdwt,
+    make_plan,
+    max_digit_bits,
+    square_digits,
+    to_digits,
+)
+from mathxlab.num.mersenne import lucas_lehmer_residue
+
+
+def test_make_plan_digit_layout() -> None:
+    plan = make_plan(127, 8)
+    assert plan.bits.sum() == 127
+    assert set(plan.bits.tolist()) <= {15, 16}
+    assert plan.shifts[0] == 0
+    assert np.all((plan.weight >= 1.0) & (plan.weight < 2.0))
+
+
+@pytest.mark.parametrize(("p", "n"), [(89, 8), (1279, 64), (4423, 320)])
+def test_digits_roundtrip_and_square(p: int, n: int) -> None:
+    plan = make_plan(p, n)
+    mp = (1 << p) - 1
+    rng = random.Random(p)
+    for _ in range(5):
+        x = rng.randrange(mp)
+        z = to_digits(x, plan)
+        assert np.all(np.abs(z) <= plan.base / 2)
+        assert from_digits(z, plan) == x
+        sq, err = square_digits(z, plan, subtract=2)
+        assert err < 0.1
+        assert from_digits(sq, plan) == (x * x - 2) % mp
+
+
+@pytest.mark.parametrize("p", [3, 7, 61, 521, 1279, 2203, 11, 23, 1277, 4421])
+def test_lucas_lehmer_ibdwt_matches_integer_kernel(p: int) -> None:
+    result = lucas_lehmer_residue_ibdwt(p)
+    assert result.residue == lucas_lehmer_residue(p, backend="int")
+    assert result.max_roundoff < 0.1
+
+
+def test_choose_fft_length_respects_digit_budget() -> None:
+    for p in [100, 10_007, 86_243, 1_000_003]:
+        n = choose_fft_length(p)
+        assert p / n <= max_digit_bits(n)
+
+
+def test_roundoff_monitor_rejects_too_short_fft() -> None:
+    with pytest.raises(RuntimeError, match="round-off"):
+        lucas_lehmer_residue_ibdwt(4423, fft_length=64)
@@ -0,0 +1,89 @@
+from pathlib import Path
+
+import pytest
+
+from mathxlab.num.mersenne import lucas_lehmer_is_prime, lucas_lehmer_residue, mersenne_mod
+from mathxlab.num.mersenne_checkpoint import LltCheckpointer, LltState
+from mathxlab.num.primes import primes_up_to
+
+MERSENNE_EXPONENTS = {2, 3, 5, 7, 13, 17, 19, 31, 61, 89, 107, 127, 521, 607, 1279}
+
+
+def _reference_residue(p: int) -> int:
+    mp = (1 << p) - 1
+    s = 4
+    for _ in range(p - 2):
+        s = (s * s - 2) % mp
+    return s
+
+
+def test_lucas_lehmer_is_prime_matches_known_exponents() -> None:
+    for p in primes_up_to(1300).tolist():
+        assert lucas_lehmer_is_prime(p) == (p in MERSENNE_EXPONENTS), p
+
+
+@pytest.mark.parametrize("p", [3, 11, 23, 29, 37, 101, 1277])
+def test_lucas_lehmer_residue_matches_general_modulo(p: int) -> None:
+    assert lucas_lehmer_residue(p) == _reference_residue(p)
+
+
+@pytest.mark.parametrize("p", [5, 13, 64])
+def test_mersenne_mod_full_range(p: int) -> None:
+    mp = (1 << p) - 1
+    for x in [0, 1, mp - 1, mp, mp + 1, 2 * mp, mp * mp, (1 << (2 * p)) - 1, 12345678901234567]:
+        if x < 1 << (2 * p):
+            assert mersenne_mod(x, p) == x % mp
+
+
+def test_lucas_lehmer_residue_rejects_small_p() -> None:
+    with pytest.raises(ValueError):
+        lucas_lehmer_residue(1)
+
+
+def test_lucas_lehmer_backends_agree() -> None:
+    for p in [3, 127, 1277, 2203]:
+        assert lucas_lehmer_residue(p, backend="fft") == lucas_lehmer_residue(p, backend="int")
+    with pytest.raises(ValueError):
+        lucas_lehmer_residue(7, backend="gpu")
+
+
+def test_lucas_lehmer_resumes_from_checkpoint(tmp_path: Path) -> None:
+    p = 127
+    mp = (1 << p) - 1
+    s = 4
+    for _ in range(50):
+        s = (s * s - 2) % mp
+    ckpt = LltCheckpointer(directory=tmp_path, algorithm="t/1")
+    ckpt.save(LltState(p=p, iteration=50, s=s))
+    assert ckpt.load(p) == LltState(p=p, iteration=50, s=s)
+    assert lucas_lehmer_residue(p, checkpoint=ckpt) == 0
+    assert not ckpt.path(p).exists()
+
+    # A wrong saved state proves the test really continued from the checkpoint.
+    ckpt.save(LltState(p=p, iteration=50, s=s + 1))
+    assert lucas_lehmer_residue(p, checkpoint=ckpt) != 0
+
+
+@pytest.mark.parametrize("backend", ["int", "fft"])
+def test_lucas_lehmer_writes_checkpoints(tmp_path: Path, backend: str) -> None:
+    saved: list[LltState] = []
+
+    class Recorder(LltCheckpointer):
+        def save(self, state: LltState) -> None:
+            saved.append(state)
+            super().save(state)
+
+    ckpt = Recorder(directory=tmp_path, algorithm="t/1", interval=0.0)
+    assert lucas_lehmer_residue(89, backend=backend, checkpoint=ckpt) == 0
+    assert [st.iteration for st in saved] == list(range(1, 88))
+    assert saved[-1].s in (0, (1 << 89) - 1)
+
+
+def test_checkpoint_rejects_mismatched_or_corrupt_files(tmp_path: Path) -> None:
+    ckpt = LltCheckpointer(directory=tmp_path, algorithm="t/1")
+    ckpt.save(LltState(p=61, iteration=10, s=12345))
+    assert LltCheckpointer(directory=tmp_path, algorithm="t/2").load(61) is None
+    assert LltCheckpointer(directory=tmp_path, algorithm="t/1", resume=False).load(61) is None
+    raw = ckpt.path(61).read_bytes()
+    ckpt.path(61).write_bytes(raw[:-1] + bytes([raw[-1] ^ 1]))
+    assert ckpt.load(61) is None
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mathxlab.num.mersenne_pipeline import (
+    CostModel,
+    MersennePipeline,
+    dickman_rho,
+    plan_stages,
+    smooth_probability,
+)
+from mathxlab.num.mersenne_store import MersenneStore
+from mathxlab.num.primes import primes_up_to
+
+_MERSENNE_EXPONENTS = {2, 3, 5, 7, 13, 17, 19, 31, 61, 89, 107, 127, 521, 607}
+# Pretend big-int arithmetic is very slow so that both filters are worth running.
+_SLOW_LLT = CostModel(int_square_base=1e-3, int_square_coeff=1e-8, pm1_mul_ratio=1e-3)
+
+
+def test_dickman_rho_known_values() -> None:
+    got = dickman_rho(np.array([0.5, 1.0, 2.0, 3.0, 4.0]))
+    want = [1.0, 1.0, 1 - np.log(2.0), 0.0486083883, 0.0049109256]
+    assert got == pytest.approx(want, rel=5e-3)
+
+
+def test_smooth_probability_grows_with_bounds() -> None:
+    k = np.array([1e6, 1e9, 1e12])
+    p1 = smooth_probability(k, 1000, 1000)
+    p2 = smooth_probability(k, 1000, 100_000)
+    assert np.all(p2 >= p1)
+    assert np.all(np.diff(p1) < 0)
+    assert smooth_probability(np.array([500.0]), 1000, 1000)[0] == pytest.approx(1.0)
+
+
+def test_plan_depths_follow_llt_cost() -> None:
+    cost = CostModel()
+    assert plan_stages(31, cost).tf_bits == 0
+    bits = [plan_stages(p, cost).tf_bits for p in (4423, 10007, 44497, 86243)]
+    assert bits == sorted(bits)
+    assert bits[0] > 0
+    slow = plan_stages(10007, _SLOW_LLT)
+    assert slow.b1 > 0
+    assert slow.b2 >= slow.b1
+
+
+def test_pipeline_matches_llt_and_counts_stages() -> None:
+    ps = [int(p) for p in primes_up_to(700)]
+    pipe = MersennePipeline(cost=_SLOW_LLT, workers=1)
+    results = list(pipe.run(ps))
+    assert [r.p for r in results] == ps
+    assert {r.p for r in results if r.is_prime} == {p for p in ps if p in _MERSENNE_EXPONENTS}
+    for r in results:
+        if r.stage != "llt" and not r.is_prime:
+            assert r.factor is not None
+            assert 1 < r.factor < 2**r.p - 1
+            assert (2**r.p - 1) % r.factor == 0
+    st = pipe.stats
+    assert st["tf"].eliminated > 0
+    assert st["pm1"].tested > 0
+    assert sum(s.eliminated for s in st.values()) == len(ps)
+    assert st["llt"].tested == sum(r.stage == "llt" for r in results)
+    assert len(pipe.report_lines()) == 2 + len(st)
+
+
+def test_pipeline_store_answers_second_run(tmp_path: Path) -> None:
+    ps = [int(p) for p in primes_up_to(300)]
+    store = MersenneStore.in_dir(tmp_path)
+    first = list(MersennePipeline(cost=_SLOW_LLT, workers=1, store=store).run(ps))
+    pipe = MersennePipeline(cost=_SLOW_LLT, workers=1, store=store)
+    second = list(pipe.run(ps))
+    assert all(r.cached for r in second)
+    assert [(r.p, r.is_prime, r.stage) for r in second] == [
+        (r.p, r.is_prime, r.stage) for r in first
+    ]
+    assert sum(s.cached for s in pipe.stats.values()) == len(ps)
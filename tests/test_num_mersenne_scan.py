@@ -0,0 +1,28 @@
+import pytest
+
+from mathxlab.num.mersenne import lucas_lehmer_is_prime
+from mathxlab.num.mersenne_scan import plan_batches, scan_lucas_lehmer
+from mathxlab.num.primes import primes_up_to
+
+
+def test_plan_batches_largest_first_and_complete() -> None:
+    ps = [*primes_up_to(3000).tolist(), 44497]
+    batches = plan_batches(ps, workers=4)
+    flat = [p for b in batches for p in b]
+    assert flat == sorted(ps, reverse=True)
+    assert batches[0] == [44497]
+    assert len(batches[-1]) > 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan_lucas_lehmer_matches_serial_in_input_order(workers: int) -> None:
+    ps = [*primes_up_to(700).tolist()[::-1][::2], 2, 3]
+    results = list(scan_lucas_lehmer(ps, workers=workers))
+    assert [r.p for r in results] == ps
+    assert [r.is_prime for r in results] == [lucas_lehmer_is_prime(p) for p in ps]
+    assert all(r.seconds >= 0.0 for r in results)
+
+
+def test_scan_lucas_lehmer_rejects_zero_workers() -> None:
+    with pytest.raises(ValueError):
+        list(scan_lucas_lehmer([3, 5], workers=0))
@@ -0,0 +1,83 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from mathxlab.num.mersenne import LLT_ALGORITHM, lucas_lehmer_residue
+from mathxlab.num.mersenne_scan import scan_lucas_lehmer
+from mathxlab.num.mersenne_store import LltRecord, MersenneStore, Pm1Record, TfRecord
+
+
+def _write_range(path: Path, lo: int, hi: int) -> None:
+    store = MersenneStore(path=path)
+    for p in range(lo, hi):
+        store.put_llt(LltRecord(p=p, algorithm="test", residue=p, seconds=0.0))
+
+
+def test_store_roundtrip_and_tags(tmp_path: Path) -> None:
+    store = MersenneStore.in_dir(tmp_path / "cache")
+    residue = lucas_lehmer_residue(29)
+    store.put_llt(LltRecord(p=29, algorithm="a/1", residue=residue, seconds=0.5))
+    store.put_llt(LltRecord(p=31, algorithm="a/1", residue=0, seconds=0.25))
+
+    got = store.get_llt([29, 31, 37], algorithm="a/1")
+    assert got[29].residue == residue
+    assert not got[29].is_prime
+    assert got[31].is_prime
+    assert 37 not in got
+    assert store.get_llt([29], algorithm="a/2") == {}
+
+    [summary] = store.summary()
+    assert (summary.table, summary.count, summary.p_min, summary.p_max, summary.hits) == (
+        "llt",
+        2,
+        29,
+        31,
+        1,
+    )
+    assert store.clear(algorithm="a/2") == 0
+    assert store.clear() == 2
+    assert store.summary() == []
+
+
+def test_store_concurrent_writers(tmp_path: Path) -> None:
+    path = tmp_path / "m.sqlite3"
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_write_range, [path] * 4, [0, 50, 100, 150], [50, 100, 150, 200]))
+    assert len(MersenneStore(path=path).get_llt(range(200), algorithm="test")) == 200
+
+
+def test_scan_uses_store(tmp_path: Path) -> None:
+    store = MersenneStore.in_dir(tmp_path)
+    ps = [3, 5, 7, 11, 13]
+    first = list(scan_lucas_lehmer(ps, workers=1, store=store))
+    assert not any(r.cached for r in first)
+    assert set(store.get_llt(ps, algorithm=LLT_ALGORITHM)) == set(ps)
+
+    second = list(scan_lucas_lehmer([*ps, 17], workers=2, store=store))
+    assert [r.cached for r in second] == [True] * 5 + [False]
+    assert [r.is_prime for r in second] == [True, True, True, False, True, True]
+
+
+def test_store_tf_progress(tmp_path: Path) -> None:
+    store = MersenneStore.in_dir(tmp_path)
+    store.put_tf(TfRecord(p=67, algorithm="tf/1", k_searched=10, factor=None))
+    store.put_tf(TfRecord(p=101, algorithm="tf/1", k_searched=50, factor=(1 << 70) + 1))
+    got = store.get_tf([67, 101], algorithm="tf/1")
+    assert got[67].factor is None
+    assert got[101].factor == (1 << 70) + 1
+    assert [s.table for s in store.summary()] == ["tf"]
+    assert store.clear(table="llt") == 0
+    assert store.clear(table="tf") == 2
+
+
+def test_store_pm1_outcomes(tmp_path: Path) -> None:
+    store = MersenneStore.in_dir(tmp_path)
+    store.put_pm1(Pm1Record(p=67, algorithm="pm1/1", b1=100, b2=3000, factor=193707721, stage=2))
+    store.put_pm1(Pm1Record(p=71, algorithm="pm1/1", b1=100, b2=100, factor=None, stage=0))
+    got = store.get_pm1([67, 71, 73], algorithm="pm1/1")
+    assert got[67].factor == 193707721
+    assert (got[71].b1, got[71].b2, got[71].factor) == (100, 100, None)
+    assert 73 not in got
+    [s] = store.summary()
+    assert (s.table, s.count, s.hits) == ("pm1", 2, 1)
+    assert store.clear(table="pm1", algorithm="other") == 0
+    assert store.clear() == 2
@@ -0,0 +1,27 @@
+import random
+
+import numpy as np
+import pytest
+
+from mathxlab.num.modarith import pow2_mod
+
+
+def test_pow2_mod_matches_builtin_pow() -> None:
+    rng = random.Random(11)
+    q = np.array([2, 3, 4, 5, (1 << 32) - 1, (1 << 32) - 5, *rng.sample(range(2, 1 << 32), 200)])
+    for e in [0, 1, 2, 31, 32, 64, 127, 9973, rng.randrange(1 << 60)]:
+        assert pow2_mod(e, q).tolist() == [pow(2, e, int(m)) for m in q]
+
+
+def test_pow2_mod_finds_known_mersenne_factors() -> None:
+    # 23 | M_11, 47 | M_23, 233 | M_29, 223 | M_37
+    for p, f in [(11, 23), (23, 47), (29, 233), (37, 223)]:
+        q = np.array([f, f + 2 * p], dtype=np.int64)
+        assert pow2_mod(p, q).tolist()[0] == 1
+
+
+def test_pow2_mod_rejects_large_moduli() -> None:
+    with pytest.raises(ValueError):
+        pow2_mod(5, np.array([1 << 50], dtype=np.int64))
+    with pytest.raises(ValueError):
+        pow2_mod(-1, np.array([7]))
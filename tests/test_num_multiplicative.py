@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+import sympy
+
+from mathxlab.num.multiplicative import (
+    iter_multiplicative_blocks,
+    iter_sigma_blocks,
+    multiplicative_sieve,
+    sigma_sieve,
+    sigma_window,
+)
+
+
+def _divisors(n: int) -> list[int]:
+    return [d for d in range(1, n + 1) if n % d == 0]
+
+
+def test_sigma_sieve_matches_divisor_sum() -> None:
+    n_max = 2_000
+    sigma = np.zeros(n_max + 1, dtype=np.int64)
+    for d in range(1, n_max + 1):
+        sigma[d::d] += d
+    assert np.array_equal(sigma_sieve(n_max), sigma)
+
+
+def test_sigma_sieve_perfect_numbers() -> None:
+    sigma = sigma_sieve(10_000)
+    n = np.arange(sigma.size, dtype=np.int64)
+    perfect = np.flatnonzero((sigma == 2 * n) & (n > 0))
+    assert perfect.tolist() == [6, 28, 496, 8128]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 37, 1 << 20])
+def test_multiplicative_sieve_all_functions(chunk_size: int) -> None:
+    n_max = 500
+    r = multiplicative_sieve(n_max, ("sigma", "sigma_2", "tau", "phi", "mu"), chunk_size=chunk_size)
+    for n in range(1, n_max + 1):
+        divs = _divisors(n)
+        assert r["sigma"][n] == sum(divs)
+        assert r["sigma_2"][n] == sum(d * d for d in divs)
+        assert r["tau"][n] == len(divs)
+        assert r["phi"][n] == sympy.totient(n)
+        assert r["mu"][n] == sympy.mobius(n)
+    assert r["mu"].dtype == np.int8
+    assert all(arr[0] == 0 for arr in r.values())
+
+
+def test_multiplicative_sieve_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="n_max must be >= 1"):
+        multiplicative_sieve(0)
+    with pytest.raises(ValueError, match="Unknown multiplicative function"):
+        multiplicative_sieve(10, ("omega",))
+
+
+def test_multiplicative_sieve_rejects_int64_overflow() -> None:
+    # σ_3(2^21) = (2^66 - 1) / 7 > 2^63 would wrap silently.
+    with pytest.raises(ValueError, match=r"sigma_3.*overflow"):
+        multiplicative_sieve(1 << 21, ("sigma_3",))
+    with pytest.raises(ValueError, match=r"sigma_20.*overflow"):
+        next(iter_multiplicative_blocks(10, 12, ("sigma_20",)))
+    r = multiplicative_sieve(1 << 20, ("sigma_3",), chunk_size=1 << 16)
+    assert r["sigma_3"][1 << 20] == sum(2 ** (3 * j) for j in range(21))
+
+
+def test_sigma_window_matches_full_sieve() -> None:
+    full = sigma_sieve(20_000)
+    assert np.array_equal(sigma_window(15_000, 5_001), full[15_000:])
+
+
+@pytest.mark.parametrize("block_size", [7, 100, 1 << 20])
+def test_iter_sigma_blocks_covers_range(block_size: int) -> None:
+    full = sigma_sieve(3_000)
+    starts = []
+    blocks = []
+    for start, block in iter_sigma_blocks(1_000, 3_001, block_size=block_size):
+        starts.append(start)
+        blocks.append(block)
+    assert starts[0] == 1_000
+    assert all(b.size <= block_size for b in blocks)
+    assert np.array_equal(np.concatenate(blocks), full[1_000:])
+
+
+def test_iter_multiplicative_blocks_large_window() -> None:
+    start = 10**12 - 50
+    for lo, values in iter_multiplicative_blocks(
+        start, start + 100, ("sigma", "mu"), block_size=40
+    ):
+        for i in range(values["sigma"].size):
+            assert values["sigma"][i] == sympy.divisor_sigma(lo + i)
+            assert values["mu"][i] == sympy.mobius(lo + i)
+
+
+def test_iter_multiplicative_blocks_invalid_start() -> None:
+    with pytest.raises(ValueError, match="start must be >= 1"):
+        list(iter_sigma_blocks(0, 10))
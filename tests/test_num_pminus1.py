@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import pytest
+
+from mathxlab.num import pminus1 as pminus1_module
+from mathxlab.num.mersenne_store import MersenneStore
+from mathxlab.num.pminus1 import PM1_ALGORITHM, cached_pminus1, pminus1
+from mathxlab.num.primes import primes_up_to
+
+
+def test_stage1_finds_smooth_factor() -> None:
+    # 13367 - 1 = 2·41·163
+    res = pminus1(41, b1=200)
+    assert res.factor == 13367
+    assert res.stage == 1
+    assert res.b2 == 200
+
+
+def test_stage2_finds_factor_with_one_large_prime() -> None:
+    # 193707721 - 1 = 2^3·3^3·5·67·2677; 761838257287 needs 8539 > b2
+    res = pminus1(67, b1=100, b2=3000)
+    assert res.factor == 193707721
+    assert res.stage == 2
+    assert pminus1(67, b1=100).factor is None
+
+
+def test_stage2_with_shared_prime_table() -> None:
+    # 228479 - 1 = 2·71·1609
+    table = primes_up_to(2000)
+    res = pminus1(71, b1=100, b2=2000, primes=table)
+    assert res.factor == 228479
+    assert res.stage == 2
+
+
+def test_all_factors_caught_at_once_are_split() -> None:
+    # Every factor of M_29 (233, 1103, 2089) is caught by b1 = 20; the gcd alone would be M_29.
+    res = pminus1(29, b1=20)
+    assert res.factor is not None
+    assert 1 < res.factor < 2**29 - 1
+    assert (2**29 - 1) % res.factor == 0
+    # 23 - 1 = 2·11 and 89 - 1 = 8·11: with b1 = 4 both appear, the 2p step already splits 23.
+    assert pminus1(11, b1=4).factor == 23
+
+
+def test_stage2_without_factor_runs_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[bool] = []
+    stage2 = pminus1_module._stage2
+
+    def spy(x: int, p: int, mp: int, primes: list[int], b1: int, b2: int, *, fine: bool) -> int:
+        calls.append(fine)
+        return stage2(x, p, mp, primes, b1, b2, fine=fine)
+
+    monkeypatch.setattr(pminus1_module, "_stage2", spy)
+    assert pminus1(61, b1=100, b2=3000).factor is None
+    assert calls == [False]
+
+
+@pytest.mark.parametrize("p", [31, 61, 89, 107])
+def test_mersenne_primes_have_no_factor(p: int) -> None:
+    res = pminus1(p, b1=500, b2=5000)
+    assert res.factor is None
+    assert res.stage == 0
+
+
+def test_found_factors_divide() -> None:
+    table = primes_up_to(1000)
+    for p in [int(r) for r in primes_up_to(150) if r > 11]:
+        res = pminus1(p, b1=50, b2=1000, primes=table)
+        if res.factor is not None:
+            assert 1 < res.factor < 2**p - 1
+            assert (2**p - 1) % res.factor == 0
+
+
+def test_rejects_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        pminus1(2, b1=10)
+    with pytest.raises(ValueError):
+        pminus1(31, b1=1)
+    with pytest.raises(ValueError):
+        pminus1(31, b1=100, b2=10_000, primes=primes_up_to(1000))
+
+
+def test_cached_pminus1_reuses_covering_bounds(tmp_path: Path) -> None:
+    store = MersenneStore.in_dir(tmp_path)
+    assert cached_pminus1(67, b1=100, store=store).factor is None
+    # Smaller bounds are answered from the store; larger ones run again and find the factor.
+    assert cached_pminus1(67, b1=50, store=store).b1 == 100
+    res = cached_pminus1(67, b1=100, b2=3000, store=store)
+    assert (res.factor, res.stage) == (193707721, 2)
+    [rec] = store.get_pm1([67], algorithm=PM1_ALGORITHM).values()
+    assert (rec.b2, rec.factor, rec.stage) == (3000, 193707721, 2)
+    assert cached_pminus1(67, b1=10, store=store).factor == 193707721
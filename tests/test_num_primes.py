@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from mathxlab.num.primes import iter_prime_blocks, prime_mask_up_to, primes_in_range, primes_up_to
+
+
+def _reference_primes(n: int) -> np.ndarray:
+    sieve = np.ones(n + 1, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, int(n**0.5) + 1):
+        if sieve[p]:
+            sieve[p * p :: p] = False
+    return np.flatnonzero(sieve)
+
+
+def test_primes_up_to_small() -> None:
+    assert primes_up_to(1).tolist() == []
+    assert primes_up_to(2).tolist() == [2]
+    assert primes_up_to(30).tolist() == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+
+def test_primes_up_to_matches_reference() -> None:
+    n = 200_000
+    assert np.array_equal(primes_up_to(n), _reference_primes(n))
+
+
+@pytest.mark.parametrize("segment_size", [1, 3, 64, 1000])
+def test_iter_prime_blocks_segment_sizes(segment_size: int) -> None:
+    blocks = list(iter_prime_blocks(2, 10_001, segment_size=segment_size))
+    assert all(b.size > 0 for b in blocks)
+    assert np.array_equal(np.concatenate(blocks), _reference_primes(10_000))
+
+
+def test_primes_in_range_window() -> None:
+    lo, hi = 999_000, 1_001_000
+    ref = _reference_primes(hi - 1)
+    assert np.array_equal(primes_in_range(lo, hi), ref[ref >= lo])
+    assert primes_in_range(24, 29).size == 0
+
+
+def test_prime_mask_up_to() -> None:
+    mask = prime_mask_up_to(100)
+    assert mask.size == 101
+    assert np.array_equal(np.flatnonzero(mask), _reference_primes(100))
+
+
+def test_iter_prime_blocks_invalid_segment_size() -> None:
+    with pytest.raises(ValueError, match="segment_size must be >= 1"):
+        list(iter_prime_blocks(2, 100, segment_size=0))
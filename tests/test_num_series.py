@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from mathxlab.num.series import taylor_sin
+from mathxlab.num.series import SeriesWorkspace, horner, taylor_sin, taylor_sin_partial_sums
 
 
 def test_taylor_sin_degree_zero() -> None:
@@ -47,3 +47,59 @@ def test_taylor_sin_high_degree() -> None:
     # High degree should be very close to sin(x) for small x
     y = taylor_sin(x, x0=0.0, degree=10)
     assert np.allclose(y, np.sin(x))
+
+
+def test_taylor_sin_partial_sums_match_single_degrees() -> None:
+    x = np.linspace(-3.0, 3.0, 50)
+    degrees = (9, 0, 1, 4, 3, 9)
+    out = taylor_sin_partial_sums(x, 0.5, degrees)
+    assert out.shape == (len(degrees), x.size)
+    for row, d in zip(out, degrees, strict=True):
+        assert np.allclose(row, taylor_sin(x, x0=0.5, degree=d))
+    # Even degrees add nothing to sin: T_4 == T_3.
+    assert np.array_equal(out[3], out[4])
+    with pytest.raises(ValueError, match="degree must be >= 0"):
+        taylor_sin_partial_sums(x, 0.0, (3, -1))
+
+
+def test_taylor_sin_scalar_and_nd_input() -> None:
+    assert taylor_sin(0.5, 0.0, 5) == pytest.approx(0.5 - 0.5**3 / 6 + 0.5**5 / 120)
+    assert taylor_sin(0.5, 0.0, 5).shape == ()
+    x = np.linspace(-2.0, 2.0, 12).reshape(3, 4)
+    y = taylor_sin(x, x0=0.3, degree=9)
+    assert y.shape == (3, 4)
+    assert np.array_equal(y.ravel(), taylor_sin(x.ravel(), x0=0.3, degree=9))
+    out = np.empty((4, 3)).T  # non-contiguous
+    assert taylor_sin(x, x0=0.3, degree=9, out=out) is out
+    assert np.array_equal(out, y)
+    with pytest.raises(ValueError, match="1D"):
+        taylor_sin_partial_sums(x, 0.0, (1,))
+
+
+def test_out_and_workspace_across_chunks() -> None:
+    x = np.linspace(-4.0, 4.0, 1001)
+    ws = SeriesWorkspace.allocate(64)
+    out = np.full((3, x.size), np.nan)
+    res = taylor_sin_partial_sums(x, 1.0, (0, 7, 12), out=out, workspace=ws)
+    assert res is out
+    expected = taylor_sin_partial_sums(x, 1.0, (0, 7, 12))
+    assert np.allclose(out, expected, rtol=1e-14, atol=0.0)
+    y = np.empty(x.size)
+    assert taylor_sin(x, x0=1.0, degree=7, out=y, workspace=ws) is y
+    assert np.allclose(y, expected[1], rtol=1e-14, atol=0.0)
+    with pytest.raises(ValueError, match="out must be"):
+        taylor_sin_partial_sums(x, 1.0, (1, 3), out=np.empty((3, x.size)))
+    with pytest.raises(ValueError):
+        SeriesWorkspace.allocate(0)
+
+
+def test_horner_matches_direct_polynomial() -> None:
+    x = np.linspace(-2.0, 2.0, 301)
+    c = np.array([1.0, 2.0, -3.0, 0.5])
+    d = x - 0.3
+    out = np.empty(x.size)
+    res = horner(c, x, 0.3, out=out, workspace=SeriesWorkspace.allocate(32))
+    assert res is out
+    np.testing.assert_allclose(out, 1 + 2 * d - 3 * d**2 + 0.5 * d**3, rtol=1e-13, atol=1e-13)
+    with pytest.raises(ValueError):
+        horner(np.array([]), x, 0.0)
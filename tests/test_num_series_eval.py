@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from mathxlab.num.series import taylor_sin_partial_sums
+from mathxlab.num.series_eval import DEFAULT_LOG10_EDGES, ErrorStats, taylor_sin_error_stats
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_stats_match_dense_evaluation(workers: int) -> None:
+    x = np.linspace(-5.0, 5.0, 20_011)
+    degrees = (1, 7, 21)
+    err = np.abs(taylor_sin_partial_sums(x, 0.5, degrees) - np.sin(x))
+    st = taylor_sin_error_stats(-5.0, 5.0, x.size, 0.5, degrees, block_size=1000, workers=workers)
+    assert st.count == x.size
+    np.testing.assert_allclose(st.max_abs, err.max(axis=1), rtol=1e-12)
+    np.testing.assert_allclose(st.argmax_x, x[err.argmax(axis=1)], rtol=1e-12)
+    np.testing.assert_allclose(st.mean_abs, err.mean(axis=1), rtol=1e-10)
+    with np.errstate(divide="ignore"):
+        for hist, row in zip(st.histograms, err, strict=True):
+            expected, _ = np.histogram(np.log10(row), bins=DEFAULT_LOG10_EDGES)
+            np.testing.assert_array_equal(hist.counts, expected)
+
+
+def test_single_point_and_errors() -> None:
+    st = taylor_sin_error_stats(0.0, 1.0, 1, 0.0, (1,))
+    assert st.count == 1
+    assert st.max_abs.tolist() == [0.0]
+    assert st.histograms[0].underflow == 1
+    with pytest.raises(ValueError):
+        taylor_sin_error_stats(0.0, 1.0, 0, 0.0, (1,))
+    with pytest.raises(ValueError):
+        ErrorStats(degrees=(1,)).merge(ErrorStats(degrees=(3,)))
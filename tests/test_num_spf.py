@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+import sympy
+
+from mathxlab.num.spf import SpfTable
+
+
+def _brute_spf(n_max: int) -> np.ndarray:
+    spf = np.zeros(n_max + 1, dtype=np.int64)
+    for n in range(2, n_max + 1):
+        spf[n] = min(sympy.primefactors(n))
+    return spf
+
+
+@pytest.mark.parametrize("segment_size", [7, 64, 1 << 18])
+def test_spf_matches_brute_force(segment_size: int) -> None:
+    n_max = 5000
+    table = SpfTable.build(n_max, segment_size=segment_size)
+    n = np.arange(2, n_max + 1)
+    np.testing.assert_array_equal(table.spf(n), _brute_spf(n_max)[2:])
+
+
+def test_compact_storage() -> None:
+    table = SpfTable.build(1_000_001)
+    assert table.codes.dtype == np.uint16
+    assert table.codes.size == 500_001
+    assert table.nbytes < 1_000_001 * 4 // 3
+
+
+def test_factorize() -> None:
+    table = SpfTable.build(100_000)
+    for n in [1, 2, 64, 97, 99_991, 3**4 * 5**2 * 7, 2**3 * 3 * 4111]:
+        assert table.factorize(n) == sympy.factorint(n)
+
+
+def test_small_and_invalid_bounds() -> None:
+    assert SpfTable.build(2).spf(np.array([2])).tolist() == [2]
+    table = SpfTable.build(30)
+    assert table.spf(np.array([9, 15, 25, 29])).tolist() == [3, 3, 5, 29]
+    with pytest.raises(ValueError):
+        table.spf(np.array([31]))
+    with pytest.raises(ValueError):
+        table.factorize(0)
+    with pytest.raises(ValueError):
+        SpfTable.build(0)
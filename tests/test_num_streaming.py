@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from mathxlab.num.streaming import StreamingHistogram, TopK
+
+
+def test_streaming_histogram_matches_numpy() -> None:
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=10_000)
+    hist = StreamingHistogram.uniform(-3.0, 3.0, 40)
+    for block in np.array_split(values, 7):
+        hist.update(block)
+
+    in_range = values[(values >= -3.0) & (values <= 3.0)]
+    expected, _ = np.histogram(in_range, bins=40, range=(-3.0, 3.0))
+    assert np.array_equal(hist.counts, expected)
+    assert hist.underflow == int(np.count_nonzero(values < -3.0))
+    assert hist.overflow == int(np.count_nonzero(values > 3.0))
+    assert hist.total == values.size
+
+
+def test_streaming_histogram_custom_edges() -> None:
+    hist = StreamingHistogram(edges=np.array([0.0, 1.0, 10.0, 100.0]))
+    hist.update(np.array([0.5, 5.0, 50.0, 100.0, 1000.0, np.nan]))
+    assert hist.counts.tolist() == [1, 1, 2]
+    assert hist.overflow == 1
+
+
+def test_streaming_histogram_merge() -> None:
+    a = StreamingHistogram.uniform(0.0, 1.0, 4)
+    b = StreamingHistogram.uniform(0.0, 1.0, 4)
+    a.update(np.array([0.1, 0.9]))
+    b.update(np.array([0.1, -1.0]))
+    a.merge(b)
+    assert a.counts.tolist() == [2, 0, 0, 1]
+    assert a.underflow == 1
+
+    with pytest.raises(ValueError, match="different bin edges"):
+        a.merge(StreamingHistogram.uniform(0.0, 2.0, 4))
+
+
+def _reference_topk(keys: np.ndarray, n: np.ndarray, k: int) -> np.ndarray:
+    return n[np.lexsort((n, keys))[:k]]
+
+
+def test_topk_blocks_match_global_selection() -> None:
+    rng = np.random.default_rng(1)
+    keys = rng.integers(0, 50, size=10_000)
+    n = np.arange(10_000, dtype=np.int64)
+
+    top = TopK(k=25, columns=("n",))
+    for kb, nb in zip(np.array_split(keys, 13), np.array_split(n, 13), strict=True):
+        top.update(kb, n=nb)
+
+    assert np.array_equal(top.values["n"], _reference_topk(keys, n, 25))
+    assert np.all(np.diff(top.keys) >= 0)
+
+
+def test_topk_merge_is_split_independent() -> None:
+    rng = np.random.default_rng(2)
+    keys = rng.integers(0, 1_000, size=5_000)
+    n = np.arange(5_000, dtype=np.int64)
+    sigma = 2 * n + keys
+
+    a = TopK(k=10, columns=("n", "sigma"))
+    b = TopK(k=10, columns=("n", "sigma"))
+    a.update(keys[:1_234], n=n[:1_234], sigma=sigma[:1_234])
+    b.update(keys[1_234:], n=n[1_234:], sigma=sigma[1_234:])
+    a.merge(b)
+
+    assert np.array_equal(a.values["n"], _reference_topk(keys, n, 10))
+    assert np.array_equal(a.values["sigma"] - 2 * a.values["n"], a.keys)
+
+
+def test_topk_invalid_usage() -> None:
+    with pytest.raises(ValueError, match="k must be >= 1"):
+        TopK(k=0, columns=("n",))
+    top = TopK(k=3, columns=("n",))
+    with pytest.raises(ValueError, match="expected payload columns"):
+        top.update(np.array([1]), m=np.array([1]))
+    with pytest.raises(ValueError, match="cannot merge"):
+        top.merge(TopK(k=4, columns=("n",)))
@@ -0,0 +1,67 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+import sympy
+
+from mathxlab.num.series import horner
+from mathxlab.num.taylor_coeffs import CoefficientCache, cache_key, taylor_coefficients
+
+
+def _reference(expr: str, x0: float, degree: int) -> np.ndarray:
+    x, h = sympy.symbols("x h")
+    f = sympy.sympify(expr).subs(x, sympy.Rational(x0) + h)
+    poly = sympy.Poly(sympy.series(f, h, 0, degree + 1).removeO(), h)
+    return np.array([float(sympy.N(poly.coeff_monomial(h**k), 30)) for k in range(degree + 1)])
+
+
+@pytest.mark.parametrize(
+    ("expr", "x0", "degree"),
+    [
+        ("sin(x)", 1.0, 9),
+        ("tan(x) * cosh(x)", 0.3, 7),
+        ("atan(x**2 + 1)", 0.25, 6),
+        ("x**x", 1.5, 3),
+        ("(1 + x)**(1/3) + log(2 + x)", 0.5, 5),
+        ("besselj(0, x)", 0.0, 6),
+    ],
+)
+def test_coefficients_match_sympy_series(expr: str, x0: float, degree: int) -> None:
+    np.testing.assert_allclose(
+        taylor_coefficients(expr, x0, degree), _reference(expr, x0, degree), rtol=1e-14
+    )
+
+
+def test_horner_evaluates_expansion() -> None:
+    c = taylor_coefficients("exp(sin(x)) / (1 + x**2)", 0.5, 30)
+    x = np.linspace(0.2, 0.8, 101)
+    np.testing.assert_allclose(
+        horner(c, x, 0.5), np.exp(np.sin(x)) / (1 + x**2), rtol=1e-12, atol=0.0
+    )
+    assert taylor_coefficients("exp(x)", "pi/4", 0)[0] == pytest.approx(math.exp(math.pi / 4))
+
+
+def test_disk_cache(tmp_path: Path) -> None:
+    cache = CoefficientCache(tmp_path)
+    first = taylor_coefficients("cos(x)**2", 0.25, 8, cache=cache)
+    key = cache_key("cos(x)**2", 0.25, 8)
+    assert cache.path(key).exists()
+    np.testing.assert_array_equal(cache.load(key), first)
+    # A hit is served from disk, whatever the file says.
+    cache.save(key, np.arange(9.0), description="planted")
+    np.testing.assert_array_equal(
+        taylor_coefficients("cos(x)**2", 0.25, 8, cache=cache), np.arange(9.0)
+    )
+    assert cache_key("cos(x)**2", 0.25, 9) != key
+    cache.path(key).write_text("not json", encoding="utf-8")
+    assert cache.load(key) is None
+
+
+@pytest.mark.parametrize(
+    ("expr", "x0"),
+    [("log(x)", 0.0), ("sqrt(x)", 0.0), ("1/x", 0.0), ("log(x)", -1.0), ("x*y", 0.0)],
+)
+def test_invalid_inputs(expr: str, x0: float) -> None:
+    with pytest.raises(ValueError):
+        taylor_coefficients(expr, x0, 3)
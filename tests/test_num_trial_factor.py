@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mathxlab.num.mersenne_store import MersenneStore
+from mathxlab.num.primes import primes_up_to
+from mathxlab.num.trial_factor import (
+    CLASS_MODULUS,
+    TF_ALGORITHM,
+    candidate_classes,
+    extend_trial_factor,
+    trial_factor,
+)
+
+
+def _brute_force_factor(p: int, q_max: int) -> int | None:
+    for q in range(2 * p + 1, q_max + 1, 2 * p):
+        if pow(2, p, q) == 1:
+            return q
+    return None
+
+
+def test_candidate_classes_count_and_congruences() -> None:
+    for p in [3, 5, 7, 11, 13, 10007]:
+        c = candidate_classes(p)
+        q = 2 * p * c + 1
+        assert np.all((q % 8 == 1) | (q % 8 == 7))
+        assert all(np.all(q % r != 0) for r in (3, 5, 7, 11))
+        assert c.max() < CLASS_MODULUS
+    # For p > 11 exactly 2 of 4 residues mod 4 and (r-1) of r residues mod r = 3, 5, 7, 11 remain.
+    assert candidate_classes(13).size == candidate_classes(10007).size == 960
+
+
+@pytest.mark.parametrize("band_columns", [1, 7, 1024])
+def test_trial_factor_matches_brute_force(band_columns: int) -> None:
+    for p in primes_up_to(400)[1:].tolist():
+        got = trial_factor(p, q_max=300_000, band_columns=band_columns)
+        assert got.factor == _brute_force_factor(p, 300_000), p
+
+
+@pytest.mark.parametrize("q_max", [10, 50, 1000])
+def test_trial_factor_small_q_max(q_max: int) -> None:
+    # Factors below the sieve limit but above √q_max, e.g. 7 | M_3 with q_max = 10.
+    for p in primes_up_to(100)[1:].tolist():
+        assert trial_factor(p, q_max=q_max).factor == _brute_force_factor(p, q_max), p
+
+
+def test_trial_factor_resumes_from_k_start_and_handles_large_q() -> None:
+    # M_67 = 193707721 * 761838257287; the second factor is above 2^32.
+    first = trial_factor(67, q_max=1 << 30)
+    assert first.factor == 193707721
+    k2 = (761838257287 - 1) // 134
+    second = trial_factor(67, q_max=1 << 40, k_start=k2 - 5000)
+    assert second.factor == 761838257287
+    assert second.k_searched >= k2
+
+
+def test_trial_factor_reports_searched_range() -> None:
+    res = trial_factor(61, q_max=10_000_000)  # M_61 is prime
+    assert res.factor is None
+    assert res.k_searched == (10_000_000 - 1) // 122
+    assert res.candidates > 0
+    with pytest.raises(ValueError):
+        trial_factor(2, q_max=100)
+
+
+def test_extend_trial_factor_resumes_from_store(tmp_path: Path) -> None:
+    store = MersenneStore.in_dir(tmp_path)
+    # M_47 = 2351 * 4513 * 13264529; M_61 is prime.
+    assert extend_trial_factor(47, q_max=2000, store=store).factor is None
+    assert store.get_tf([47], algorithm=TF_ALGORITHM)[47].k_searched == 1999 // 94
+
+    res = extend_trial_factor(47, q_max=100_000, store=store)
+    assert res.factor == 2351
+    assert extend_trial_factor(47, q_max=2000, store=store).factor is None
+    again = extend_trial_factor(47, q_max=10**9, store=store)
+    assert (again.factor, again.candidates) == (2351, 0)
+
+    extend_trial_factor(61, q_max=1_000_000, store=store)
+    deeper = extend_trial_factor(61, q_max=3_000_000, store=store)
+    fresh = trial_factor(61, q_max=3_000_000)
+    assert deeper.factor is None
+    assert deeper.k_searched == fresh.k_searched
+    assert 0 < deeper.candidates < fresh.candidates